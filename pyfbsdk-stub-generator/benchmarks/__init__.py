@@ -0,0 +1,6 @@
+"""
+Benchmarks for the stub generator, run them from the pyfbsdk-stub-generator folder, e.g:
+```
+python -m benchmarks.benchmark_parser --help
+```
+"""
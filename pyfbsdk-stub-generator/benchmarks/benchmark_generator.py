@@ -0,0 +1,155 @@
+"""
+Benchmark the generator on a synthetic pyfbsdk module at different scales, see `synthetic_module.py`.
+
+Every stage is timed: the native introspection, each plugin, sorting the classes & rendering the stub file.
+The throughput is reported along with how the time of each stage grows with the size of the module,
+stages that grow faster than the module are marked so quadratic regressions are caught early.
+
+Each scale runs in a separate interpreter, since the generator & the plugins keep references to the pyfbsdk
+module they were imported with. The online documentation plugin is not included, see `benchmark_parser.py`.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+
+ROOT_DIRECTORY = Path(__file__).parent.parent
+
+# Stages growing faster than this exponent of the module size are reported as superlinear
+SUPERLINEAR_EXPONENT = 1.3
+
+# Stages faster than this are too noisy to estimate how they scale
+MIN_STAGE_TIME = 0.005
+
+EXCLUDED_PLUGINS = {"PluginOnlineDocumentation"}
+
+
+def get_node_count(counters: dict[str, int]) -> int:
+    """ The number of enums, classes, functions & properties in the module """
+    return sum(counters.get(x, 0) for x in ("enums", "classes", "function_groups", "methods", "properties"))
+
+
+def run_scale(scale: float, seed: int, repeat: int, fuse_plugins: bool = False) -> dict:
+    """ Generate the stubs for a synthetic module of the given scale, must run in a new interpreter """
+    from . import synthetic_module
+
+    start_time = time.perf_counter()
+    module = synthetic_module.install_synthetic_module(scale, seed)
+    build_time = time.perf_counter() - start_time
+
+    # pyfbsdk must be installed before the generator is imported
+    from src import stub_generator
+    from src.flags import GeneratorFlag
+    from src.profiling import ModuleProfile
+
+    plugins = [x for x in stub_generator.DEFAULT_PLUGINS if x.__name__ not in EXCLUDED_PLUGINS]
+    flags = GeneratorFlag.FUSE_PLUGINS if fuse_plugins else GeneratorFlag.NONE
+
+    stages: dict[str, float] = {}
+    profile = ModuleProfile(module.__name__)
+    output = ""
+    for _ in range(repeat):
+        profile = ModuleProfile(module.__name__)
+        generator = stub_generator.StubGenerator(module, flags, plugins=plugins, version=synthetic_module.VERSION, profile=profile)
+
+        # Keep the output of the plugins away from the results
+        with contextlib.redirect_stdout(sys.stderr):
+            output = generator.generate_string()
+
+        for name, elapsed_time in profile.stages.items():
+            stages[name] = min(stages.get(name, math.inf), elapsed_time)
+
+    return {
+        "scale": scale,
+        "build_time": build_time,
+        "counters": profile.counters,
+        "stages": stages,
+        "output_size": len(output),
+    }
+
+
+def run_scale_subprocess(scale: float, seed: int, repeat: int, fuse_plugins: bool = False) -> dict:
+    command = [sys.executable, "-m", "benchmarks.benchmark_generator", "--worker", str(scale), "--seed", str(seed), "--repeat", str(repeat)]
+    if fuse_plugins:
+        command.append("--fuse-plugins")
+    process = subprocess.run(command, cwd=ROOT_DIRECTORY, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"Benchmark of scale {scale} failed:\n{process.stderr}")
+    return json.loads(process.stdout)
+
+
+def get_scaling_exponent(first: dict, last: dict, stage: str) -> float | None:
+    """
+    Estimate how the time of a stage grows with the size of the module, time ~ size ^ exponent.
+    1.0 is linear, 2.0 is quadratic.
+    """
+    first_time, last_time = first["stages"].get(stage), last["stages"].get(stage)
+    first_size, last_size = get_node_count(first["counters"]), get_node_count(last["counters"])
+    if not first_time or not last_time or last_size <= first_size or max(first_time, last_time) < MIN_STAGE_TIME:
+        return None
+    return math.log(last_time / first_time) / math.log(last_size / first_size)
+
+
+def print_results(results: list[dict]):
+    print(f"{'Scale':>6} {'Classes':>8} {'Nodes':>9} {'Output':>9} {'Total':>9} {'Nodes/s':>10}")
+    for result in results:
+        node_count = get_node_count(result["counters"])
+        total_time = sum(result["stages"].values())
+        print(f"{result['scale']:>5g}x {result['counters']['classes']:>8} {node_count:>9} "
+              f"{result['output_size'] / 1_000_000:>7.1f}MB {total_time:>8.3f}s {node_count / total_time:>10.0f}")
+
+    stage_names = list(results[0]["stages"])
+    header = "".join(f"{result['scale']:>9g}x" for result in results)
+    print(f"\n{'Stage':<36}{header}  Exponent")
+    for stage in stage_names:
+        times = "".join(f"{result['stages'].get(stage, 0.0):>9.3f}s" for result in results)
+
+        exponent = get_scaling_exponent(results[0], results[-1], stage) if len(results) > 1 else None
+        exponent_text = "       -" if exponent is None else f"{exponent:>8.2f}"
+        if exponent is not None and exponent > SUPERLINEAR_EXPONENT:
+            exponent_text += "  superlinear"
+
+        print(f"{stage:<36}{times}  {exponent_text}")
+
+    print(f"\nMicroseconds per node:")
+    for stage in stage_names:
+        per_node = "".join(f"{result['stages'].get(stage, 0.0) / get_node_count(result['counters']) * 1_000_000:>10.2f}" for result in results)
+        print(f"{stage:<36}{per_node}")
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument("--scales", type=float, nargs="+", default=[1, 5, 20], help="Size of the synthetic modules, relative to pyfbsdk in MotionBuilder 2027")
+    argparser.add_argument("--seed", type=int, default=0, help="Seed for the content of the synthetic modules")
+    argparser.add_argument("--repeat", type=int, default=3, help="Number of times to generate the stubs for each scale, the best time of each stage is reported")
+    argparser.add_argument("--fuse-plugins", action="store_true", help="Run plugins with the same priority in a single pass")
+    argparser.add_argument("--output", help="Write the results to this JSON file")
+    argparser.add_argument("--worker", type=float, help=argparse.SUPPRESS)  # Run a single scale & print the result as JSON
+    args = argparser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_scale(args.worker, args.seed, args.repeat, args.fuse_plugins)))
+        return
+
+    results: list[dict] = []
+    for scale in sorted(args.scales):
+        print(f"Running scale {scale:g}x...", file=sys.stderr)
+        results.append(run_scale_subprocess(scale, args.seed, args.repeat, args.fuse_plugins))
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
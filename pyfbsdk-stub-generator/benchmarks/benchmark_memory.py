@@ -0,0 +1,129 @@
+"""
+Measure the memory used by the stub model of a synthetic pyfbsdk module, see `synthetic_module.py`.
+
+The stub objects use `__slots__`. For comparison, each object is also re-created as a plain object with an instance
+dict, the way the model used to store its attributes. Only the objects themselves are measured, the values of their
+attributes (names, docstrings, lists, ...) are shared by both versions.
+
+The retained size of the whole model (the objects & everything they reference) is measured after the plugins have run,
+the dict-backed size is estimated from the difference between the two versions of the objects.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import sys
+import tracemalloc
+
+from typing import Callable
+
+
+def get_slot_names(cls: type) -> list[str]:
+    """ Get the slots of a class & its parents, in the order the attributes are set by `__init__` """
+    return [name for x in reversed(cls.__mro__) for name in x.__dict__.get("__slots__", ())]
+
+
+def collect_stub_objects(stubs) -> dict[type, list]:
+    """ Get all of the stub objects in the model, grouped by type """
+    from src.module_types import StubClass
+
+    objects: dict[type, list] = {}
+    seen: set[int] = set()
+
+    def _add(stub_object):
+        if id(stub_object) in seen:
+            return
+        seen.add(id(stub_object))
+        objects.setdefault(type(stub_object), []).append(stub_object)
+
+        if isinstance(stub_object, StubClass):
+            for x in stub_object.stub_enums + stub_object.stub_properties:
+                _add(x)
+            for function_group in stub_object.stub_functions:
+                for x in function_group:
+                    _add(x)
+        elif hasattr(stub_object, "_params"):
+            for x in stub_object._params:
+                _add(x)
+
+    for stub_object in stubs.enums + stubs.classes + [x for group in stubs.function_groups for x in group]:
+        _add(stub_object)
+
+    return objects
+
+
+def measure_allocation(create: Callable[[], list]) -> int:
+    """ The number of bytes allocated by `create`, not including the list it returns """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_size = tracemalloc.get_traced_memory()[0]
+        created = create()
+        size = tracemalloc.get_traced_memory()[0] - start_size - sys.getsizeof(created)
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def copy_objects(stub_objects: list, cls: type, names: list[str]) -> list:
+    copies = []
+    for stub_object in stub_objects:
+        new_object = cls.__new__(cls)
+        for name in names:
+            setattr(new_object, name, getattr(stub_object, name))
+        copies.append(new_object)
+    return copies
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument("--scale", type=float, default=1, help="Size of the synthetic module, relative to pyfbsdk in MotionBuilder 2027")
+    argparser.add_argument("--seed", type=int, default=0, help="Seed for the content of the synthetic module")
+    args = argparser.parse_args()
+
+    from . import synthetic_module
+    module = synthetic_module.install_synthetic_module(args.scale, args.seed)
+
+    # pyfbsdk must be installed before the generator is imported
+    from src import stub_generator
+    from src.flags import GeneratorFlag
+
+    from .benchmark_generator import EXCLUDED_PLUGINS
+
+    plugins = [x for x in stub_generator.DEFAULT_PLUGINS if x.__name__ not in EXCLUDED_PLUGINS]
+    generator = stub_generator.StubGenerator(module, GeneratorFlag.NONE, plugins=plugins, version=synthetic_module.VERSION)
+
+    gc.collect()
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+    with contextlib.redirect_stdout(sys.stderr):
+        stubs = generator.generate_stubs()
+    gc.collect()
+    model_size = tracemalloc.get_traced_memory()[0] - start_size
+    tracemalloc.stop()
+
+    print(f"{'Type':<16}{'Count':>10}{'Dict B/obj':>12}{'Slots B/obj':>13}{'Dict total':>13}{'Slots total':>13}")
+    dict_total = slots_total = 0
+    for cls, stub_objects in collect_stub_objects(stubs).items():
+        names = get_slot_names(cls)
+        dict_cls = type(f"Dict{cls.__name__}", (), {})
+
+        dict_size = measure_allocation(lambda: copy_objects(stub_objects, dict_cls, names))
+        slots_size = measure_allocation(lambda: copy_objects(stub_objects, cls, names))
+        dict_total += dict_size
+        slots_total += slots_size
+
+        count = len(stub_objects)
+        print(f"{cls.__name__:<16}{count:>10}{dict_size / count:>12.1f}{slots_size / count:>13.1f}"
+              f"{dict_size / 1_000_000:>11.2f}MB{slots_size / 1_000_000:>11.2f}MB")
+
+    print(f"{'Stub objects':<16}{'':>10}{'':>12}{'':>13}{dict_total / 1_000_000:>11.2f}MB{slots_total / 1_000_000:>11.2f}MB")
+
+    dict_model_size = model_size - slots_total + dict_total
+    print(f"\nRetained model size: {dict_model_size / 1_000_000:.2f}MB with dicts (estimated), {model_size / 1_000_000:.2f}MB with slots "
+          f"({1 - model_size / dict_model_size:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Compare the previous greedy overload matching with the optimal matching used by the online documentation plugin.
+
+The overload groups are recorded from introspection snapshots (see the `--snapshot` option of the generator),
+matched against the cached online documentation (populated by running the generator with `--cache`).
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import time
+
+from typing import Callable
+
+from src import snapshot
+from src.module_types import StubFunction, StubParameter
+from src.plugins.online_documentation.documentation_scraper import Documentation, MemberItem
+from src.plugins.online_documentation.documentation_scraper.parser import Parameter
+from src.plugins.online_documentation.overload_matching import match_overloads, get_compatibility_score
+from src.plugins.online_documentation.type_translator import TypeTranslator
+
+
+OverloadGroup = tuple[list[StubFunction], list[MemberItem]]
+Matcher = Callable[[list[StubFunction], list[MemberItem], Callable[[str | None], str | None]], list[tuple[StubFunction, MemberItem]]]
+
+
+def match_overloads_greedy(stub_functions: list[StubFunction],
+                           members: list[MemberItem],
+                           translate_type: Callable[[str | None], str | None]) -> list[tuple[StubFunction, MemberItem]]:
+    """ The previous matching, perfect matches first and then the remaining pairs by the highest score """
+    matches: list[tuple[StubFunction, MemberItem]] = []
+    matched_functions: list[StubFunction] = []
+    matched_members: list[MemberItem] = []
+    for stub_function in stub_functions:
+        for member in members:
+            if stub_function in matched_functions or member in matched_members:
+                continue
+            stub_types = [x.Type for x in stub_function.get_parameters(exclude_self=True)]
+            if stub_types == [x.type_str for x in member.parameters]:
+                matches.append((stub_function, member))
+                matched_functions.append(stub_function)
+                matched_members.append(member)
+
+    scores: list[tuple[StubFunction, MemberItem, int]] = []
+    for stub_function in stub_functions:
+        if stub_function in matched_functions:
+            continue
+        for member in members:
+            if member in matched_members:
+                continue
+            member_types = [translate_type(x.type_str) for x in member.parameters]
+            stub_types = [x.Type for x in stub_function.get_parameters(exclude_self=True)]
+            score = get_compatibility_score(stub_types, member_types)
+            if score > 0:
+                scores.append((stub_function, member, score))
+
+    scores.sort(key=lambda x: x[2], reverse=True)
+    while scores:
+        stub_function, member, score = scores.pop(0)
+        if stub_function in matched_functions or member in matched_members:
+            continue
+        matches.append((stub_function, member))
+        matched_functions.append(stub_function)
+        matched_members.append(member)
+
+    return matches
+
+
+def get_total_score(matches: list[tuple[StubFunction, MemberItem]], translate_type: Callable[[str | None], str | None]) -> int:
+    total = 0
+    for stub_function, member in matches:
+        stub_types = [x.Type for x in stub_function.get_parameters(exclude_self=True)]
+        total += max(get_compatibility_score(stub_types, [translate_type(x.type_str) for x in member.parameters]), 0)
+    return total
+
+
+def record_overload_groups(snapshot_directory: str, base_url: str | None) -> tuple[list[OverloadGroup], TypeTranslator]:
+    groups: list[OverloadGroup] = []
+    class_names: set[str] = set()
+
+    loaded_snapshots = snapshot.load_snapshots(snapshot_directory)
+
+    from src import native_generator  # Imports pyfbsdk, so the snapshots must be loaded first
+
+    for loaded_snapshot in loaded_snapshots:
+        enums, classes, function_groups = native_generator.generate_module_stubs(loaded_snapshot.module)
+        class_names.update(x.name for x in enums + classes)
+
+        documentation = Documentation(loaded_snapshot.module.__name__, loaded_snapshot.version, use_cache=True, base_url=base_url)
+        try:
+            for stub_class in classes:
+                if not (parsed_page := documentation.parse_page(stub_class.name)):
+                    continue
+                for stub_functions in stub_class.stub_functions:
+                    name = stub_class.name if stub_functions[0].name == "__init__" else stub_functions[0].name
+                    members = parsed_page.find_members_by_name(name)
+                    if len(stub_functions) > 1 or len(members) > 1:
+                        groups.append((stub_functions, members))
+        finally:
+            documentation.close()
+
+    return groups, TypeTranslator(frozenset(class_names))
+
+
+# Python type & how it's written in the documentation, used for the synthetic groups
+SYNTHETIC_TYPES = (
+    ("float", "double"),
+    ("int", "int"),
+    ("bool", "bool"),
+    ("str", "const char *"),
+    ("FBVector3d", "FBVector3d"),
+    ("FBVector4d", "FBVector4< float >"),
+    ("FBTime", "FBTime"),
+    ("list", "FBArrayTemplate< FBModel * >"),
+)
+
+
+def create_synthetic_group(size: int, seed: int) -> OverloadGroup:
+    """ Create `size` overloads with unique signatures, and their documentation members in a random order """
+    rng = random.Random(seed)
+    signatures = [x for length in range(1, 4) for x in itertools.product(SYNTHETIC_TYPES, repeat=length)]
+    stub_functions: list[StubFunction] = []
+    members: list[MemberItem] = []
+    for signature in rng.sample(signatures, size):
+        stub_functions.append(StubFunction(None, "Overload", [StubParameter(None, f"arg{i}", x[0]) for i, x in enumerate(signature)]))
+        members.append(MemberItem("Overload", "void", "", [Parameter(f"p{i}", x[1]) for i, x in enumerate(signature)], ""))
+    rng.shuffle(members)
+    return stub_functions, members
+
+
+def time_matcher(groups: list[OverloadGroup], matcher: Matcher, translate_type: Callable[[str | None], str | None], repeat: int) -> float:
+    best_time = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for stub_functions, members in groups:
+            matcher(stub_functions, members, translate_type)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument("snapshot_directory", help="Folder with the introspection snapshots")
+    argparser.add_argument("--base-url", help="Root url of the documentation, if it was cached from somewhere else than the default")
+    argparser.add_argument("--repeat", type=int, default=5, help="Number of times to match all groups, the best time is reported")
+    argparser.add_argument("--synthetic-sizes", type=int, nargs="*", default=[5, 10, 20], help="Also time synthetic groups with this many overloads")
+    args = argparser.parse_args()
+
+    groups, translator = record_overload_groups(args.snapshot_directory, args.base_url)
+    if not groups:
+        raise SystemExit("No overload groups found, make sure the documentation has been cached")
+
+    translate_type = translator.translate
+
+    differences = 0
+    greedy_score = optimal_score = 0
+    for stub_functions, members in groups:
+        greedy_matches = match_overloads_greedy(stub_functions, members, translate_type)
+        optimal_matches = match_overloads(stub_functions, members, translate_type)
+        if sorted(map(id, sum(greedy_matches, ()))) != sorted(map(id, sum(optimal_matches, ()))):
+            differences += 1
+        greedy_score += get_total_score(greedy_matches, translate_type)
+        optimal_score += get_total_score(optimal_matches, translate_type)
+
+    largest_group = max(len(functions) * len(members) for functions, members in groups)
+    print(f"{len(groups)} overload groups, largest has {largest_group} function/member pairs")
+    print(f"{differences} groups matched differently, total score greedy: {greedy_score}, optimal: {optimal_score}\n")
+
+    for name, matcher in (("Greedy", match_overloads_greedy), ("Optimal", match_overloads)):
+        elapsed_time = time_matcher(groups, matcher, translate_type, args.repeat)
+        print(f"{name:<8} {elapsed_time * 1000:8.2f}ms {len(groups) / elapsed_time:10.0f} groups/s")
+
+    for size in args.synthetic_sizes:
+        synthetic_groups = [create_synthetic_group(size, seed) for seed in range(20)]
+        print(f"\nSynthetic groups with {size} overloads:")
+        for name, matcher in (("Greedy", match_overloads_greedy), ("Optimal", match_overloads)):
+            elapsed_time = time_matcher(synthetic_groups, matcher, translate_type, args.repeat)
+            score = sum(get_total_score(matcher(*group, translate_type), translate_type) for group in synthetic_groups)
+            print(f"{name:<8} {elapsed_time * 1000:8.2f}ms {len(synthetic_groups) / elapsed_time:10.0f} groups/s, total score: {score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare the BeautifulSoup & the streaming extractor used to parse the documentation pages.
+
+The pages are read from the documentation cache (populated by running the generator with `--cache`),
+or from a folder of .html files. Both extractors are verified to give the same result before being timed.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from typing import Callable
+
+from src.plugins.online_documentation.documentation_scraper import parser, cache_store, requests_cache
+
+
+def load_pages_from_cache(version: int) -> dict[str, str]:
+    store = cache_store.get_default_store()
+    namespace = requests_cache.get_namespace(version)
+    pages: dict[str, str] = {}
+    for key in store.get_keys(namespace):
+        if key.endswith(".html") and (data := store.get(namespace, key)) is not None:
+            pages[key] = data.decode("utf-8")
+    return pages
+
+
+def load_pages_from_directory(directory: str) -> dict[str, str]:
+    pages: dict[str, str] = {}
+    for filename in os.listdir(directory):
+        if filename.endswith(".html"):
+            with open(os.path.join(directory, filename), encoding="utf-8") as file:
+                pages[filename] = file.read()
+    return pages
+
+
+def time_pages(pages: dict[str, str], function: Callable[[str, str], object], repeat: int) -> float:
+    """ Returns: The best time of `repeat` runs over all pages """
+    best_time = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for url, html in pages.items():
+            function(url, html)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument("--version", type=int, default=2027, help="MotionBuilder version of the cached pages to use")
+    argparser.add_argument("--directory", help="Use the .html files in this folder instead of the cache")
+    argparser.add_argument("--repeat", type=int, default=3, help="Number of times to parse all pages, the best time is reported")
+    args = argparser.parse_args()
+
+    if args.directory:
+        pages = load_pages_from_directory(args.directory)
+    else:
+        pages = load_pages_from_cache(args.version)
+
+    if not pages:
+        raise SystemExit("No pages found, run the generator with --cache first or pass --directory")
+
+    mismatches = [
+        url for url, html in pages.items()
+        if parser.parse_page(url, html, url, stream=False) != parser.parse_page(url, html, url, stream=True)
+    ]
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} pages are parsed differently, e.g: {mismatches[:5]}")
+
+    total_size = sum(len(x) for x in pages.values())
+    print(f"{len(pages)} pages, {total_size / 1_000_000:.2f} MB, identical output from both extractors\n")
+
+    results = {
+        "Extract (BeautifulSoup)": time_pages(pages, lambda url, html: parser.extract_page_soup(html), args.repeat),
+        "Extract (stream)": time_pages(pages, lambda url, html: parser.extract_page_stream(html), args.repeat),
+        "Parse page (BeautifulSoup)": time_pages(pages, lambda url, html: parser.parse_page(url, html, url, stream=False), args.repeat),
+        "Parse page (stream)": time_pages(pages, lambda url, html: parser.parse_page(url, html, url, stream=True), args.repeat),
+    }
+
+    for name, elapsed_time in results.items():
+        print(f"{name:<28} {elapsed_time:8.3f}s {len(pages) / elapsed_time:10.1f} pages/s")
+
+    print(f"\nExtract speedup: {results['Extract (BeautifulSoup)'] / results['Extract (stream)']:.2f}x")
+    print(f"Parse page speedup: {results['Parse page (BeautifulSoup)'] / results['Parse page (stream)']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Compare rendering the stub model with `as_string()` & `indent()`, where the text of each nested enum, property &
+function is copied again at each indentation level, with the single-pass `render()` that appends each top-level object
+to a buffer of its own (see `StubGenerator.write_stubs`).
+
+Renders the model of a synthetic pyfbsdk module of the same size as the one in MotionBuilder 2027 (see `synthetic_module.py`),
+or the modules in a folder of snapshots (see the `--snapshot` option of the generator), and makes sure both give the same output.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from types import ModuleType
+from typing import Callable
+
+
+def render_with_as_string(enums, classes, function_groups) -> str:
+    """ Render the stubs the way the generator used to, by indenting the string of each object """
+    from src.module_types import append_indented
+
+    def write_indented(stream: io.StringIO, text: str):
+        buffer: list[str] = []
+        append_indented(buffer, text)
+        stream.writelines(buffer)
+
+    stream = io.StringIO()
+    for index, stub_enum in enumerate(enums):
+        if index:
+            stream.write("\n")
+        write_indented(stream, stub_enum.as_string())
+    stream.write("\n")
+
+    for index, stub_class in enumerate(classes):
+        if index:
+            stream.write("\n")
+        write_indented(stream, stub_class.as_string())
+    stream.write("\n")
+
+    for function_group in function_groups:
+        overload = len(function_group) > 1
+        for index, stub_function in enumerate(function_group):
+            if index:
+                stream.write("\n")
+            write_indented(stream, stub_function.as_string(overload))
+        stream.write("\n")
+
+    stream.write("\n")
+    return stream.getvalue()
+
+
+def render_with_buffer(enums, classes, function_groups) -> str:
+    from src.stub_generator import StubGenerator
+
+    stream = io.StringIO()
+    StubGenerator.write_stubs(stream, enums, classes, function_groups)
+    return stream.getvalue()
+
+
+def get_best_time(function: Callable[[], str], repeat: int) -> tuple[float, str]:
+    best_time = float("inf")
+    output = ""
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        output = function()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time, output
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument("--snapshots", metavar="DIR", help="Render the modules from the snapshots in DIR instead of a synthetic module")
+    argparser.add_argument("--seed", type=int, default=0, help="Seed for the content of the synthetic module")
+    argparser.add_argument("--repeat", type=int, default=5, help="Number of times to render the stubs, the best time is reported")
+    args = argparser.parse_args()
+
+    modules: list[ModuleType]
+    if args.snapshots:
+        from src.snapshot import load_snapshots
+        snapshots = load_snapshots(args.snapshots)
+        modules, version = [x.module for x in snapshots], snapshots[0].version
+    else:
+        from . import synthetic_module
+        modules, version = [synthetic_module.install_synthetic_module(1, args.seed)], synthetic_module.VERSION
+
+    # pyfbsdk must be installed before the generator is imported
+    from src import stub_generator
+    from src.flags import GeneratorFlag
+
+    from .benchmark_generator import EXCLUDED_PLUGINS
+
+    plugins = [x for x in stub_generator.DEFAULT_PLUGINS if x.__name__ not in EXCLUDED_PLUGINS]
+
+    all_identical = True
+    for module in modules:
+        generator = stub_generator.StubGenerator(module, GeneratorFlag.NONE, plugins=list(plugins), version=version)
+        with contextlib.redirect_stdout(sys.stderr):
+            stubs = generator.generate_stubs()
+
+        # Rendering fixes up some of the parameters (e.g. names of self parameters), do it once before timing
+        render_with_as_string(*stubs)
+
+        as_string_time, as_string_output = get_best_time(lambda: render_with_as_string(*stubs), args.repeat)
+        buffer_time, buffer_output = get_best_time(lambda: render_with_buffer(*stubs), args.repeat)
+
+        identical = as_string_output == buffer_output
+        all_identical &= identical
+
+        print(f"{module.__name__} ({len(buffer_output) / 1_000_000:.1f}MB)")
+        print(f"  as_string & indent: {as_string_time:8.3f}s")
+        print(f"  render to buffer:   {buffer_time:8.3f}s  ({as_string_time / buffer_time:.2f}x)")
+        print(f"  Output: {'identical' if identical else 'DIFFERENT'}")
+
+    if not all_identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Compare the previous Boost.Python docstring parsing (chains of split, partition & replace for every function) with the
+memoized signature parser used by the native generator, see `src/signature_parser.py`.
+
+The corpus is the docstring of every function & method (including inherited ones) of a synthetic pyfbsdk module
+(see `synthetic_module.py`) or of the modules in a folder of snapshots (see the `--snapshot` option of the generator).
+Both parsers must give the same parameters & return types.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import sys
+import time
+
+from types import ModuleType
+from typing import Callable
+
+
+Corpus = list[Callable]
+ParsedInfo = list[tuple[list, str]]
+
+
+def get_function_info_legacy(function: Callable) -> ParsedInfo:
+    """ The previous implementation of `native_generator.get_function_info_from_doc_string` """
+    from src.module_types import StubParameter
+
+    if not function.__doc__:
+        return []
+
+    def _generate_parameters(param_str: str, default_value=None) -> list[StubParameter]:
+        params: list[StubParameter] = []
+        for param in param_str.split(","):
+            param_type, _, param_name = param.strip().partition(")")
+            params.append(StubParameter(function, param_name, param_type[1:], default_value=default_value))
+        return params
+
+    parameters = []
+    function_docs = [x for x in function.__doc__.split("\n") if x]
+    for docstring in function_docs:
+        if not docstring.strip().startswith(function.__name__) or not all(x in docstring for x in ["->", "(", ")"]):
+            continue
+
+        docstring = docstring.partition("(")[2]
+        params, _, return_type = docstring.rpartition("->")
+        return_type = return_type.strip(" :")
+
+        params = params.rpartition(")")[0]
+        required_params, _, optional_params = params.partition("[")
+        optional_params = optional_params.replace("[", "").replace("]", "").lstrip(',')
+
+        params = []
+        if required_params.strip():
+            params += _generate_parameters(required_params)
+        if optional_params.strip():
+            params += _generate_parameters(optional_params, default_value="None")
+
+        parameters.append((params, return_type.strip()))
+
+    return parameters
+
+
+def get_corpus(module: ModuleType) -> Corpus:
+    """ Get all functions & methods in the module, in the order the native generator visits them """
+    from src import native_generator
+
+    corpus: Corpus = []
+    for name, member in inspect.getmembers(module):
+        object_type = native_generator.get_object_type(member)
+        if object_type == native_generator.EObjectType.FUNCTION:
+            corpus.append(member)
+        elif object_type == native_generator.EObjectType.CLASS:
+            corpus.extend(x for _, x in inspect.getmembers(member) if native_generator.get_object_type(x) == native_generator.EObjectType.FUNCTION)
+    return corpus
+
+
+def to_comparable(parsed_info: ParsedInfo) -> list:
+    return [([(x.name, x.Type, x.default_value) for x in parameters], return_type) for parameters, return_type in parsed_info]
+
+
+def get_best_time(parse: Callable[[Callable], ParsedInfo], corpus: Corpus, repeat: int, before_each: Callable[[], None] | None = None) -> float:
+    best_time = float("inf")
+    for _ in range(repeat):
+        if before_each:
+            before_each()
+        start_time = time.perf_counter()
+        for function in corpus:
+            parse(function)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument("--snapshots", metavar="DIR", help="Use the modules from the snapshots in DIR instead of a synthetic module")
+    argparser.add_argument("--scale", type=float, default=1, help="Size of the synthetic module, relative to pyfbsdk in MotionBuilder 2027")
+    argparser.add_argument("--seed", type=int, default=0, help="Seed for the content of the synthetic module")
+    argparser.add_argument("--repeat", type=int, default=5, help="Number of times to parse the corpus, the best time is reported")
+    args = argparser.parse_args()
+
+    modules: list[ModuleType]
+    if args.snapshots:
+        from src.snapshot import load_snapshots
+        modules = [x.module for x in load_snapshots(args.snapshots)]
+    else:
+        from . import synthetic_module
+        modules = [synthetic_module.install_synthetic_module(args.scale, args.seed)]
+
+    # pyfbsdk must be installed before the generator is imported
+    from src import native_generator, signature_parser
+
+    corpus = [x for module in modules for x in get_corpus(module)]
+    unique_docstrings = {(x.__name__, x.__doc__) for x in corpus if x.__doc__}
+
+    mismatches = [x for x in corpus if to_comparable(get_function_info_legacy(x)) != to_comparable(native_generator.get_function_info_from_doc_string(x))]
+
+    legacy_time = get_best_time(get_function_info_legacy, corpus, args.repeat)
+    cold_time = get_best_time(native_generator.get_function_info_from_doc_string, corpus, args.repeat, signature_parser.parse_docstring.cache_clear)
+    warm_time = get_best_time(native_generator.get_function_info_from_doc_string, corpus, args.repeat)
+
+    print(f"Functions: {len(corpus)}, unique docstrings: {len(unique_docstrings)}")
+    print(f"  Previous parser:           {legacy_time:8.3f}s")
+    print(f"  Memoized, empty memo:      {cold_time:8.3f}s  ({legacy_time / cold_time:.2f}x)")
+    print(f"  Memoized, filled memo:     {warm_time:8.3f}s  ({legacy_time / warm_time:.2f}x)")
+    print(f"Results: {'identical' if not mismatches else f'{len(mismatches)} DIFFERENT, e.g. {mismatches[0].__qualname__}'}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+"""
+Synthetic stand-in for the pyfbsdk module, to benchmark the generator without MotionBuilder.
+
+The module is generated as snapshot data (see `src/snapshot.py`) and rebuilt into a stand-in module with:
+- Boost.Python style docstrings, e.g. `Name( (type)arg1 [, (type)arg2]) -> ret`, including overloads & static methods
+- Enums deriving from `Boost.Python.enum`, both directly in the module & nested in classes
+- The FBProperty hierarchy, e.g. `FBProperty -> FBPropertyAnimatable -> FBPropertyAnimatableDouble` & the FBPropertyList classes
+- Every class, property & function the generator and the plugins reference from pyfbsdk, found by scanning the source
+
+The number of classes, enums & functions scale linearly, where a scale of 1.0 is about the size of pyfbsdk in MotionBuilder 2027.
+"""
+from __future__ import annotations
+
+import ast
+import random
+
+from pathlib import Path
+from types import ModuleType
+from typing import NamedTuple
+
+from src import snapshot
+
+
+MODULE_NAME = "pyfbsdk"
+VERSION = 2027
+
+SOURCE_DIRECTORY = Path(__file__).parent.parent / "src"
+
+# Approximate size of pyfbsdk in MotionBuilder 2027
+REFERENCE_CLASS_COUNT = 360
+REFERENCE_ENUM_COUNT = 230
+REFERENCE_FUNCTION_COUNT = 310
+
+PROPERTY_COUNT_RANGE = (0, 10)
+METHOD_COUNT_RANGE = (1, 14)
+PARAMETER_COUNT_RANGE = (0, 4)
+ENUM_VALUE_COUNT_RANGE = (2, 14)
+MAX_CLASS_DEPTH = 8
+
+OVERLOAD_CHANCE = 0.08
+OPTIONAL_PARAMETER_CHANCE = 0.15
+STATIC_METHOD_CHANCE = 0.05
+NESTED_ENUM_CHANCE = 0.03
+VALUE_CLASS_CHANCE = 0.15  # Classes that don't inherit from FBComponent, e.g. FBVector3d
+PROPERTY_LIST_CHANCE = 0.05
+DEPRECATED_CHANCE = 0.02
+READ_ONLY_CHANCE = 0.2
+CLASS_TYPE_CHANCE = 0.4  # Chance of a parameter or return type being another class in the module
+NONE_RETURN_CHANCE = 0.4
+
+BUILTIN_TYPES = ("int", "float", "str", "bool", "object", "list", "tuple")
+VALUE_CLASS_DUNDER_METHODS = ("__add__", "__sub__", "__mul__", "__neg__", "__getitem__", "__len__", "__gt__", "__lt__")
+
+METHOD_VERBS = ("Add", "Apply", "Clear", "Compute", "Create", "Evaluate", "Find", "Lock", "Query", "Refresh", "Reset", "Update")
+METHOD_NOUNS = ("Channel", "Color", "Curve", "Frame", "Key", "Layer", "Matrix", "Node", "Range", "State", "Target", "Value")
+
+# The FBProperty classes, a FBProperty<Type> & a FBPropertyAnimatable<Type> class is created for each of them
+PROPERTY_DATA_TYPES = ("Action", "Bool", "Color", "ColorAndAlpha", "Double", "Enum", "Float", "Int", "Int64", "String",
+                       "Time", "TimeCode", "UInt64", "Vector2d", "Vector3d", "Vector4d")
+ANIMATABLE_DATA_TYPES = ("Action", "Bool", "Color", "ColorAndAlpha", "Double", "Enum", "Int", "Time", "TimeCode",
+                         "Vector2d", "Vector3d", "Vector4d")
+
+# Attributes of the Boost.Python enums that aren't enum values
+ENUM_ATTRIBUTES = {"names", "values"}
+
+INSTANCE_ID = f"{snapshot.BOOST_PYTHON_MODULE}.instance"
+ENUM_ID = f"{snapshot.BOOST_PYTHON_MODULE}.enum"
+
+
+class Signature(NamedTuple):
+    parameter_types: list[str]
+    optional_count: int
+    return_type: str
+
+
+# -------------------------------------------------------------
+#                       Helper Functions
+# -------------------------------------------------------------
+
+def get_boost_docstring(name: str, signatures: list[Signature]) -> str:
+    """ Create a docstring in the Boost.Python format, e.g. `Name( (type)arg1 [, (type)arg2 [, (type)arg3]]) -> ret` """
+    docstring = ""
+    for signature in signatures:
+        parameters = [f"({x})arg{i}" for i, x in enumerate(signature.parameter_types, 1)]
+        required_count = len(parameters) - signature.optional_count
+
+        text = ", ".join(parameters[:required_count])
+        for parameter in parameters[required_count:]:
+            text += f" [, {parameter}" if text else f"[ {parameter}"
+        text += "]" * signature.optional_count
+
+        arguments = f" {text}" if text else ""
+        docstring += f"\n{name}({arguments}) -> {signature.return_type} :\n\n    C++ signature :\n        void {name}()\n"
+
+    return docstring
+
+
+def is_enum_value_name(name: str) -> bool:
+    """ e.g. 'kFBPT_int' or 'eBeginRendering' """
+    return len(name) > 1 and name[0] in "ke" and name[1].isupper()
+
+
+def is_nested_enum_name(name: str) -> bool:
+    """ e.g. 'EState' """
+    return len(name) > 1 and name[0] == "E" and name[1].isupper()
+
+
+def get_referenced_names(directory: Path = SOURCE_DIRECTORY) -> dict[str, set[str]]:
+    """
+    Find the members of pyfbsdk that are referenced in the source code, including the properties listed in the manual documentation.
+
+    Returns: Dict with the referenced names and their referenced attributes, e.g. `{"FBSystem": {"OnConnectionNotify"}}`
+    """
+    referenced: dict[str, set[str]] = {}
+
+    for filepath in sorted(directory.rglob("*.py")):
+        tree = ast.parse(filepath.read_text(encoding="utf-8"))
+        aliases = {alias.asname or alias.name for node in ast.walk(tree) if isinstance(node, ast.Import)
+                   for alias in node.names if alias.name == MODULE_NAME}
+        if not aliases:
+            continue
+
+        def _get_member_name(node: ast.AST) -> str | None:
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in aliases:
+                return node.attr
+            return None
+
+        for node in ast.walk(tree):
+            if member_name := _get_member_name(node):
+                referenced.setdefault(member_name, set())
+
+            elif isinstance(node, ast.Attribute) and (member_name := _get_member_name(node.value)):
+                if not node.attr.startswith("__") and node.attr not in ENUM_ATTRIBUTES:
+                    referenced.setdefault(member_name, set()).add(node.attr)
+
+            # The manual documentation, e.g. `{fb.FBModel: ClassDoc(properties=[PropertyDoc("Parent", ...)])}`
+            elif isinstance(node, ast.Dict):
+                for key, value in zip(node.keys, node.values):
+                    if key is None or not (member_name := _get_member_name(key)):
+                        continue
+                    for call in ast.walk(value):
+                        if (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "PropertyDoc"
+                                and call.args and isinstance(call.args[0], ast.Constant)):
+                            referenced.setdefault(member_name, set()).add(call.args[0].value)
+
+    return referenced
+
+
+# -------------------------------------------------------------
+#                          Builder
+# -------------------------------------------------------------
+
+class _SyntheticModuleBuilder:
+    def __init__(self, scale: float, seed: int):
+        self.scale = scale
+        self.random = random.Random(seed)
+
+        self.class_records: dict[str, dict] = {}
+        self.members: list[list] = []
+
+        self.depths: dict[str, int] = {}
+        self.type_names: list[str] = []  # Classes & enums that can be used as parameter & return types
+        self.component_names: list[str] = []  # Classes that new classes can inherit from
+
+    # ---------------------------------------------------------
+    #                       Records
+    # ---------------------------------------------------------
+
+    def add_class(self, name: str, base_name: str | None = None, doc: str | None = None) -> dict:
+        class_id = f"{MODULE_NAME}.{name}"
+        base_id = f"{MODULE_NAME}.{base_name}" if base_name else INSTANCE_ID
+
+        record = {"id": class_id, "name": name, "meta": "class", "bases": [base_id], "doc": doc, "dict": []}
+        self.class_records[class_id] = record
+        self.members.append([name, {"k": snapshot.MemberKind.CLASS, "id": class_id}])
+
+        self.depths[name] = self.depths.get(base_name, 0) + 1 if base_name else 1
+        self.type_names.append(name)
+        return record
+
+    def add_enum(self, name: str, value_names: list[str], parent: dict | None = None) -> dict:
+        enum_id = f"{parent['id']}.{name}" if parent else f"{MODULE_NAME}.{name}"
+
+        record = {"id": enum_id, "name": name, "meta": "type", "bases": [ENUM_ID], "doc": None, "dict": []}
+        for value, value_name in enumerate(value_names):
+            record["dict"].append([value_name, {"k": snapshot.MemberKind.ENUM_VALUE, "id": enum_id, "n": value_name, "v": value}])
+        self.class_records[enum_id] = record
+
+        member = [name, {"k": snapshot.MemberKind.CLASS, "id": enum_id}]
+        if parent:
+            parent["dict"].append(member)
+        else:
+            self.members.append(member)
+            self.type_names.append(name)
+
+        return record
+
+    def add_property(self, record: dict, name: str):
+        if any(x[0] == name for x in record["dict"]):
+            return
+
+        access = "Read Only Property" if self.random.random() < READ_ONLY_CHANCE else "Read Write Property"
+        doc = f"{access}: The {name.lower()} of the {record['name']}."
+        record["dict"].append([name, {"k": snapshot.MemberKind.PROPERTY, "doc": doc}])
+
+    def add_method(self, record: dict, name: str, signatures: list[Signature], is_static: bool = False):
+        if any(x[0] == name for x in record["dict"]):
+            return
+
+        function_record = {"k": snapshot.MemberKind.FUNCTION, "n": name, "doc": get_boost_docstring(name, signatures)}
+        if is_static:
+            function_record["s"] = 1
+        record["dict"].append([name, function_record])
+
+    def add_function(self, name: str, signatures: list[Signature]):
+        self.members.append([name, {"k": snapshot.MemberKind.FUNCTION, "n": name, "doc": get_boost_docstring(name, signatures)}])
+
+    # ---------------------------------------------------------
+    #                   Random Content
+    # ---------------------------------------------------------
+
+    def get_random_type(self) -> str:
+        if self.type_names and self.random.random() < CLASS_TYPE_CHANCE:
+            return self.random.choice(self.type_names)
+        return self.random.choice(BUILTIN_TYPES)
+
+    def get_random_signature(self, first_parameter: str | None = None) -> Signature:
+        parameter_types = [self.get_random_type() for _ in range(self.random.randint(*PARAMETER_COUNT_RANGE))]
+        optional_count = 0
+        if parameter_types and self.random.random() < OPTIONAL_PARAMETER_CHANCE:
+            optional_count = self.random.randint(1, len(parameter_types))
+
+        if first_parameter:
+            parameter_types.insert(0, first_parameter)
+
+        return_type = "None" if self.random.random() < NONE_RETURN_CHANCE else self.get_random_type()
+        return Signature(parameter_types, optional_count, return_type)
+
+    def get_random_class_doc(self, name: str) -> str:
+        doc = f"{name} class.\n\nSynthetic class generated for benchmarking."
+        if self.random.random() < DEPRECATED_CHANCE:
+            doc += f"\n\nDeprecated:\n    Use {self.random.choice(self.component_names or ['FBComponent'])} instead."
+        return doc
+
+    def add_random_members(self, record: dict, allow_overloads: bool = True):
+        name = record["name"]
+
+        for _ in range(self.random.randint(*PROPERTY_COUNT_RANGE)):
+            self.add_property(record, f"{self.random.choice(METHOD_NOUNS)}{self.random.choice(METHOD_NOUNS)}")
+
+        self.add_method(record, "__init__", [self.get_random_signature(name)])
+
+        for _ in range(self.random.randint(*METHOD_COUNT_RANGE)):
+            method_name = f"{self.random.choice(METHOD_VERBS)}{self.random.choice(METHOD_NOUNS)}"
+            is_static = self.random.random() < STATIC_METHOD_CHANCE
+            first_parameter = None if is_static else name
+
+            signatures = [self.get_random_signature(first_parameter)]
+            if allow_overloads and self.random.random() < OVERLOAD_CHANCE:
+                signatures += [self.get_random_signature(first_parameter) for _ in range(self.random.randint(1, 4))]
+
+            self.add_method(record, method_name, signatures, is_static)
+
+        if self.random.random() < NESTED_ENUM_CHANCE:
+            self.add_enum(f"E{self.random.choice(METHOD_NOUNS)}Type", self.get_enum_value_names("e"), parent=record)
+
+    def get_enum_value_names(self, prefix: str) -> list[str]:
+        count = self.random.randint(*ENUM_VALUE_COUNT_RANGE)
+        return [f"{prefix}{self.random.choice(METHOD_NOUNS)}{index}" for index in range(count)]
+
+    # ---------------------------------------------------------
+    #                       Classes
+    # ---------------------------------------------------------
+
+    def add_property_list(self, name: str, item_type: str):
+        record = self.add_class(name, "FBPropertyListComponent", f"List of {item_type}.")
+        self.add_method(record, "__getitem__", [Signature([name, "int"], 0, "object")])
+        self.add_method(record, "__contains__", [Signature([name, item_type], 0, "bool")])
+        self.add_method(record, "append", [Signature([name, item_type], 0, "None")])
+        self.add_method(record, "remove", [Signature([name, item_type], 0, "None")])
+        self.add_method(record, "count", [Signature([name, item_type], 0, "int")])
+        self.add_method(record, "insert", [Signature([name, "int", item_type], 0, "None")])
+        self.add_method(record, "pop", [Signature([name], 0, item_type), Signature([name, "int"], 0, item_type)])
+
+    def add_core_classes(self, referenced: dict[str, set[str]]):
+        """ The base classes, the FBProperty hierarchy & everything referenced by the generator """
+        self.add_class("FBPlug", doc="Base class of all objects that can be connected.")
+        component = self.add_class("FBComponent", "FBPlug", "Base class of all components.")
+        self.add_method(component, "PropertyCreate", [
+            Signature(["FBComponent", "str", "FBPropertyType", "str", "bool", "bool", "FBProperty"], 1, "FBProperty")
+        ])
+        self.component_names.append("FBComponent")
+
+        event = self.add_class("FBEvent", doc="Base class of all events.")
+        self.add_property(event, "Type")
+
+        # FBProperty hierarchy
+        self.add_property(self.add_class("FBProperty", "FBPlug", "Base class of all properties."), "Data")
+        self.add_class("FBPropertyAnimatable", "FBProperty", "Base class of all animatable properties.")
+        for data_type in PROPERTY_DATA_TYPES:
+            self.add_property(self.add_class(f"FBProperty{data_type}", "FBProperty"), "Data")
+        for data_type in ANIMATABLE_DATA_TYPES:
+            self.add_property(self.add_class(f"FBPropertyAnimatable{data_type}", "FBPropertyAnimatable"), "Data")
+        self.add_class("FBPropertyListComponent", "FBProperty", "Base class of all property lists.")
+
+        # Referenced enums, e.g. `FBPropertyType.kFBPT_int`
+        enum_names = {name for name, attributes in referenced.items() if attributes and all(map(is_enum_value_name, attributes))}
+        for name in sorted(enum_names):
+            self.add_enum(name, sorted(referenced[name]))
+
+        # Referenced classes
+        for name, attributes in sorted(referenced.items()):
+            if name in enum_names or not name.startswith("FB"):
+                continue
+
+            record = self.class_records.get(f"{MODULE_NAME}.{name}")
+            if record is None:
+                if name.startswith("FBPropertyList"):
+                    self.add_property_list(name, f"FB{name.removeprefix('FBPropertyList')}")
+                    continue
+
+                if name.startswith("FBPropertyAnimatable"):
+                    base_name = "FBPropertyAnimatable"
+                elif name.startswith("FBProperty"):
+                    base_name = "FBProperty"
+                elif name.startswith("FBEvent"):
+                    base_name = "FBEvent"
+                else:
+                    base_name = "FBComponent"
+
+                record = self.add_class(name, base_name, self.get_random_class_doc(name))
+                self.add_random_members(record, allow_overloads=False)
+                if base_name == "FBComponent":
+                    self.component_names.append(name)
+
+            for attribute in sorted(attributes):
+                if is_nested_enum_name(attribute):
+                    self.add_enum(attribute, self.get_enum_value_names("e"), parent=record)
+                else:
+                    self.add_property(record, attribute)
+
+        # Referenced functions, e.g. `ShowTool`
+        for name in sorted(referenced):
+            if not name.startswith("FB"):
+                self.add_function(name, [self.get_random_signature()])
+
+    def add_synthetic_classes(self, count: int):
+        for index in range(count):
+            name = f"FBSynthetic{index:05d}"
+
+            base_name = None
+            if self.random.random() >= VALUE_CLASS_CHANCE:
+                base_name = self.random.choice(self.component_names)
+                while self.depths[base_name] >= MAX_CLASS_DEPTH:
+                    base_name = self.random.choice(self.component_names)
+
+            record = self.add_class(name, base_name, self.get_random_class_doc(name))
+            self.add_random_members(record)
+
+            if base_name:
+                self.component_names.append(name)
+                if self.random.random() < PROPERTY_LIST_CHANCE:
+                    self.add_property_list(f"FBPropertyList{name.removeprefix('FB')}", name)
+            else:
+                for dunder_name in VALUE_CLASS_DUNDER_METHODS:
+                    self.add_method(record, dunder_name, [Signature([name, name], 0, "object")])
+
+    def add_synthetic_enums(self, count: int):
+        for index in range(count):
+            self.add_enum(f"FBSyntheticEnum{index:05d}", self.get_enum_value_names("kFB"))
+
+    def add_synthetic_functions(self, count: int):
+        for index in range(count):
+            name = f"FB{self.random.choice(METHOD_VERBS)}{self.random.choice(METHOD_NOUNS)}{index:05d}"
+            signatures = [self.get_random_signature()]
+            if self.random.random() < OVERLOAD_CHANCE:
+                signatures.append(self.get_random_signature())
+            self.add_function(name, signatures)
+
+    def build(self) -> dict:
+        referenced = get_referenced_names()
+        self.add_core_classes(referenced)
+
+        core_class_count = sum(x["meta"] == "class" for x in self.class_records.values())
+        self.add_synthetic_enums(max(round(REFERENCE_ENUM_COUNT * self.scale), 0))
+        self.add_synthetic_classes(max(round(REFERENCE_CLASS_COUNT * self.scale) - core_class_count, 0))
+        self.add_synthetic_functions(max(round(REFERENCE_FUNCTION_COUNT * self.scale), 0))
+
+        return {
+            "format": snapshot.SNAPSHOT_FORMAT_VERSION,
+            "module": MODULE_NAME,
+            "version": VERSION,
+            "members": self.members,
+            "classes": list(self.class_records.values()),
+            "roots": {INSTANCE_ID: [], ENUM_ID: []},
+            "requires": [],
+        }
+
+
+def build_synthetic_snapshot(scale: float = 1.0, seed: int = 0) -> dict:
+    """
+    Generate the snapshot data of a synthetic pyfbsdk module
+
+    Args:
+        - scale: Size of the module relative to pyfbsdk in MotionBuilder 2027
+        - seed: Seed for the random content, the same scale & seed always give the same module
+    """
+    return _SyntheticModuleBuilder(scale, seed).build()
+
+
+def install_synthetic_module(scale: float = 1.0, seed: int = 0) -> ModuleType:
+    """
+    Build a synthetic pyfbsdk module and register it in `sys.modules`, see `build_synthetic_snapshot`.
+    Must be called before anything imports pyfbsdk.
+    """
+    return snapshot.build_snapshot(build_synthetic_snapshot(scale, seed)).module
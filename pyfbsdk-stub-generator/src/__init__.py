@@ -2,12 +2,17 @@ import os
 
 from types import ModuleType
 
-import pyfbsdk
-
 from .flags import GeneratorFlag
 
 
-def generate(directory: str, modules: list[ModuleType] | None = None, copy_additional_stubs = True, flags = GeneratorFlag.NONE) -> list[str]:
+def generate(directory: str,
+             modules: list[ModuleType] | None = None,
+             copy_additional_stubs = True,
+             flags = GeneratorFlag.NONE,
+             version: int | None = None,
+             snapshot_directory: str | None = None,
+             jobs: int | None = None,
+             profile_filepath: str | None = None) -> list[str]:
     """
     Generate a stub file for the pyfbsdk module. \\
     This may take a while since the online MoBu sdk documentation will have to be parsed.
@@ -16,21 +21,43 @@ def generate(directory: str, modules: list[ModuleType] | None = None, copy_addit
         - directory: The absolute path to the directory where the pyfbsdk stub file should be created
         - file_extension: The file extension
         - copy_additional_stubs: If True, additional manually typed stubs will be copied to the output directory. These include e.g. callbackframework.pyi, pyfbsdk_additions.pyi, etc.
+        - version: The MotionBuilder version the modules belong to, defaults to the version of the running MotionBuilder
+        - snapshot_directory: If set, an introspection snapshot of each module is saved to this directory, see `snapshot.py`
+        - jobs: Number of worker threads used by threaded plugins, defaults to a value based on the CPU count
+        - profile_filepath: If set, a JSON report with the timings & counters of each stage is written to this file, see `profiling.py`
 
     ## Returns:
     The filepath to the generated file 
     """
-    from . import stub_generator, manual_stubs
+    from . import stub_generator, manual_stubs, snapshot
+    from .profiling import RunProfile
 
     if modules is None:
+        import pyfbsdk
         import pyfbusd
         modules = [pyfbsdk, pyfbusd]
 
+    if version is None:
+        version = stub_generator.get_motionbuilder_version()
+
+    run_profile = RunProfile() if profile_filepath else None
+    if run_profile:
+        run_profile.start()
+
     out_files: list[str] = []
     for module in modules:
-        out_files.append(stub_generator.generate_stub_file(module, directory, flags))
+        if snapshot_directory:
+            snapshot.save_snapshot(module, snapshot_directory, version)
+
+        module_profile = run_profile.add_module(module.__name__) if run_profile else None
+        out_files.append(stub_generator.generate_stub_file(module, directory, flags, version, jobs, module_profile))
+
+    if run_profile and profile_filepath:
+        run_profile.stop()
+        run_profile.write_json(profile_filepath)
+        print(run_profile.summary())
 
     if copy_additional_stubs:
-        manual_stubs.copy_manual_stubs(directory)
+        manual_stubs.copy_manual_stubs(directory, version)
 
     return out_files
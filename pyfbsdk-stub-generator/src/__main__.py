@@ -2,14 +2,8 @@ import argparse
 import os
 
 
-try:
-    import pyfbstandalone
-except ModuleNotFoundError:
-    raise RuntimeError("This module must run in the mobupy.exe interpreter")
-
-
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate stubs for MotionBuilder Python API. This module must run in the mobupy interpreter")
+    parser = argparse.ArgumentParser(description="Generate stubs for MotionBuilder Python API. This module must run in the mobupy interpreter, unless --replay is used")
 
     parser.add_argument("out_dir", type=str, help="Output directory for the generated stubs")
     parser.add_argument(
@@ -17,22 +11,88 @@ def main() -> None:
         action="store_true",
         help="Cache downloaded documentation to disk"
     )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        metavar="DIR",
+        help="Save an introspection snapshot of each module to DIR, that can later be used with --replay"
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        metavar="DIR",
+        help="Generate the stubs from the snapshots in DIR instead of the live modules, does not require mobupy"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of worker threads used when fetching & parsing the online documentation, defaults to a value based on the CPU count"
+    )
+
+    parser.add_argument(
+        "--fuse-plugins",
+        action="store_true",
+        help="Run plugins with the same priority in a single pass over the module, instead of one pass per plugin"
+    )
+    parser.add_argument(
+        "--concurrent-plugins",
+        action="store_true",
+        help="Run plugins that don't read or write the same parts of the stubs at the same time"
+    )
+    parser.add_argument(
+        "--verify-plugins",
+        action="store_true",
+        help="Debug mode, raise an error if a plugin changes parts of the stubs it doesn't declare. Slows down the generation"
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        metavar="FILE",
+        help="Write a JSON report with the time spent in each stage of the generation to FILE, and print a summary"
+    )
 
     args = parser.parse_args()
 
-    output_path = os.path.abspath(args.out_dir)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    # Initialize pyfbsdk before importing any other modules that depend on it
-    pyfbstandalone.initialize()
+    output_path = os.path.abspath(args.out_dir)
+    profile_path = os.path.abspath(args.profile) if args.profile else None
 
     from .flags import GeneratorFlag
 
     flags = GeneratorFlag.NONE
     if args.cache:
         flags |= GeneratorFlag.CACHE
+    if args.fuse_plugins:
+        flags |= GeneratorFlag.FUSE_PLUGINS
+    if args.concurrent_plugins:
+        flags |= GeneratorFlag.CONCURRENT_PLUGINS
+    if args.verify_plugins:
+        flags |= GeneratorFlag.VERIFY_PLUGINS
+
+    if args.replay:
+        from .snapshot import load_snapshots
+
+        # The stand-in modules are registered in sys.modules, so they must be loaded before anything imports pyfbsdk
+        snapshots = load_snapshots(args.replay)
+
+        from . import generate
+        generate(output_path, [x.module for x in snapshots], flags=flags, version=snapshots[0].version, jobs=args.jobs, profile_filepath=profile_path)
+        return
+
+    try:
+        import pyfbstandalone
+    except ModuleNotFoundError:
+        raise RuntimeError("This module must run in the mobupy.exe interpreter")
+
+    # Initialize pyfbsdk before importing any other modules that depend on it
+    pyfbstandalone.initialize()
 
     from . import generate
-    generate(output_path, flags=flags)
+    generate(output_path, flags=flags, snapshot_directory=args.snapshot, jobs=args.jobs, profile_filepath=profile_path)
 
 
 if __name__ == "__main__":
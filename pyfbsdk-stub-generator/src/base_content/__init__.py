@@ -1,37 +1,26 @@
 from types import ModuleType
 from pathlib import Path
 
-import pyfbsdk
-
-# -------------------------------------------------------------
-#                       Helper Functions
-# -------------------------------------------------------------
-
-def get_motionbuilder_version() -> int:
-    """ Get the current version of MotionBuilder """
-    return int(2000 + pyfbsdk.FBSystem().Version / 1000)
-
-
 # -------------------------------------------------------------
 #                       Functions
 # -------------------------------------------------------------
 
-def replace_docstring_variables(string: str) -> str:
+def replace_docstring_variables(string: str, version: int) -> str:
     """
     Insert variables into the string, e.g. {MOTIONBUILDER_VERSION}
     """
-    string = string.replace("{MOTIONBUILDER_VERSION}", str(get_motionbuilder_version()))
+    string = string.replace("{MOTIONBUILDER_VERSION}", str(version))
 
     return string
 
 
-def get_base_content(module: ModuleType) -> str:
+def get_base_content(module: ModuleType, version: int) -> str:
     filepath = Path(__file__).parent / f"{module.__name__}.pyi"
 
     if not filepath.is_file():
         return ""
 
     content = filepath.read_text(encoding="utf-8").strip() + "\n"
-    content = replace_docstring_variables(content)
+    content = replace_docstring_variables(content, version)
 
     return content
\ No newline at end of file
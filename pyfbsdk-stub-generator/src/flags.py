@@ -2,4 +2,7 @@ import enum
 
 class GeneratorFlag(enum.Flag):
     NONE = 0
-    CACHE = enum.auto()
\ No newline at end of file
+    CACHE = enum.auto()
+    FUSE_PLUGINS = enum.auto()  # Run plugins with the same priority in a single pass, see `plugins.plugin_tiers`
+    CONCURRENT_PLUGINS = enum.auto()  # Run plugins that don't conflict at the same time, see `plugins.plugin_scheduler`
+    VERIFY_PLUGINS = enum.auto()  # Debug mode, make sure plugins only change what they declare in WRITES
@@ -1,14 +1,7 @@
-import pyfbsdk
-
 import os
 
 
-def get_motionbuilder_version() -> int:
-    """ Get the current version of MotionBuilder """
-    return int(2000 + pyfbsdk.FBSystem().Version / 1000)
-
-
-def copy_manual_stubs(out_directory: str):
+def copy_manual_stubs(out_directory: str, version: int):
     """
     Copy the additional stubs to the output directory.
     This includes e.g. callbackframework.pyi, pyfbsdk_additions.pyi, etc.
@@ -17,6 +10,7 @@ def copy_manual_stubs(out_directory: str):
 
     ## Parameters:
         - out_directory: The directory where the additional stubs should be copied    
+        - version: The MotionBuilder version, inserted into the stubs
     """
     os.makedirs(out_directory, exist_ok=True)
 
@@ -27,7 +21,7 @@ def copy_manual_stubs(out_directory: str):
 
             with open(src_file, "r") as f:
                 content = f.read()
-                content = content.replace("{MOTIONBUILDER_VERSION}", str(get_motionbuilder_version()))
+                content = content.replace("{MOTIONBUILDER_VERSION}", str(version))
 
                 with open(dst_file, "w") as f:
                     f.write(content)
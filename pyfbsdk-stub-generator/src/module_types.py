@@ -18,13 +18,31 @@ def indent(text: str) -> str:
     return "\n".join(lines)
 
 
+def append_indented(buffer: list[str], text: str, indent_level: int = 0):
+    """
+    Append text to a buffer with each line indented, same as calling `indent()` `indent_level` times.
+    """
+    prefix = TAB_CHARACTER * indent_level
+    for index, line in enumerate(text.splitlines()):
+        if index:
+            buffer.append("\n")
+        if line.strip():
+            buffer.append(prefix)
+            buffer.append(line)
+
+
 class StubBase:
+    # A module creates hundreds of thousands of stub objects, slots keeps them small
+    __slots__ = ("ref", "name", "docstring", "deprecation_message", "_requirements")
+
     def __init__(self, ref: object, name: str = "") -> None:
         self.ref = ref
         self.name: str = name
         self.docstring = ""
         self.deprecation_message: str | None = None
 
+        self._requirements: tuple[str, ...] | None = None  # Cached requirements, None when they need to be collected again
+
     def __copy__(self):
         new_instance = self.__class__(self.ref, name=self.name)
         new_instance.docstring = self.docstring
@@ -39,6 +57,29 @@ class StubBase:
         """
         raise NotImplementedError("as_string() has not yet been implemented")
 
+    def render(self, buffer: list[str], indent_level: int = 0):
+        """
+        Append the instance as python code to a buffer, without a trailing new line.
+        Gives the same result as indenting `as_string()`, but each part of the text is only created once.
+
+        ### Parameters:
+            - buffer: The list of strings to append to, shared by the object and all of its members
+            - indent_level: Number of tabs each line should be indented with
+        """
+        append_indented(buffer, self.as_string(), indent_level)
+
+    def write_to(self, stream: typing.TextIO, indent_level: int = 0):
+        """
+        Write the instance as python code to a stream, without a trailing new line
+
+        ### Parameters:
+            - stream: The stream to write to, e.g. an open file
+            - indent_level: Number of tabs each line should be indented with
+        """
+        buffer: list[str] = []
+        self.render(buffer, indent_level)
+        stream.writelines(buffer)
+
     def get_doc_string(self) -> str:
         if self.docstring:
             # Strip each line of unnecessary whitespace
@@ -49,10 +90,28 @@ class StubBase:
             return f'\"""{docstring.strip()}"""'
         return ""
 
+    @property
+    def requirements(self) -> tuple[str, ...]:
+        """
+        The variable/class names that needs to be declared before the current object, without duplicates.
+        Cached until the parents, parameters or default values they're based on are changed.
+        """
+        requirements = self._requirements
+        if requirements is None:
+            requirements = self._requirements = tuple(dict.fromkeys(self._collect_requirements()))
+        return requirements
+
+    def invalidate_requirements(self):
+        """ Mark the cached requirements as dirty, they'll be collected again the next time they're needed """
+        self._requirements = None
+
     def get_requirements(self) -> list:
         """
         Get a list of variable/class names that needs to be declared before the current object
         """
+        return list(self.requirements)
+
+    def _collect_requirements(self) -> list[str]:
         raise NotImplementedError("get_requirements() has not yet been implemented")
 
     def get_deprecation_decorator(self):
@@ -61,16 +120,24 @@ class StubBase:
 
 
 class StubFunction(StubBase):
+    __slots__ = ("_params", "_return_type", "is_method", "is_static", "owner")
+
     def __init__(self, ref: typing.Callable, name: str = "", parameters: list[StubParameter] | None = None, ReturnType: str | None = None):
         super().__init__(ref, name=name)
+        self.owner: StubClass | None = None  # The class the function is a method of
         self._params: list[StubParameter] = parameters if parameters else []
         self._return_type = ReturnType
         self.is_method = False
         self.is_static = False
 
+        for stub_parameter in self._params:
+            stub_parameter.owner = self
+
     def __copy__(self):
         new_instance = super().__copy__()
         new_instance._params = [copy.copy(x) for x in self._params]
+        for stub_parameter in new_instance._params:
+            stub_parameter.owner = new_instance
         new_instance._return_type = self._return_type
         new_instance.is_method = self.is_method
         new_instance.is_static = self.is_static
@@ -87,7 +154,9 @@ class StubFunction(StubBase):
         self._return_type = Value
 
     def add_parameter(self, stub_parameter: StubParameter):
+        stub_parameter.owner = self
         self._params.append(stub_parameter)
+        self.invalidate_requirements()
 
     def get_parameters(self, exclude_self=False) -> list[StubParameter]:
         """
@@ -103,13 +172,17 @@ class StubFunction(StubBase):
     def set_parameter(self, Index: int, Parameter: StubParameter):
         if Index > len(self._params) - 1:
             raise IndexError("given parameter index is larger than the size of the parameter array")
+        Parameter.owner = self
         self._params[Index] = Parameter
+        self.invalidate_requirements()
 
-    def get_requirements(self) -> list:
-        return_value = []
-        for stub_parameter in self._params:
-            return_value += stub_parameter.get_requirements()
-        return return_value
+    def invalidate_requirements(self):
+        super().invalidate_requirements()
+        if self.owner is not None:
+            self.owner.invalidate_requirements()
+
+    def _collect_requirements(self) -> list[str]:
+        return [x for stub_parameter in self._params for x in stub_parameter.requirements]
 
     def get_parameters_as_string(self):
         parameters_as_strings: list[str] = []
@@ -152,8 +225,40 @@ class StubFunction(StubBase):
 
         return function_as_string
 
+    def render(self, buffer: list[str], indent_level: int = 0, is_overload=False):
+        prefix = TAB_CHARACTER * indent_level
+        if is_overload:
+            buffer += (prefix, "@overload\n")
+        if self.is_static:
+            buffer += (prefix, "@staticmethod\n")
+        if self.deprecation_message is not None:
+            append_indented(buffer, self.get_deprecation_decorator(), indent_level)
+            buffer.append("\n")
+
+        buffer += (prefix, f"def {self.name}({self.get_parameters_as_string()})")
+
+        if not (self.name.startswith("__") and self.return_type == "None"):
+            buffer.append(f"->{self.return_type}")
+
+        buffer.append(":")
+
+        if docstring := self.get_doc_string():
+            buffer.append("\n")
+            append_indented(buffer, docstring, indent_level + 1)
+            if ALWAYS_CREATE_ELLIPSIS:
+                buffer += ("\n", prefix, TAB_CHARACTER, "...")
+        else:
+            buffer.append("...")
+
+    def write_to(self, stream: typing.TextIO, indent_level: int = 0, is_overload=False):
+        buffer: list[str] = []
+        self.render(buffer, indent_level, is_overload)
+        stream.writelines(buffer)
+
 
 class StubClass(StubBase):
+    __slots__ = ("parents", "stub_properties", "stub_enums", "stub_functions", "_function_index", "_property_index")
+
     def __init__(self, ref: type, name=""):
         super().__init__(ref, name=name)
         self.parents: list[str] = []
@@ -161,16 +266,15 @@ class StubClass(StubBase):
         self.stub_enums: list[StubClass] = []
         self.stub_functions: list[list[StubFunction]] = []
 
+        # Name lookups, kept in sync by the add/remove/rename methods
+        self._function_index: dict[str, list[StubFunction]] = {}
+        self._property_index: dict[str, StubProperty] = {}
+
     def get_functions_by_name(self, name: str) -> list[StubFunction]:
-        for function_group in self.stub_functions:
-            if function_group[0].name == name:
-                return function_group
-        return []
+        return self._function_index.get(name, [])
 
     def get_property_by_name(self, name: str):
-        for x in self.stub_properties:
-            if x.name == name:
-                return x
+        return self._property_index.get(name)
 
     def add_enum(self, stub_enum: StubClass):
         self.stub_enums.append(stub_enum)
@@ -178,23 +282,101 @@ class StubClass(StubBase):
     def add_functions(self, stub_functions: list[StubFunction]):
         for function in stub_functions:
             function.is_method = True  # Make function a method
+            function.owner = self
         self.stub_functions.append(stub_functions)
+        self.invalidate_requirements()
+
+        if stub_functions:
+            self._function_index.setdefault(stub_functions[0].name, stub_functions)
+
+    def add_overload(self, stub_functions: list[StubFunction], stub_function: StubFunction):
+        """ Add a function to one of the function groups of the class """
+        stub_function.is_method = True
+        stub_function.owner = self
+        stub_functions.append(stub_function)
+        self.invalidate_requirements()
+
+    def remove_functions(self, stub_functions: list[StubFunction]):
+        """ Remove a function group from the class """
+        for index, function_group in enumerate(self.stub_functions):
+            if function_group is stub_functions:
+                del self.stub_functions[index]
+                break
+        else:
+            raise ValueError(f"Function group {stub_functions} is not part of {self.name}")
+
+        for function in stub_functions:
+            function.owner = None
+        self.invalidate_requirements()
+
+        if stub_functions:
+            self._reindex_functions(stub_functions[0].name)
+
+    def rename_functions(self, stub_functions: list[StubFunction], name: str):
+        """ Rename all functions in a function group """
+        old_name = stub_functions[0].name if stub_functions else None
+        for stub_function in stub_functions:
+            stub_function.name = name
+
+        if old_name is not None:
+            self._reindex_functions(old_name)
+            self._reindex_functions(name)
 
     def add_property(self, Property: StubProperty):
         self.stub_properties.append(Property)
+        self._property_index.setdefault(Property.name, Property)
+
+    def remove_property(self, stub_property: StubProperty):
+        """ Remove a property from the class """
+        for index, x in enumerate(self.stub_properties):
+            if x is stub_property:
+                del self.stub_properties[index]
+                break
+        else:
+            raise ValueError(f"Property {stub_property} is not part of {self.name}")
+
+        self._reindex_property(stub_property.name)
+
+    def rename_property(self, stub_property: StubProperty, name: str):
+        old_name = stub_property.name
+        stub_property.name = name
+
+        self._reindex_property(old_name)
+        self._reindex_property(name)
+
+    def _reindex_functions(self, name: str):
+        """ Point the name to the first function group with that name, same as a linear search would """
+        self._function_index.pop(name, None)
+        for function_group in self.stub_functions:
+            if function_group and function_group[0].name == name:
+                self._function_index[name] = function_group
+                break
+
+    def _reindex_property(self, name: str):
+        self._property_index.pop(name, None)
+        for stub_property in self.stub_properties:
+            if stub_property.name == name:
+                self._property_index[name] = stub_property
+                break
 
     def add_parent(self, Parent: str):
         self.parents.append(Parent)
+        self.invalidate_requirements()
+
+    def set_parent(self, index: int, parent: str):
+        """ Replace one of the parents, e.g. with the name of the module included """
+        self.parents[index] = parent
+        self.invalidate_requirements()
 
     def get_stub_properties(self) -> list[StubProperty]:
         return self.stub_properties
 
-    def get_requirements(self) -> list:
+    def _collect_requirements(self) -> list[str]:
         # The class parent's needs to be declared before the class
         requirements: list[str] = []
         flat_stub_function_list = [x for FunctionGroup in self.stub_functions for x in FunctionGroup]
         for stub_function in flat_stub_function_list:
-            requirements += stub_function.get_requirements()
+            requirements += stub_function.requirements
 
         return self.parents + requirements
 
@@ -227,8 +409,41 @@ class StubClass(StubBase):
 
         return class_as_str.strip()
 
+    def render(self, buffer: list[str], indent_level: int = 0):
+        prefix = TAB_CHARACTER * indent_level
+
+        if self.deprecation_message is not None:
+            append_indented(buffer, self.get_deprecation_decorator(), indent_level)
+            buffer.append("\n")
+
+        parent_classes_as_str = ','.join(self.parents)
+        if parent_classes_as_str:
+            parent_classes_as_str = f"({parent_classes_as_str})"
+
+        buffer.append(f"{prefix}class {self.name}{parent_classes_as_str}:")
+
+        if docstring := self.get_doc_string():
+            buffer.append("\n")
+            append_indented(buffer, docstring, indent_level + 1)
+
+        for stub_object in self.stub_enums + self.stub_properties:
+            buffer.append("\n")
+            stub_object.render(buffer, indent_level + 1)
+
+        sorted_functions = sorted(self.stub_functions, key=lambda x: (x[0].name != '__init__', x[0].name))
+        for stub_functions in sorted_functions:
+            overload = len(stub_functions) > 1
+            for stub_func in stub_functions:
+                buffer.append("\n")
+                stub_func.render(buffer, indent_level + 1, overload)
+
+        if not any((self.stub_properties, self.stub_enums, self.stub_functions)):
+            buffer += ("\n", prefix, TAB_CHARACTER, "...")
+
 
 class StubProperty(StubBase):
+    __slots__ = ("_type", "setter_type", "value", "read_only")
+
     def __init__(self, ref: object, name=""):
         super().__init__(ref, name=name)
         self._type = None
@@ -295,11 +510,62 @@ class StubProperty(StubBase):
 
         return property_as_string
 
+    def render(self, buffer: list[str], indent_level: int = 0):
+        create_setter = bool(self.setter_type) and self.setter_type != self.Type
+        create_getter = self.read_only or create_setter
+
+        is_deprecated = self.deprecation_message is not None
+        if is_deprecated:
+            create_getter = True
+            create_setter = not self.read_only
+
+        docstring = self.get_doc_string()
+
+        if not create_getter:
+            property_as_string = self.name
+            if self._type or self.value is None:
+                property_as_string += f":{self.Type}"
+            if self.value is not None:
+                property_as_string += f"={self.value}"
+
+            append_indented(buffer, property_as_string, indent_level)
+            if docstring:
+                buffer.append("\n")
+                append_indented(buffer, docstring, indent_level)
+            return
+
+        # If it has a custom setter type, create seperate getter and setter functions
+        prefix = TAB_CHARACTER * indent_level
+        buffer += (prefix, "@property\n")
+        if is_deprecated:
+            append_indented(buffer, self.get_deprecation_decorator().rstrip(), indent_level)
+            buffer.append("\n")
+
+        buffer.append(f"{prefix}def {self.name}(self)->{self.Type}:")
+
+        if docstring:
+            buffer.append("\n")
+            append_indented(buffer, docstring, indent_level + 1)
+            buffer += ("\n", prefix, TAB_CHARACTER, "...")
+        else:
+            buffer.append("...")
+
+        if create_setter:
+            setter_type = self.setter_type or self.Type
+            buffer.append(f"\n{prefix}@{self.name}.setter")
+            if is_deprecated:
+                buffer.append("\n")
+                append_indented(buffer, self.get_deprecation_decorator().rstrip(), indent_level)
+            buffer.append(f"\n{prefix}def {self.name}(self, Value: {setter_type}):...")
+
 
 class StubParameter(StubBase):
+    __slots__ = ("_default_value", "_type", "owner")
+
     def __init__(self, ref: object, name="", _type: str | None = "", default_value=None):
         super().__init__(ref, name=name)
-        self.default_value = default_value
+        self.owner: StubFunction | None = None  # The function the parameter belongs to
+        self._default_value: str | None = default_value
         self._type = _type
 
     def __copy__(self):
@@ -319,7 +585,22 @@ class StubParameter(StubBase):
     def Type(self, Value: str | None):
         self._type = Value
 
-    def get_requirements(self):
+    @property
+    def default_value(self) -> str | None:
+        return self._default_value
+
+    @default_value.setter
+    def default_value(self, Value: str | None):
+        if Value != self._default_value:
+            self._default_value = Value
+            self.invalidate_requirements()
+
+    def invalidate_requirements(self):
+        super().invalidate_requirements()
+        if self.owner is not None:
+            self.owner.invalidate_requirements()
+
+    def _collect_requirements(self) -> list[str]:
         if self.default_value and self.default_value.startswith("FB"):
             requirement_cls: str = self.default_value
             for char in ".(":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import typing
 import types
@@ -7,6 +8,7 @@ import enum
 
 from types import ModuleType
 
+from . import signature_parser
 from .module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 import pyfbsdk as fb
@@ -17,6 +19,7 @@ ALLOWED_BUILTIN_OVERRIDES = {"__gt__", "__lt__", "__ge__", "__le__"}
 ALLOWED_CLASS_OVERRIDES = [
     fb.FBEvent.Type,
 ]
+ALLOWED_CLASS_OVERRIDE_IDS = {id(x) for x in ALLOWED_CLASS_OVERRIDES}
 
 
 class EObjectType(enum.StrEnum):
@@ -39,6 +42,15 @@ def get_object_type(obj: type) -> str:
     return get_object_name(type(obj))
 
 
+@functools.cache
+def get_type_kind(object_type: type) -> EObjectType | None:
+    """ Get what kind of object instances of a type are, cached per type """
+    try:
+        return EObjectType(get_object_name(object_type))
+    except ValueError:
+        return None
+
+
 def is_private(obj: type) -> bool:
     """ Check if the name of an object begins with a underscore """
     return get_object_name(obj).startswith("_")
@@ -58,25 +70,78 @@ def get_class_parents(cls: type):
     return cls.__bases__
 
 
-def get_unique_class_members(cls: type, ignore: tuple[str, ...] = (), allowed_overrides: tuple[str, ...] = ()):
-    members = inspect.getmembers(cls)
+class ClassAttributes(typing.NamedTuple):
+    names: frozenset[str]  # Names of all attributes, defined by the class or inherited, same as `dir(cls)`
+    allowed_override_names: frozenset[str]  # Names of the attributes that are in ALLOWED_CLASS_OVERRIDES
+
+
+# The attributes of each class indexed so far, only kept for the module being generated
+ClassAttributeIndex = dict[type, ClassAttributes]
+
+
+def get_class_attributes(cls: type, attribute_index: ClassAttributeIndex) -> ClassAttributes:
+    """
+    Index the attribute names of a class along the MRO, from the class' own __dict__ & the index of its parents.
+    Each class' __dict__ is only walked once per `attribute_index`, no matter how many classes inherit from it.
+    """
+    attributes = attribute_index.get(cls)
+    if attributes is not None:
+        return attributes
+
+    own_members = vars(cls)
+    names = set(own_members)
+    allowed_override_names = {name for name, value in own_members.items() if id(value) in ALLOWED_CLASS_OVERRIDE_IDS}
+    for parent_cls in get_class_parents(cls):
+        parent_attributes = get_class_attributes(parent_cls, attribute_index)
+        names |= parent_attributes.names
+        allowed_override_names |= parent_attributes.allowed_override_names
+
+    attributes = attribute_index[cls] = ClassAttributes(frozenset(names), frozenset(allowed_override_names))
+    return attributes
+
+
+def get_unique_class_members(cls: type,
+                             ignore: tuple[str, ...] = (),
+                             allowed_overrides: tuple[str, ...] = (),
+                             attribute_index: ClassAttributeIndex | None = None):
+    """
+    Get the members of a class that are not inherited from its first parent, sorted by name.
+
+    Members that exist on the parent are still included if they're in `allowed_overrides`, if the parent's member
+    is in ALLOWED_CLASS_OVERRIDES, or if they're a builtin in ALLOWED_BUILTIN_OVERRIDES overriding the Boost.Python instance.
+
+    Args:
+        - attribute_index: The attributes of the classes indexed so far, shared by all classes of a module
+    """
+    if attribute_index is None:
+        attribute_index = {}
+
     parent_cls = get_class_parents(cls)[0]
+    class_names = get_class_attributes(cls, attribute_index).names
+    parent_attributes = get_class_attributes(parent_cls, attribute_index)
 
-    unique_members = []
-    for name, ref in members:
-        if name in ignore:
-            continue
+    # Members the parent doesn't have, from the class itself or any of its other parents
+    unique_names = {x for x in vars(cls) if x not in parent_attributes.names}
+    for other_parent_cls in get_class_parents(cls)[1:]:
+        unique_names |= get_class_attributes(other_parent_cls, attribute_index).names - parent_attributes.names
 
-        if hasattr(parent_cls, name):
-            if parent_cls.__name__ == "instance":
-                if isinstance(ref, (types.BuiltinFunctionType, types.BuiltinMethodType)) and name in ALLOWED_BUILTIN_OVERRIDES:
-                    unique_members.append((name, ref))
-                    continue
+    # The parent can also have attributes through its metaclass
+    metaclass_names = get_class_attributes(type(parent_cls), attribute_index).names
+    unique_names = {x for x in unique_names if x not in metaclass_names or not hasattr(parent_cls, x)}
 
-            if name not in allowed_overrides and getattr(parent_cls, name) not in ALLOWED_CLASS_OVERRIDES:
-                continue
+    # Members of the parent that the class is allowed to override
+    unique_names |= class_names.intersection(allowed_overrides)
+    unique_names |= {x for x in parent_attributes.allowed_override_names & class_names if getattr(parent_cls, x) in ALLOWED_CLASS_OVERRIDES}
+    if parent_cls.__name__ == "instance":
+        unique_names |= {x for x in ALLOWED_BUILTIN_OVERRIDES & class_names
+                         if isinstance(getattr(cls, x, None), (types.BuiltinFunctionType, types.BuiltinMethodType))}
 
-        unique_members.append((name, ref))
+    unique_members = []
+    for name in sorted(unique_names.difference(ignore)):
+        try:
+            unique_members.append((name, getattr(cls, name)))
+        except AttributeError:
+            continue
 
     return unique_members
 
@@ -106,53 +171,11 @@ def get_function_info_from_doc_string(function: typing.Callable) -> list[tuple[l
     if not function.__doc__:  # Return an empty list if the function has no docstring
         return []
 
-    def _generate_parameters(param_str: str, default_value = None) -> list[StubParameter]:
-        """ 
-        Parse a param string that looks something like this:
-        "(FBVector4d)arg1, (FBVector4d)arg2, (FBVector4d)arg3"
-        and generate StubParameter instances from it
-        """
-        params: list[StubParameter] = []
-        for param in param_str.split(","):
-            # Param will now look something like this: '(str)arg1'
-            param_type, _, param_name = param.strip().partition(")")
-            parameter_instance = StubParameter(function, param_name, param_type[1:], default_value = default_value)
-            params.append(parameter_instance)
-
-        return params
-
-    parameters = []
-
-    # Read the docstring and split it up if there are multiple function overrides
-    function_docs = [x for x in function.__doc__.split("\n") if x]
-    for docstring in function_docs:
-        # Make sure `docstring` now follows this format: "FunctionName( (str)arg1 [, (object)arg2]) -> object"
-        if not docstring.strip().startswith(function.__name__) or not all(x in docstring for x in ["->", "(", ")"]):
-            continue
-
-        # 'docstring' will now look something like this:
-        # ShowToolByName( (str)arg1 [, (object)arg2]) -> object
-        docstring = docstring.partition("(")[2]  # Remove function name
-        params, _, return_type = docstring.rpartition("->")
-
-        return_type = return_type.strip(" :")
-
-        # Split params into required & optional
-        params = params.rpartition(")")[0]
-        required_params, _, optional_params = params.partition("[")
-        optional_params = optional_params.replace("[", "").replace("]", "").lstrip(',')
-
-        params = []
-        if required_params.strip():
-            params += _generate_parameters(required_params)
-        if optional_params.strip():
-            params += _generate_parameters(optional_params, default_value = "None")
-
-        parameters.append(
-            (params, return_type.strip())
-        )
-
-    return parameters
+    # The parsed signatures are shared between functions with the same docstring, create new parameters from them
+    return [
+        ([StubParameter(function, x.name, x.type, default_value=x.default_value) for x in signature.parameters], signature.return_type)
+        for signature in signature_parser.parse_docstring(function.__name__, function.__doc__)
+    ]
 
 
 # -------------------------------------------------------------
@@ -160,20 +183,21 @@ def get_function_info_from_doc_string(function: typing.Callable) -> list[tuple[l
 # -------------------------------------------------------------
 
 
-def generate_enum_instance(cls: type, parent_cls = None):
+def generate_enum_instance(cls: type, parent_cls = None, attribute_index: ClassAttributeIndex | None = None):
     """
     Generate a StubClass instance from a class (enum) reference
 
     Args:
         - Class: reference to the class
         - ParentClass: If this class is a subclass, the parent class should be passed along
+        - attribute_index: The attributes of the classes indexed so far, see `get_unique_class_members`
     """
     # Create the stub instance
     cls_name = get_object_name(cls)
     stub_enum = StubClass(cls, cls_name)
 
     # Get all members and generate stub properties of them
-    cls_members = get_unique_class_members(cls, ignore = ("__init__", "__slots__", "names", "values"))
+    cls_members = get_unique_class_members(cls, ignore = ("__init__", "__slots__", "names", "values"), attribute_index = attribute_index)
 
     for name, ref in cls_members:
         stub_property = StubProperty(ref, name)
@@ -189,12 +213,13 @@ def generate_enum_instance(cls: type, parent_cls = None):
     return stub_enum
 
 
-def generate_class_instance(cls: type) -> StubClass:
+def generate_class_instance(cls: type, attribute_index: ClassAttributeIndex | None = None) -> StubClass:
     """
     Generate a StubClass instance from a class reference
 
     Args:
         - Class {class}: reference to the class
+        - attribute_index: The attributes of the classes indexed so far, see `get_unique_class_members`
     """
     # Create the stub instance
     cls_name = get_object_name(cls)
@@ -211,7 +236,8 @@ def generate_class_instance(cls: type) -> StubClass:
                                                                 "pop",
                                                                 "insert",
                                                                 "append",
-                                                                "count")
+                                                                "count"),
+                                           attribute_index = attribute_index
                                            )
 
     cls_member_names = [x for x, y in cls_members]
@@ -228,7 +254,7 @@ def generate_class_instance(cls: type) -> StubClass:
             stub_class.add_functions(methods)
 
         elif type_str == EObjectType.ENUM:
-            stub_enum = generate_enum_instance(member_reference, parent_cls = cls)
+            stub_enum = generate_enum_instance(member_reference, parent_cls = cls, attribute_index = attribute_index)
             stub_class.add_enum(stub_enum)
 
         elif member_name not in ["__init__"]:
@@ -284,24 +310,40 @@ class ModuleStubs(typing.NamedTuple):
     function_groups: list[list[StubFunction]]
 
 
-def get_module_content(module: ModuleType) -> RawModuleContent:
+def get_module_content(module: ModuleType, sort: bool = True) -> RawModuleContent:
     """
-    Get all members in the given module
-    returns: a ModuleContent named tuple with (functions, classes, enums)
-    """
-    members = inspect.getmembers(module)
-    functions = [x[1] for x in members if get_object_type(x[1]) == EObjectType.FUNCTION and not is_private(x[1])]
-    classes = [x[1] for x in members if get_object_type(x[1]) == EObjectType.CLASS]
-    enums = [x[1] for x in members if get_object_type(x[1]) == EObjectType.ENUM]
-
-    return RawModuleContent(enums=enums, classes=classes, functions=functions)
+    Get all members in the given module, in a single pass over the module's namespace
 
+    Args:
+        - sort: Sort the members by name (same as `inspect.getmembers`), otherwise they're in the order they were declared
 
-def generate_module_stubs(module: ModuleType) -> ModuleStubs:
-    content = get_module_content(module)
-
-    enum_stubs = [generate_enum_instance(x) for x in content.enums]
-    class_stubs = [generate_class_instance(x) for x in content.classes]
-    function_stubs = [generate_function_instances(x) for x in content.functions]
+    returns: a ModuleContent named tuple with (functions, classes, enums)
+    """
+    buckets: dict[EObjectType, list[tuple[str, type]]] = {EObjectType.FUNCTION: [], EObjectType.CLASS: [], EObjectType.ENUM: []}
+    for name, member in vars(module).items():
+        kind = get_type_kind(type(member))
+        if kind in buckets:
+            buckets[kind].append((name, member))
+
+    if sort:
+        for bucket in buckets.values():
+            bucket.sort(key=lambda x: x[0])
+
+    return RawModuleContent(enums=[x for _, x in buckets[EObjectType.ENUM]],
+                            classes=[x for _, x in buckets[EObjectType.CLASS]],
+                            functions=[x for _, x in buckets[EObjectType.FUNCTION] if not is_private(x)])
+
+
+def generate_module_stubs(module: ModuleType, sort: bool = True) -> ModuleStubs:
+    content = get_module_content(module, sort=sort)
+
+    attribute_index: ClassAttributeIndex = {}  # Shared by all classes in the module, released once the stubs are generated
+    try:
+        enum_stubs = [generate_enum_instance(x, attribute_index=attribute_index) for x in content.enums]
+        class_stubs = [generate_class_instance(x, attribute_index=attribute_index) for x in content.classes]
+        function_stubs = [generate_function_instances(x) for x in content.functions]
+    finally:
+        # The docstrings of the next module are different, don't keep this module's signatures alive
+        signature_parser.parse_docstring.cache_clear()
 
     return ModuleStubs(enums=enum_stubs, classes=class_stubs, function_groups=function_stubs)
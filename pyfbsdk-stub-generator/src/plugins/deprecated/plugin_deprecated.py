@@ -3,7 +3,7 @@ Plugin for marking classes, functions, and properties as deprecated
 """
 from __future__ import annotations
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 
 
 def is_deprecated(docstring: str) -> bool:
@@ -25,6 +25,9 @@ def extract_deprecation_message(docstring: str) -> str:
 
 
 class PluginDeprecated(PluginBaseClass):
+    READS = ModelPart.DOCSTRINGS | ModelPart.CLASS_MEMBERS
+    WRITES = ModelPart.DEPRECATION
+
     def patch_class(self, stub_class):
         super().patch_class(stub_class)
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 from ...module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 
@@ -26,6 +26,8 @@ KNOWN_RETURN_TYPES: dict[str, type] = {
 
 class PluginDunderMethods(PluginBaseClass):
     PRIORITY = 200
+    READS = ModelPart.CLASS_MEMBERS | ModelPart.FUNCTION_SIGNATURES
+    WRITES = ModelPart.CLASS_MEMBERS | ModelPart.FUNCTION_SIGNATURES
 
     def patch_class(self, stub_class: StubClass):
         for stub_functions in stub_class.stub_functions:
@@ -52,7 +54,7 @@ class PluginDunderMethods(PluginBaseClass):
             # class is not iterable & not compatible with the typing.Iterable protocol.
             if stub_functions[0].name == "__getitem__":
                 # Make sure we don't add __iter__ twice:
-                if not any(x[0].name == "__iter__" for x in stub_class.stub_functions if x):
+                if not stub_class.get_functions_by_name("__iter__"):
                     return_type = f"Iterator[{stub_functions[0].return_type}]"
                     stub_function = StubFunction(None, "__iter__", [StubParameter(None, "self")], return_type)
                     stub_class.add_functions([stub_function])
@@ -4,12 +4,14 @@ And remove the type of the Enum properties, to make them act like a `Literal[enu
 """
 from __future__ import annotations
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 from ...module_types import StubClass
 
 
 class PluginEnum(PluginBaseClass):
     PRIORITY = 100
+    READS = ModelPart.NONE
+    WRITES = ModelPart.ENUM_VALUES
 
     def patch_enum(self, stub_enum: StubClass):
         for stub_property in stub_enum.get_stub_properties():
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import pyfbsdk as fb
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 from ...module_types import StubClass
 
 
@@ -71,6 +71,8 @@ EVENTS = {
 
 class PluginEvents(PluginBaseClass):
     PRIORITY = 100
+    READS = ModelPart.CLASS_MEMBERS | ModelPart.CLASS_PARENTS | ModelPart.PROPERTY_TYPES
+    WRITES = ModelPart.CLASS_MEMBERS | ModelPart.PROPERTY_TYPES
 
     def patch_class(self, stub_class: StubClass):
         for stub_property in stub_class.stub_properties:
@@ -86,7 +88,7 @@ class PluginEvents(PluginBaseClass):
         if fb.FBEvent.__name__ in stub_class.parents:
             type_property = stub_class.get_property_by_name('Type')
             if type_property and type_property.Type == property.__name__:
-                stub_class.stub_properties.remove(type_property)
+                stub_class.remove_property(type_property)
 
             # FBEventTree.Why has a event that's not exposed to the Python API
             if stub_class.ref is fb.FBEventTree:
@@ -7,7 +7,7 @@ import copy
 
 import pyfbsdk
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 from ...module_types import StubClass, StubFunction
 
 NAME_INDEX = "Index"
@@ -50,6 +50,8 @@ PROPERTY_TYPE_MAP = {
 
 class PluginFbProperty(PluginBaseClass):
     PRIORITY = 200
+    READS = ModelPart.CLASS_MEMBERS | ModelPart.CLASS_PARENTS | ModelPart.PROPERTY_TYPES | ModelPart.FUNCTION_SIGNATURES
+    WRITES = ModelPart.CLASS_MEMBERS | ModelPart.PROPERTY_TYPES | ModelPart.FUNCTION_SIGNATURES
 
     def get_data_type(self, stub_class: StubClass):
         """
@@ -127,12 +129,11 @@ class PluginFbProperty(PluginBaseClass):
             stub_function_getitem_copy.return_type = f"list[{Type}]"
             stub_param = stub_function_getitem_copy.get_parameters()[1]
             stub_param.Type = "slice"
-            get_item_functions.append(stub_function_getitem_copy)
+            stub_class.add_overload(get_item_functions, stub_function_getitem_copy)
 
         # __setitem__ is not allowed for FBPropertyList
-        stub_setitem = stub_class.get_functions_by_name("__setitem__")
-        if stub_setitem in stub_class.stub_functions:
-            stub_class.stub_functions.remove(stub_setitem)
+        if stub_setitem := stub_class.get_functions_by_name("__setitem__"):
+            stub_class.remove_functions(stub_setitem)
 
         # Patch the first parameter of the following functions
         for name in ("append", "remove", "insert", "__contains__", "count"):
@@ -204,7 +205,7 @@ class PluginFbProperty(PluginBaseClass):
 
                     new_stub_functions.append(variant)
 
-        stub_class.stub_functions.remove(stub_functions)
+        stub_class.remove_functions(stub_functions)
 
         new_stub_functions.extend(stub_functions)  # Re-add the generic PropertyCreate last
         stub_class.add_functions(new_stub_functions)
@@ -3,12 +3,14 @@ from __future__ import annotations
 import importlib
 
 from .base import ClassDoc, FunctionDoc, PropertyDoc
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 from ...module_types import StubClass, StubFunction, StubProperty
 
 
 class PluginManualDocumentation(PluginBaseClass):
     PRIORITY = 150
+    READS = ModelPart.CLASS_MEMBERS
+    WRITES = ModelPart.DOCSTRINGS | ModelPart.PROPERTY_TYPES | ModelPart.FUNCTION_SIGNATURES
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
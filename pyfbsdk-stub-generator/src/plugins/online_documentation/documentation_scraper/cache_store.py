@@ -0,0 +1,159 @@
+"""
+A single file cache store, used to cache the documentation between runs.
+
+Entries are stored zlib compressed in a SQLite database, grouped in namespaces (e.g. one per MotionBuilder version & type of data).
+Each write is its own transaction, so it's safe to use from multiple threads & processes at the same time.
+When the total size of the entries exceeds the max size, the least recently used entries are removed.
+"""
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+
+from pathlib import Path
+
+
+CACHE_FILENAME = "pyfbsdk_stub_generator_documentation_cache.sqlite"
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # In bytes, of the compressed entries
+
+# When evicting, remove entries until the total size is below this ratio of the max size, so eviction doesn't run on every write
+EVICT_TO_RATIO = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def get_cache_filepath() -> Path:
+    return Path(tempfile.gettempdir()) / CACHE_FILENAME
+
+
+class CacheStore:
+    def __init__(self, filepath: Path | str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Args:
+            - filepath: The database file, created if it doesn't exist
+            - max_size: Max total size in bytes of the compressed entries before the least recently used are evicted
+        """
+        self.filepath = Path(filepath)
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.filepath, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+        self._total_size: int = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def total_size(self) -> int:
+        return self._total_size
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM entries WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?", (time.time(), namespace, key))
+
+        try:
+            return zlib.decompress(row[0])
+        except zlib.error:
+            self.delete(namespace, key)
+            return None
+
+    def get_keys(self, namespace: str) -> list[str]:
+        with self._lock:
+            return [x[0] for x in self._connection.execute("SELECT key FROM entries WHERE namespace = ?", (namespace,))]
+
+    def set(self, namespace: str, key: str, data: bytes):
+        compressed_data = zlib.compress(data)
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                row = self._connection.execute("SELECT size FROM entries WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries (namespace, key, data, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, compressed_data, len(compressed_data), time.time())
+                )
+            self._total_size += len(compressed_data) - (row[0] if row else 0)
+
+            if self._total_size > self.max_size:
+                self._evict(int(self.max_size * EVICT_TO_RATIO))
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._connection.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            self._update_total_size()
+
+    def clear(self, namespace: str | None = None):
+        """ Remove all entries in the namespace, or all entries if namespace is None """
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                if namespace is None:
+                    self._connection.execute("DELETE FROM entries")
+                else:
+                    self._connection.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            self._update_total_size()
+
+    def _update_total_size(self):
+        self._total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self, target_size: int):
+        """ Remove the least recently used entries until the total size is below `target_size` """
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            # Other processes may have written to the database as well, so don't rely on the cached total size
+            total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            cursor = self._connection.execute("SELECT namespace, key, size FROM entries ORDER BY accessed")
+            evicted: list[tuple[str, str]] = []
+            for namespace, key, size in cursor:
+                if total_size <= target_size:
+                    break
+                evicted.append((namespace, key))
+                total_size -= size
+            cursor.close()
+            self._connection.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", evicted)
+
+        self._total_size = total_size
+
+
+_default_store: CacheStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store() -> CacheStore:
+    """ Get the cache store shared by the whole process, opened the first time it's requested """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = CacheStore(get_cache_filepath())
+        return _default_store
@@ -14,6 +14,9 @@ from bs4 import Tag
 from .utils import EClassName, get_parameter_nice_name
 
 
+# Increase this when the markdown output changes, to invalidate previously cached parsed pages
+CONVERTER_VERSION = 1
+
 PY2_TO_PY3_PRINT_PATTERN = re.compile(r"(?<!\w)print\s+(.*)\s*(?<!\\)(?:\n|$)")
 
 
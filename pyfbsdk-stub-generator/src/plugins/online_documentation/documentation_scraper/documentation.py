@@ -1,22 +1,156 @@
-from . import table_of_contents, requests_cache, parser
+from __future__ import annotations
+
+import collections
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import table_of_contents, requests_cache, parser, parsed_cache
+from .http_client import HttpClient
+from .page_lru import ParsedPageLRU, DEFAULT_MAX_SIZE
+
+
+def get_page_url(url: str) -> str:
+    """ Get the url of the page, without any #fragment """
+    return url.partition("#")[0]
 
 
 class Documentation:
-    def __init__(self, module_name: str, version: int, use_cache: bool = False) -> None:
+    def __init__(self,
+                 module_name: str,
+                 version: int,
+                 use_cache: bool = False,
+                 pool_size: int = 10,
+                 base_url: str | None = None,
+                 max_parsed_pages: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Args:
+            - pool_size: Number of connections kept open, should match the number of threads fetching pages
+            - max_parsed_pages: Number of parsed pages kept in memory, so they don't have to be parsed again
+            - base_url: Root url of the documentation, `{version}` will be replaced with the version.
+                        Defaults to `table_of_contents.BASE_URL`, can be pointed to a local server serving recorded pages.
+        """
         self.module_name = module_name
         self.version = version
         self.use_cache = use_cache
+        self.pool_size = pool_size
+
+        self.http_client = HttpClient(pool_size=pool_size)
+
+        # Page html downloaded by `prefetch`, mapped by the page url.
+        # A page is removed once all of the names it was prefetched for have been parsed
+        self.pages: dict[str, str] = {}
+        self._page_names: dict[str, set[str]] = {}
+        self._pages_lock = threading.Lock()
+
+        self.parsed_pages = ParsedPageLRU(max_parsed_pages)
+
+        self.prefetch_time = 0.0
 
         self.table_of_contents = table_of_contents.get_table_of_contents_python(module_name,
                                                                                 version,
-                                                                                use_cache)
+                                                                                use_cache,
+                                                                                client=self.http_client,
+                                                                                base_url=base_url)
 
     def __bool__(self):
         return bool(self.table_of_contents)
 
+    def close(self):
+        self.http_client.close()
+
+    def get_page_urls(self, names: list[str]) -> list[str]:
+        """
+        Get the urls of all pages documenting the given names.
+        The urls are ordered by their estimated size, largest first. Where the size is estimated from the number of items listed on the page.
+        """
+        item_counts = collections.Counter(get_page_url(x) for x in self.table_of_contents.values())
+
+        page_urls: dict[str, None] = {}  # dict used as an ordered set
+        for name in names:
+            if url := self.table_of_contents.get(name):
+                page_urls[get_page_url(url)] = None
+
+        return sorted(page_urls, key=lambda x: item_counts[x], reverse=True)
+
+    def prefetch(self, names: list[str], jobs: int | None = None) -> int:
+        """
+        Download all pages documenting the given names in parallel, before they're parsed.
+
+        Args:
+            - names: Names of the items that will be looked up, e.g. class or function names
+            - jobs: Max number of pages downloaded at the same time, defaults to the connection pool size
+
+        Returns: Number of pages that were fetched
+        """
+        with self._pages_lock:
+            for name in names:
+                if url := self.table_of_contents.get(name):
+                    self._page_names.setdefault(get_page_url(url), set()).add(name)
+
+        page_urls = [x for x in self.get_page_urls(names) if x not in self.pages]
+
+        start_time = time.perf_counter()
+
+        def _fetch(url: str):
+            code, html = requests_cache.get_request(url, use_cache=self.use_cache, client=self.http_client, version=self.version)
+            with self._pages_lock:
+                self.pages[url] = html
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=jobs or self.pool_size, thread_name_prefix="DocumentationPrefetch") as executor:
+            for future in [executor.submit(_fetch, x) for x in page_urls]:
+                if future.exception():
+                    failed += 1  # The page will be downloaded again when it's parsed, which raises the error
+
+        elapsed_time = time.perf_counter() - start_time
+        self.prefetch_time += elapsed_time
+        print(f"    Prefetched {len(page_urls) - failed} documentation pages in {elapsed_time:.2f}s ({failed} failed)")
+
+        return len(page_urls) - failed
+
+    def get_page_html(self, url: str) -> str:
+        page_url = get_page_url(url)
+        with self._pages_lock:
+            html = self.pages.get(page_url)
+
+        if html is None:
+            code, html = requests_cache.get_request(url, use_cache=self.use_cache, client=self.http_client, version=self.version)
+
+        return html
+
     def parse_page(self, name: str) -> parser.ParsedPage | None:
         if url := self.table_of_contents.get(name):
-            code, html = requests_cache.get_request(url, use_cache=self.use_cache)
-            return parser.parse_page(name, html, url)
+            return self.parsed_pages.get(name, lambda: self._parse_page(name, url))
 
         return None
+
+    def release_page(self, name: str):
+        """
+        Let the prefetched html of the page documenting `name` go, it's removed once it's no longer needed by any of
+        the names it was prefetched for. Pages are released when they're parsed, only names that are never parsed
+        (e.g. sharing an already parsed page) need to be released explicitly.
+        """
+        url = self.table_of_contents.get(name)
+        if not url:
+            return
+
+        page_url = get_page_url(url)
+        with self._pages_lock:
+            names = self._page_names.get(page_url)
+            if names is None:
+                return
+
+            names.discard(name)
+            if not names:
+                del self._page_names[page_url]
+                self.pages.pop(page_url, None)
+
+    def _parse_page(self, name: str, url: str) -> parser.ParsedPage:
+        html = self.get_page_html(url)
+        self.release_page(name)
+
+        if self.use_cache:
+            return parsed_cache.parse_page(name, html, url, self.version)
+        return parser.parse_page(name, html, url)
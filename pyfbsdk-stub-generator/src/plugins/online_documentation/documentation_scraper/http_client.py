@@ -0,0 +1,166 @@
+"""
+A shared HTTP client used to download the online documentation.
+
+The client keeps a pool of keep-alive connections, so the thousands of requests to the same host
+don't have to do a new TCP & TLS handshake each time.
+
+requests doesn't guarantee that a `Session` (e.g. its cookie jar) is thread-safe, so each thread gets its own session.
+The sessions share a single adapter, whose urllib3 connection pool is thread-safe, so the connections are still reused
+between the threads.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from dataclasses import dataclass, field
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+@dataclass
+class RequestTiming:
+    url: str
+    status_code: int
+    elapsed: float
+    size: int
+
+
+@dataclass
+class RequestStats:
+    """ Timings of all requests made by a client, safe to update from multiple threads """
+    timings: list[RequestTiming] = field(default_factory=list)
+    failures: int = 0
+
+    # Updated by `requests_cache.get_request`
+    cache_hits: int = 0
+    cache_misses: int = 0
+    coalesced: int = 0
+    cache_time: float = 0.0  # Time spent reading & writing the cache
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, timing: RequestTiming):
+        with self._lock:
+            self.timings.append(timing)
+
+    def add_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def add_cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+
+    def add_cache_miss(self):
+        with self._lock:
+            self.cache_misses += 1
+
+    def add_cache_time(self, elapsed_time: float):
+        with self._lock:
+            self.cache_time += elapsed_time
+
+    def add_coalesced(self):
+        """ A request that waited for an identical request already in flight, instead of making its own """
+        with self._lock:
+            self.coalesced += 1
+
+    @property
+    def count(self) -> int:
+        return len(self.timings)
+
+    @property
+    def total_time(self) -> float:
+        return sum(x.elapsed for x in self.timings)
+
+    @property
+    def total_size(self) -> int:
+        return sum(x.size for x in self.timings)
+
+    def get_slowest(self, count: int = 10) -> list[RequestTiming]:
+        return sorted(self.timings, key=lambda x: x.elapsed, reverse=True)[:count]
+
+    def summary(self) -> str:
+        cache_summary = f"cache: {self.cache_hits} hits, {self.cache_misses} misses, {self.coalesced} coalesced"
+        if not self.timings:
+            return f"0 requests, {self.failures} failed, {cache_summary}"
+
+        average = self.total_time / self.count
+        return (f"{self.count} requests, {self.failures} failed, {self.total_size / 1_000_000:.2f} MB, "
+                f"{self.total_time:.2f}s total request time, {average * 1000:.0f}ms average, {cache_summary}")
+
+
+class HttpClient:
+    def __init__(self, pool_size: int = 10, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Args:
+            - pool_size: Max number of connections kept open per host, should match the number of threads using the client
+            - timeout: Default timeout in seconds for each request
+        """
+        self.timeout = timeout
+        self.stats = RequestStats()
+
+        # `pool_block` makes threads wait for a free connection instead of opening more connections than the pool size
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """ The session of the current thread, created the first time the thread makes a request """
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+
+        return session
+
+    def close(self):
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+
+    def get(self, url: str, timeout: float | None = None) -> tuple[int, str]:
+        """
+        Make a HTTP GET request
+
+        Returns: The status code and the text content of the response
+        """
+        start_time = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=timeout or self.timeout)
+        except requests.exceptions.RequestException:
+            self.stats.add_failure()
+            raise
+
+        text = response.text
+
+        self.stats.add(RequestTiming(url, response.status_code, time.perf_counter() - start_time, len(response.content)))
+
+        return response.status_code, text
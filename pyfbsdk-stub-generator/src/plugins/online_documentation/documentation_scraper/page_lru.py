@@ -0,0 +1,92 @@
+"""
+In-memory LRU of parsed documentation pages, so each page is only parsed once per run
+even if multiple plugins or threads ask for it.
+"""
+from __future__ import annotations
+
+import collections
+import threading
+import time
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .parser import ParsedPage
+
+
+DEFAULT_MAX_SIZE = 1024
+
+
+@dataclass
+class ParsedPageLRUStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    parse_time: float = 0.0  # Summed time spent parsing pages, can be more than the wall time when threaded
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0.0
+        return f"{self.misses} parsed in {self.parse_time:.2f}s, {self.hits} reused ({hit_rate:.1%} hit rate), {self.evictions} evicted"
+
+
+@dataclass
+class ParsedPageLRU:
+    """ Thread-safe, bounded LRU of parsed pages """
+    max_size: int = DEFAULT_MAX_SIZE
+
+    stats: ParsedPageLRUStats = field(default_factory=ParsedPageLRUStats)
+
+    _pages: collections.OrderedDict[str, ParsedPage] = field(default_factory=collections.OrderedDict, repr=False)
+    _in_flight: dict[str, Future[ParsedPage]] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __len__(self):
+        return len(self._pages)
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+
+    def get(self, key: str, parse: Callable[[], ParsedPage]) -> ParsedPage:
+        """
+        Get the page from the LRU, calling `parse` if it's not in it.
+        If another thread is already parsing the same page, wait for that result instead of parsing it again.
+        """
+        with self._lock:
+            if (page := self._pages.get(key)) is not None:
+                self._pages.move_to_end(key)
+                self.stats.hits += 1
+                return page
+
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+
+        if not is_owner:
+            return future.result()
+
+        start_time = time.perf_counter()
+        try:
+            page = parse()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self.stats.parse_time += time.perf_counter() - start_time
+            del self._in_flight[key]
+            self._pages[key] = page
+            while len(self._pages) > self.max_size:
+                self._pages.popitem(last=False)
+                self.stats.evictions += 1
+
+        future.set_result(page)
+        return page
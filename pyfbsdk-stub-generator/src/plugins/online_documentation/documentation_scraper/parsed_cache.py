@@ -0,0 +1,102 @@
+"""
+Second level cache for the documentation, storing the parsed pages instead of the raw HTML.
+
+Parsing the pages is the main cost of a run where the HTML is already cached, so when caching is enabled
+the result of `parser.parse_page` is stored as compact JSON in the cache store, keyed by a hash of the HTML content and the
+parser & converter versions. Changing any of them results in a new key, so outdated entries are never read.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+
+from . import parser, cache_store
+from .convert_docstrings import CONVERTER_VERSION
+
+
+def _get_package_version(package: str) -> str:
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# Everything that affects the output of the parser, other than the page itself
+PARSER_FINGERPRINT = "|".join((
+    str(parser.PARSER_VERSION),
+    str(CONVERTER_VERSION),
+    _get_package_version("markdownify"),
+    _get_package_version("beautifulsoup4"),
+))
+
+
+def get_namespace(version: int | None) -> str:
+    return f"parsed/{version}" if version else "parsed"
+
+
+def get_key(page_html: str, page_url: str) -> str:
+    """ Get the cache key for a page, the url is included since relative links in the docstrings are resolved against it """
+    hasher = hashlib.sha256()
+    for value in (PARSER_FINGERPRINT, page_url, page_html):
+        hasher.update(value.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+# ----------------------------------------------------------
+#                   Serialization
+# ----------------------------------------------------------
+# Pages are stored as nested lists instead of dicts, to not repeat the field names for every member & parameter
+
+def dump_page(page: parser.ParsedPage) -> bytes:
+    data = [
+        page.description,
+        [
+            [
+                member.name,
+                member.type_str,
+                member.doc_string,
+                [[x.name, x.type_str, x.default_value] for x in member.parameters],
+                member.relative_url
+            ]
+            for member in page.members
+        ]
+    ]
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def load_page(page_name: str, data: bytes) -> parser.ParsedPage:
+    description, members = json.loads(data)
+    return parser.ParsedPage(
+        page_name,
+        description,
+        [
+            parser.MemberItem(name, type_str, doc_string, [parser.Parameter(*x) for x in parameters], relative_url)
+            for name, type_str, doc_string, parameters, relative_url in members
+        ]
+    )
+
+
+# ----------------------------------------------------------
+#                   Cache
+# ----------------------------------------------------------
+
+def parse_page(page_name: str, page_html: str, page_url: str, version: int | None = None) -> parser.ParsedPage:
+    """
+    Same as `parser.parse_page`, but the result is read from the cache if the same page has been parsed before.
+    """
+    store = cache_store.get_default_store()
+    namespace = get_namespace(version)
+    key = get_key(page_html, page_url)
+
+    if (data := store.get(namespace, key)) is not None:
+        try:
+            return load_page(page_name, data)
+        except ValueError:
+            pass  # Entry written by an incompatible version, parse the page again
+
+    page = parser.parse_page(page_name, page_html, page_url)
+    store.set(namespace, key, dump_page(page))
+
+    return page
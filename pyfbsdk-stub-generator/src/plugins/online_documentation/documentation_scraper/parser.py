@@ -6,15 +6,20 @@ from __future__ import annotations
 
 import string
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import cast
 
 from bs4 import BeautifulSoup
 
 from .convert_docstrings import DocstringMarkdown
+from .stream_extractor import StreamExtractor
 from .utils import EClassName
 
 
+# Increase this when the parser output changes, to invalidate previously cached parsed pages
+PARSER_VERSION = 1
+
+
 @dataclass
 class Parameter:
     name: str | None
@@ -37,14 +42,115 @@ class ParsedPage:
     description: str
     members: list[MemberItem]
 
-    def find_member_by_name(self, member_name: str) -> MemberItem | None:
+    # Members mapped by their name, in the same order as in `members`
+    _members_by_name: dict[str, list[MemberItem]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._members_by_name = {}
         for member in self.members:
-            if member.name == member_name:
-                return member
+            self._members_by_name.setdefault(member.name, []).append(member)
+
+    def find_member_by_name(self, member_name: str) -> MemberItem | None:
+        if members := self._members_by_name.get(member_name):
+            return members[0]
         return None
-    
+
     def find_members_by_name(self, member_name: str) -> list[MemberItem]:
-        return [member for member in self.members if member.name == member_name]
+        return list(self._members_by_name.get(member_name, ()))
+
+
+# ----------------------------------------------------------
+#                   Raw page content
+# ----------------------------------------------------------
+# The parts of the page HTML needed to build the ParsedPage, before any clean up.
+# Filled in by one of the extractors, either by walking a BeautifulSoup tree or by streaming the HTML.
+
+@dataclass
+class RawParameterRow:
+    type_text: str | None = None  # Text of the first `td.paramtype` in the row
+    name_text: str | None = None  # Text of the first `td.paramname` in the row
+
+
+@dataclass
+class RawMember:
+    doc_html: str | None = None  # HTML of the first `div.memdoc`
+    has_name_table: bool = False  # If the member has a `table.memname`
+    name_text: str | None = None  # Text of the first `td.memname` in the name table
+    rows: list[RawParameterRow] = field(default_factory=list)  # All rows in the name table
+
+
+@dataclass
+class RawPage:
+    description_html: str | None = None  # HTML of the first `div.textblock`
+    members: list[RawMember] = field(default_factory=list)  # All `div.memitem`
+    member_title_urls: list[str] = field(default_factory=list)  # The href of the first link in each `h2.memtitle`
+
+
+def extract_page_soup(page_html: str) -> RawPage:
+    """ Extract the raw page content by building a BeautifulSoup tree of the whole page """
+    parser = BeautifulSoup(page_html, "html.parser")
+    raw_page = RawPage()
+
+    if page_description_html := parser.find("div", class_ = EClassName.PAGE_DETAILED_DESC):
+        raw_page.description_html = str(page_description_html)
+
+    for member_title in parser.find_all("h2", class_ = EClassName.MEMBER_TITLE):
+        member_url = ""
+        if tag_a := member_title.find("a"):
+            member_url = cast(str, tag_a.get("href", ""))
+        raw_page.member_title_urls.append(member_url)
+
+    for member in parser.find_all("div", class_ = EClassName.MEMBER):
+        raw_member = RawMember()
+
+        if member_doc_html := member.find("div", class_ = EClassName.MEMBER_DOC):
+            raw_member.doc_html = str(member_doc_html)
+
+        if table_name := member.find("table", class_ = EClassName.MEMBER_NAME):
+            raw_member.has_name_table = True
+            if table_name_data := table_name.find("td", class_ = EClassName.MEMBER_NAME):
+                raw_member.name_text = table_name_data.get_text()
+
+            for table_row in table_name.find_all("tr"):
+                table_data_type = table_row.find("td", class_ = EClassName.PARAMETER_TYPE)
+                table_data_name = table_row.find("td", class_ = EClassName.PARAMETER_NAME)
+                raw_member.rows.append(
+                    RawParameterRow(
+                        table_data_type.get_text() if table_data_type else None,
+                        table_data_name.get_text() if table_data_name else None
+                    )
+                )
+
+        raw_page.members.append(raw_member)
+
+    return raw_page
+
+
+def extract_page_stream(page_html: str) -> RawPage:
+    """ Extract the raw page content in a single pass over the HTML, without building a tree """
+    extractor = StreamExtractor(page_html)
+    extractor.feed(page_html)
+    extractor.close()
+
+    return RawPage(
+        extractor.description_html,
+        [
+            RawMember(
+                member.doc_html,
+                member.has_name_table,
+                "".join(member.name_text) if member.name_text is not None else None,
+                [
+                    RawParameterRow(
+                        "".join(row.type_text) if row.type_text is not None else None,
+                        "".join(row.name_text) if row.name_text is not None else None
+                    )
+                    for row in member.rows
+                ]
+            )
+            for member in extractor.members
+        ],
+        extractor.member_title_urls
+    )
 
 
 def get_safe_text(text: str) -> str:
@@ -52,7 +158,7 @@ def get_safe_text(text: str) -> str:
     return text.replace('\xa0', ' ').strip(string.whitespace + ",").replace("\\", "\\\\")
 
 
-def parse_page(page_name: str, page_html: str, page_url: str) -> ParsedPage:
+def parse_page(page_name: str, page_html: str, page_url: str, stream: bool = True) -> ParsedPage:
     """
     Parse the HTML content of a page and return a DocumentationParsedPage object.
 
@@ -60,19 +166,28 @@ def parse_page(page_name: str, page_html: str, page_url: str) -> ParsedPage:
         - `PageName`: The name of the page.
         - `PageHtmlContent`: The HTML content of the page.
         - `BaseURL`: The base URL to be used to resolve relative URLs.
+        - `Stream`: Extract the content in a single pass over the HTML instead of building a BeautifulSoup tree,
+                    both give the same result but streaming is faster.
     """
-    docstring_markdown = DocstringMarkdown(page_url)
+    if stream:
+        raw_page = extract_page_stream(page_html)
+    else:
+        raw_page = extract_page_soup(page_html)
+
+    return build_page(page_name, page_url, raw_page)
 
-    parser = BeautifulSoup(page_html, "html.parser")
 
-    page_description_html = parser.find("div", class_ = EClassName.PAGE_DETAILED_DESC)
-    if page_description_html:
-        page_description = docstring_markdown.description_to_markdown(str(page_description_html))
+def build_page(page_name: str, page_url: str, raw_page: RawPage) -> ParsedPage:
+    """ Build the ParsedPage from the raw content of the page """
+    docstring_markdown = DocstringMarkdown(page_url)
+
+    if raw_page.description_html is not None:
+        page_description = docstring_markdown.description_to_markdown(raw_page.description_html)
     else:
         page_description = ""
 
-    members = parser.find_all("div", class_ = EClassName.MEMBER)
-    member_titles = parser.find_all("h2", class_ = EClassName.MEMBER_TITLE)
+    members = raw_page.members
+    member_titles: list[str] | list[None] = raw_page.member_title_urls
 
     # If the titles doesn't match, fallback to not using titles
     if len(members) != len(member_titles):
@@ -87,15 +202,14 @@ def parse_page(page_name: str, page_html: str, page_url: str) -> ParsedPage:
         member_url: str = ""
 
         if member_title:
-            if tag_a := member_title.find("a"):
-                member_url = cast(str, tag_a.get("href", ""))
+            member_url = member_title
 
-        if member_doc_html := member.find("div", class_ = EClassName.MEMBER_DOC):
-            member_doc = docstring_markdown.description_to_markdown(str(member_doc_html))
+        if member.doc_html is not None:
+            member_doc = docstring_markdown.description_to_markdown(member.doc_html)
 
-        if table_name := member.find("table", class_ = EClassName.MEMBER_NAME):
-            if table_name_data := table_name.find("td", class_ = EClassName.MEMBER_NAME):
-                member_name = get_safe_text(table_name_data.get_text())
+        if member.has_name_table:
+            if member.name_text is not None:
+                member_name = get_safe_text(member.name_text)
                 if " " in member_name:
                     member_type, _, member_name = member_name.rpartition(" ")
                     member_name = member_name.strip()
@@ -107,13 +221,10 @@ def parse_page(page_name: str, page_html: str, page_url: str) -> ParsedPage:
 
             # Find all parameters
             parameters: list[Parameter] = []
-            for table_row in table_name.find_all("tr"):
-                table_data_type = table_row.find("td", class_ = EClassName.PARAMETER_TYPE)
-                table_data_name = table_row.find("td", class_ = EClassName.PARAMETER_NAME)
-
-                if table_data_name and table_data_type:
-                    parameter_type = get_safe_text(table_data_type.get_text())
-                    parameter_name = get_safe_text(table_data_name.get_text())
+            for table_row in member.rows:
+                if table_row.name_text is not None and table_row.type_text is not None:
+                    parameter_type = get_safe_text(table_row.type_text)
+                    parameter_name = get_safe_text(table_row.name_text)
 
                     # the last param might have the end function ')' included
                     if (
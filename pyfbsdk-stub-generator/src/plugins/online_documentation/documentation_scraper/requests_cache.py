@@ -3,53 +3,113 @@ This module handles caching of web pages useful while developing this module,
 to avoid re-downloading the online documentation over and over again.
 """
 
-import tempfile
+from __future__ import annotations
 
-from urllib.parse import quote
-from pathlib import Path
-
-import requests
+import threading
+import time
 
+from concurrent.futures import Future
 
-CACHE_DIRNAME = "pyfbsdk_stub_generator_documentation_cache"
+import requests
 
+from .http_client import HttpClient
+from . import cache_store
 
-def get_cache_dir() -> Path:
-    return Path(tempfile.gettempdir()) / CACHE_DIRNAME
 
+# Requests currently being made, mapped by their namespace & cache key.
+# Threads asking for a page that is already being downloaded wait for that result instead of downloading it again.
+_in_flight: dict[tuple[str, str], Future[tuple[int, str]]] = {}
+_in_flight_lock = threading.Lock()
 
-def url_to_filepath(url: str) -> str:
-    # Remove fragments from the url, to avoid caching the same page multiple times
-    if "#" in url:
-        url = url.partition("#")[0]
 
-    return quote(url, safe="")
+def get_namespace(version: int | None) -> str:
+    return f"html/{version}" if version else "html"
 
 
-def get_cached_filepath(url: str) -> Path:
-    return get_cache_dir() / url_to_filepath(url)
+def get_cache_key(url: str) -> str:
+    # Remove fragments from the url, to avoid caching the same page multiple times
+    return url.partition("#")[0]
 
 
-def get_request(url: str, timeout: int = 10, use_cache: bool = False) -> tuple[int, str]:
+def get_request(url: str,
+                timeout: int = 10,
+                use_cache: bool = False,
+                client: HttpClient | None = None,
+                version: int | None = None) -> tuple[int, str]:
     """
-    A get http get request that caches the response in a temp file.  
+    A get http get request that caches the response in the documentation cache store.  
     If the same url has been requested/cached before, it will return the cached response instead of making a new request.
+    If the same url is already being requested by another thread, it waits for and returns that response.
+
+    Args:
+        - client: The client used to make the request, if None a one-off request is made.
+                  Cache hits, misses & coalesced requests are counted in `client.stats`
+        - version: MotionBuilder version the page belongs to, used as the namespace in the cache
 
     Returns the HTML content of the page as a string.
     """
+    in_flight_key = (get_namespace(version), get_cache_key(url))
+
+    with _in_flight_lock:
+        future = _in_flight.get(in_flight_key)
+        is_owner = future is None
+        if future is None:
+            future = _in_flight[in_flight_key] = Future()
+
+    if not is_owner:
+        if client:
+            client.stats.add_coalesced()
+        return future.result()
+
+    try:
+        result = _get_request(url, timeout, use_cache, client, version)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _in_flight_lock:
+            del _in_flight[in_flight_key]
+
+
+def _get_request(url: str,
+                 timeout: int,
+                 use_cache: bool,
+                 client: HttpClient | None,
+                 version: int | None) -> tuple[int, str]:
+    namespace = get_namespace(version)
+    key = get_cache_key(url)
+
+    if use_cache:
+        start_time = time.perf_counter()
+        data = cache_store.get_default_store().get(namespace, key)
+        if client:
+            client.stats.add_cache_time(time.perf_counter() - start_time)
+
+        if data is not None:
+            if client:
+                client.stats.add_cache_hit()
+            return 200, data.decode("utf-8")
 
-    cached_file = get_cached_filepath(url)
-    if use_cache and cached_file.exists():
-        return 200, cached_file.read_text(encoding="utf-8")
+    if client:
+        client.stats.add_cache_miss()
 
     try:
-        response = requests.get(url, timeout=timeout)
+        if client:
+            status_code, text = client.get(url, timeout=timeout)
+        else:
+            response = requests.get(url, timeout=timeout)
+            status_code, text = response.status_code, response.text
     except requests.exceptions.RequestException as e:
         print(f"Failed to download {url}")
         raise e
 
     if use_cache:
-        cached_file.parent.mkdir(parents=True, exist_ok=True)
-        cached_file.write_text(response.text, encoding="utf-8")
+        start_time = time.perf_counter()
+        cache_store.get_default_store().set(namespace, key, text.encode("utf-8"))
+        if client:
+            client.stats.add_cache_time(time.perf_counter() - start_time)
 
-    return response.status_code, response.text
+    return status_code, text
@@ -0,0 +1,224 @@
+"""
+Event driven extractor for the Doxygen documentation pages, built on the stdlib HTMLParser.
+
+Instead of building a tree of the whole page, the extractor keeps a stack of the currently open tags
+and only collects the regions used by `parser.build_page`. It follows the same rules as BeautifulSoup's
+`html.parser` tree builder, so the result is the same as searching the tree:
+- An end tag closes the most recent open tag with the same name, and any tags opened after it.
+  End tags without a matching open tag are ignored.
+- Void elements (e.g. <br>) never contain anything.
+- Text inside <script>, <style> & <template> tags is not included in the text of its parents.
+"""
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Callable
+
+from .utils import EClassName
+
+
+# Same as `bs4.builder.HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS`
+VOID_ELEMENTS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem", "meta", "param",
+    "source", "track", "wbr", "basefont", "bgsound", "command", "frame", "image", "isindex", "nextid", "spacer"
+))
+
+# Tags where the text isn't part of the text of the parent elements
+NON_TEXT_ELEMENTS = frozenset(("script", "style", "template"))
+
+
+class StreamMemberRow:
+    __slots__ = ("type_text", "name_text")
+
+    def __init__(self) -> None:
+        self.type_text: list[str] | None = None
+        self.name_text: list[str] | None = None
+
+
+class StreamMember:
+    __slots__ = ("doc_html", "doc_found", "has_name_table", "name_text", "rows")
+
+    def __init__(self) -> None:
+        self.doc_html: str | None = None
+        self.doc_found = False
+        self.has_name_table = False
+        self.name_text: list[str] | None = None
+        self.rows: list[StreamMemberRow] = []
+
+
+class _OpenElement:
+    __slots__ = ("tag", "start", "on_close", "text_buffers")
+
+    def __init__(self, tag: str, start: int) -> None:
+        self.tag = tag
+        self.start = start  # Offset of the start tag in the page html
+        self.on_close: list[Callable[[_OpenElement, int], None]] = []
+        self.text_buffers: list[list[str]] = []  # Buffers collecting the text inside of this element
+
+
+class StreamExtractor(HTMLParser):
+    def __init__(self, page_html: str) -> None:
+        super().__init__(convert_charrefs=True)
+
+        self.page_html = page_html
+
+        # `getpos()` returns line & column, these are used to convert it to an offset in the page html
+        self._line_offsets = [0]
+        index = page_html.find("\n")
+        while index != -1:
+            self._line_offsets.append(index + 1)
+            index = page_html.find("\n", index + 1)
+
+        self.description_html: str | None = None
+        self.members: list[StreamMember] = []
+        self.member_title_urls: list[str] = []
+
+        self._description_found = False
+        self._stack: list[_OpenElement] = []
+        self._text_buffers: list[list[str]] = []
+
+        # Elements currently open that are still looking for content, along with what they're looking for
+        self._open_titles: list[int] = []  # Index in `member_title_urls` of titles where no <a> tag has been found yet
+        self._open_members: list[StreamMember] = []
+        self._open_name_tables: list[StreamMember] = []
+        self._open_rows: list[StreamMemberRow] = []
+
+    def _get_offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_offsets[line - 1] + column
+
+    # ----------------------------------------------------------
+    #                   Events
+    # ----------------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        if tag in VOID_ELEMENTS:
+            return
+
+        element = _OpenElement(tag, self._get_offset())
+
+        classes: list[str] = []
+        for key, value in attrs:
+            if key == "class":
+                classes = (value or "").split()  # Last attribute wins for duplicates, same as BeautifulSoup
+
+        if tag == "div":
+            if EClassName.PAGE_DETAILED_DESC in classes and not self._description_found:
+                self._description_found = True
+                element.on_close.append(self._close_description)
+
+            if EClassName.MEMBER_DOC in classes:
+                for member in self._open_members:
+                    if not member.doc_found:
+                        member.doc_found = True
+                        element.on_close.append(lambda element, end, member=member: setattr(member, "doc_html", self.page_html[element.start:end]))
+
+            if EClassName.MEMBER in classes:
+                member = StreamMember()
+                self.members.append(member)
+                self._open_members.append(member)
+                element.on_close.append(lambda element, end, member=member: self._open_members.remove(member))
+
+        elif tag == "h2":
+            if EClassName.MEMBER_TITLE in classes:
+                index = len(self.member_title_urls)
+                self.member_title_urls.append("")
+                self._open_titles.append(index)
+                element.on_close.append(lambda element, end, index=index: self._remove_open_title(index))
+
+        elif tag == "a":
+            if self._open_titles:
+                href = ""
+                for key, value in attrs:
+                    if key == "href":
+                        href = value or ""
+                for index in self._open_titles:
+                    self.member_title_urls[index] = href
+                self._open_titles.clear()
+
+        elif tag == "table":
+            if EClassName.MEMBER_NAME in classes:
+                for member in self._open_members:
+                    if not member.has_name_table:
+                        member.has_name_table = True
+                        self._open_name_tables.append(member)
+                        element.on_close.append(lambda element, end, member=member: self._open_name_tables.remove(member))
+
+        elif tag == "tr":
+            for member in self._open_name_tables:
+                row = StreamMemberRow()
+                member.rows.append(row)
+                self._open_rows.append(row)
+                element.on_close.append(lambda element, end, row=row: self._open_rows.remove(row))
+
+        elif tag == "td":
+            if EClassName.MEMBER_NAME in classes:
+                for member in self._open_name_tables:
+                    if member.name_text is None:
+                        member.name_text = self._start_text(element)
+
+            if EClassName.PARAMETER_TYPE in classes:
+                for row in self._open_rows:
+                    if row.type_text is None:
+                        row.type_text = self._start_text(element)
+
+            if EClassName.PARAMETER_NAME in classes:
+                for row in self._open_rows:
+                    if row.name_text is None:
+                        row.name_text = self._start_text(element)
+
+        self._stack.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str):
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                break
+        else:
+            return
+
+        start = self._get_offset()
+        end = self.page_html.find(">", start)
+        end = len(self.page_html) if end == -1 else end + 1
+
+        # Tags opened after the matching tag are closed where the end tag starts, the matching tag includes its end tag
+        while len(self._stack) > index + 1:
+            self._close_element(self._stack.pop(), start)
+        self._close_element(self._stack.pop(), end)
+
+    def handle_data(self, data: str):
+        if self._text_buffers and not (self._stack and self._stack[-1].tag in NON_TEXT_ELEMENTS):
+            for buffer in self._text_buffers:
+                buffer.append(data)
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._close_element(self._stack.pop(), len(self.page_html))
+
+    # ----------------------------------------------------------
+    #                   Helpers
+    # ----------------------------------------------------------
+
+    def _start_text(self, element: _OpenElement) -> list[str]:
+        buffer: list[str] = []
+        element.text_buffers.append(buffer)
+        self._text_buffers.append(buffer)
+        return buffer
+
+    def _close_element(self, element: _OpenElement, end: int):
+        for buffer in element.text_buffers:
+            self._text_buffers.remove(buffer)
+        for callback in element.on_close:
+            callback(element, end)
+
+    def _close_description(self, element: _OpenElement, end: int):
+        self.description_html = self.page_html[element.start:end]
+
+    def _remove_open_title(self, index: int):
+        if index in self._open_titles:
+            self._open_titles.remove(index)
@@ -6,22 +6,33 @@ from __future__ import annotations
 import ast
 
 from . import requests_cache
+from .http_client import HttpClient
 
-def get_base_url(version: int) -> str:
-    return f"https://help.autodesk.com/cloudhelp/{version}/ENU/MOBU-PYTHON-API-REF/"
+BASE_URL = "https://help.autodesk.com/cloudhelp/{version}/ENU/MOBU-PYTHON-API-REF/"
 
-def get_full_url(version: int, relative_url: str):
-    return f"{get_base_url(version)}{relative_url}"
 
+def get_base_url(version: int, base_url: str | None = None) -> str:
+    return (base_url or BASE_URL).format(version=version)
 
-def get_table_of_contents_python(module_name: str, version: int, use_cache: bool = False) -> dict[str, str]:
+def get_full_url(version: int, relative_url: str, base_url: str | None = None):
+    return f"{get_base_url(version, base_url)}{relative_url}"
+
+
+def get_table_of_contents_python(module_name: str,
+                                 version: int,
+                                 use_cache: bool = False,
+                                 client: HttpClient | None = None,
+                                 base_url: str | None = None) -> dict[str, str]:
     """
     Get the table of contents for the given namespace and version
 
+    Args:
+        - base_url: Root url of the documentation, `{version}` will be replaced with the version. Defaults to `BASE_URL`
+
     Returns a dict mapping the name of the item to its url
     """
-    url = get_full_url(version, f"namespace{module_name}.js")
-    code, text = requests_cache.get_request(url, use_cache=use_cache)
+    url = get_full_url(version, f"namespace{module_name}.js", base_url)
+    code, text = requests_cache.get_request(url, use_cache=use_cache, client=client, version=version)
     
     if "<title>404 Not Found</title>" in text:
         return {}
@@ -39,4 +50,4 @@ def get_table_of_contents_python(module_name: str, version: int, use_cache: bool
     if not all(len(item) == 3 for item in parsed_response):
         raise ValueError("Parsed response is not in the expected format")
 
-    return {item[0]: get_full_url(version, item[1]) for item in parsed_response}
+    return {item[0]: get_full_url(version, item[1], base_url) for item in parsed_response}
@@ -0,0 +1,160 @@
+"""
+Match overloaded stub functions with their members in the online documentation.
+
+Every function/member pair is given a score, and the pairs are then assigned so the total score is as high as possible
+(an optimal bipartite matching, solved with the Hungarian algorithm). Pairs where all parameter types are identical are
+always preferred over pairs that are only compatible.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+from ...module_types import StubFunction
+from .documentation_scraper import MemberItem
+from .type_translator import is_type_defined
+
+
+def get_compatibility_score(stub_types: list[str | None], member_types: list[str | None]) -> int:
+    """
+    Score how well the parameter types of a function matches the (translated) parameter types of a member.
+
+    Returns: The score, where 0 or less means the function and member are not compatible
+    """
+    score = 0
+    if len(stub_types) == len(member_types):
+        score += 1
+
+    for stub_type, member_type in zip(stub_types, member_types):
+        if not member_type or not stub_type:
+            continue
+        if stub_type == member_type:
+            score += 1
+        elif member_type.startswith("list") and stub_type == "list":
+            score += 1
+        elif is_type_defined(stub_type):
+            # Member description is not compatible with current function
+            return -1
+
+    return score
+
+
+def get_optimal_assignment(weights: list[list[int]]) -> list[tuple[int, int]]:
+    """
+    Find the row/column pairs with the highest total weight, each row & column can only be used once.
+    Pairs with a weight of 0 or less are never assigned.
+
+    Returns: List of (row, column) pairs, sorted by row
+    """
+    row_count = len(weights)
+    column_count = len(weights[0]) if weights else 0
+    if not row_count or not column_count:
+        return []
+
+    # Fast path, if the best column of each row is unique they can't be improved on.
+    # This is the case for most overloads, where each function only matches a single member.
+    best_columns: dict[int, int] = {}
+    for row, row_weights in enumerate(weights):
+        best_weight = max(row_weights)
+        if best_weight > 0:
+            best_column = row_weights.index(best_weight)
+            if best_column in best_columns or row_weights.count(best_weight) > 1:
+                break
+            best_columns[best_column] = row
+    else:
+        return sorted((row, column) for column, row in best_columns.items())
+
+    # The algorithm requires rows <= columns, so transpose the matrix if needed
+    transposed = row_count > column_count
+    if transposed:
+        weights = [list(column) for column in zip(*weights)]
+        row_count, column_count = column_count, row_count
+
+    max_weight = max(max(row) for row in weights)
+    costs = [[max_weight - max(weight, 0) for weight in row] for row in weights]
+
+    # Hungarian algorithm with potentials, O(rows^2 * columns). Arrays are 1-indexed, index 0 is a virtual column.
+    infinity = float("inf")
+    row_potentials = [0] * (row_count + 1)
+    column_potentials = [0] * (column_count + 1)
+    column_row = [0] * (column_count + 1)  # The row assigned to each column
+    previous_column = [0] * (column_count + 1)
+
+    for row in range(1, row_count + 1):
+        column_row[0] = row
+        current_column = 0
+        min_slack = [infinity] * (column_count + 1)
+        used = [False] * (column_count + 1)
+
+        while True:
+            used[current_column] = True
+            current_row = column_row[current_column]
+            delta = infinity
+            next_column = 0
+            for column in range(1, column_count + 1):
+                if used[column]:
+                    continue
+                slack = costs[current_row - 1][column - 1] - row_potentials[current_row] - column_potentials[column]
+                if slack < min_slack[column]:
+                    min_slack[column] = slack
+                    previous_column[column] = current_column
+                if min_slack[column] < delta:
+                    delta = min_slack[column]
+                    next_column = column
+
+            for column in range(column_count + 1):
+                if used[column]:
+                    row_potentials[column_row[column]] += delta
+                    column_potentials[column] -= delta
+                else:
+                    min_slack[column] -= delta
+
+            current_column = next_column
+            if column_row[current_column] == 0:
+                break
+
+        # Update the assignments along the augmenting path
+        while current_column:
+            column = previous_column[current_column]
+            column_row[current_column] = column_row[column]
+            current_column = column
+
+    assignment: list[tuple[int, int]] = []
+    for column in range(1, column_count + 1):
+        row = column_row[column]
+        if row and weights[row - 1][column - 1] > 0:
+            assignment.append((column - 1, row - 1) if transposed else (row - 1, column - 1))
+
+    return sorted(assignment)
+
+
+def match_overloads(stub_functions: list[StubFunction],
+                    members: list[MemberItem],
+                    translate_type: Callable[[str | None], str | None]) -> list[tuple[StubFunction, MemberItem]]:
+    """
+    Match overloaded functions with the documented members
+
+    Args:
+        - translate_type: Function translating the C++ types in the documentation into Python types
+
+    Returns: The matched (function, member) pairs, in the same order as the functions
+    """
+    functions_types = [[x.Type for x in stub_function.get_parameters(exclude_self=True)] for stub_function in stub_functions]
+    members_raw_types = [[x.type_str for x in member.parameters] for member in members]
+    members_types = [[translate_type(x) for x in raw_types] for raw_types in members_raw_types]
+
+    # A perfect match must outweigh any combination of compatible matches
+    max_parameter_count = max((len(x) for x in functions_types + members_types), default=0)
+    perfect_match_weight = (max_parameter_count + 1) * max(len(stub_functions), len(members)) + 1
+
+    weights: list[list[int]] = []
+    for stub_types in functions_types:
+        row: list[int] = []
+        for raw_types, member_types in zip(members_raw_types, members_types):
+            score = max(get_compatibility_score(stub_types, member_types), 0)
+            # A perfect match is when all parameter types are identical to the documentation, before translating them
+            if stub_types == raw_types:
+                score += perfect_match_weight
+            row.append(score)
+        weights.append(row)
+
+    return [(stub_functions[row], members[column]) for row, column in get_optimal_assignment(weights)]
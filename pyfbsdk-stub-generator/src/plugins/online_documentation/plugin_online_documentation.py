@@ -1,54 +1,19 @@
 from __future__ import annotations
 
 from types import ModuleType
-from typing import TypeGuard
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass, StubIndex
 from ...module_types import StubClass, StubFunction, StubParameter, StubProperty
 from ...flags import GeneratorFlag
+from ...profiling import ModuleProfile
 
 from .documentation_scraper import Documentation, MemberItem, get_parameter_nice_name
+from .type_translator import TypeTranslator, is_type_defined
+from .overload_matching import match_overloads
 
 
 EVENT_SOURCE_TYPE = "callbackframework.FBEventSource"
 
-TYPE_IGNORE_PREFIXES = (
-    "unsigned",
-    "K_DEPRECATED"
-)
-
-TRANSLATION_TYPE = {
-    "double": "float",
-    "long": "int",
-    "kInt64": "int",
-    "kULong": "int",
-    "char": "str",
-
-    "kReference": "int",
-    "FBkReference": "int",
-
-    "FBAudioFmt": "int",
-    "FBBool": "bool",
-
-    "FBArrayDouble": "list[float]",
-    "FBArrayUInt": "list[int]",
-
-    "FBVector4[float]": "FBVector4d",
-    "FBTVector": "FBVector4d",
-    "FBQuaternion": "FBVector4d",
-    "FBRVector": "FBVector3d",
-    "FBColorF": "FBColor",
-
-    # These are a bit more spesific, and may need to be changed in the future
-    "AreaLightShapes": "FBLight.EAreaLightShapes",
-    "KeyBehavior": "FBModelPath3D.EKeyPropertyBehavior",
-    "UnitType": "FBModelPath3D.ELengthUnitType",
-    "Element": "object",
-
-    # These are unknown, revert them back to properties
-    "FBEventTreeWhy": "property",
-}
-
 TRANSLATION_DEFAULT_VALUES = {
     "nullptr": "None",
     "true": "True",
@@ -59,6 +24,8 @@ TRANSLATION_DEFAULT_VALUES = {
 class PluginOnlineDocumentation(PluginBaseClass):
     THREADING = True
     PRIORITY = 10  # We preferably want this to run directly after the native generator
+    READS = ModelPart.CLASS_MEMBERS | ModelPart.PROPERTY_TYPES | ModelPart.FUNCTION_SIGNATURES
+    WRITES = ModelPart.DOCSTRINGS | ModelPart.PROPERTY_TYPES | ModelPart.FUNCTION_SIGNATURES
 
     def __init__(self,
                  version: int,
@@ -66,14 +33,21 @@ class PluginOnlineDocumentation(PluginBaseClass):
                  stub_enums: list[StubClass],
                  stub_classes: list[StubClass],
                  stub_functions: list[list[StubFunction]],
-                 flags: GeneratorFlag):
-        super().__init__(version, module, stub_enums, stub_classes, stub_functions, flags)
+                 flags: GeneratorFlag,
+                 jobs: int | None = None,
+                 profile: ModuleProfile | None = None,
+                 index: StubIndex | None = None):
+        super().__init__(version, module, stub_enums, stub_classes, stub_functions, flags, jobs, profile, index)
 
         # Initialize the documentation
-        self.documentation = Documentation(module.__name__, version, self.flags & GeneratorFlag.CACHE != 0)
+        self.documentation = Documentation(module.__name__, version, self.flags & GeneratorFlag.CACHE != 0, pool_size=self.jobs)
         if not self.documentation:
             return
 
+        # Download all pages up front, so the network time overlaps instead of being interleaved with the parsing
+        names = [x.name for x in stub_enums + stub_classes] + [x[0].name for x in stub_functions if x]
+        self.documentation.prefetch(names, self.jobs)
+
         # Parse the first documentation page to get the list of all pages
         for function_group in stub_functions:
             Function = function_group[0]
@@ -81,12 +55,53 @@ class PluginOnlineDocumentation(PluginBaseClass):
             if self.function_page:
                 break
 
+        # All functions are patched from the page that was just parsed, its html isn't needed for any other function
+        for function_group in stub_functions:
+            if function_group:
+                self.documentation.release_page(function_group[0].name)
+
         # Make a map of all class names and their class object that can be used for patching types etc.
         self.all_classes_map = {x.name: x for x in stub_classes + stub_enums}
 
+        # Translates the C++ types in the documentation into Python types
+        self.type_translator = TypeTranslator(frozenset(self.all_classes_map))
+
     def should_patch(self) -> bool:
         return bool(self.documentation)
 
+    def run(self):
+        try:
+            super().run()
+        finally:
+            self.documentation.close()
+
+        if self.should_patch():
+            request_stats = self.documentation.http_client.stats
+            parsed_pages_stats = self.documentation.parsed_pages.stats
+            translation_stats = self.type_translator.stats
+
+            print(f"    Documentation requests: {request_stats.summary()}")
+            print(f"    Parsed pages: {parsed_pages_stats.summary()}")
+            print(f"    Type translations: {translation_stats.summary()}")
+
+            self.profile.add_section("documentation", {
+                "prefetch_time": self.documentation.prefetch_time,
+                "network_time": request_stats.total_time,
+                "cache_time": request_stats.cache_time,
+                "parse_time": parsed_pages_stats.parse_time,
+                "requests": request_stats.count,
+                "failed_requests": request_stats.failures,
+                "downloaded_bytes": request_stats.total_size,
+                "cache_hits": request_stats.cache_hits,
+                "cache_misses": request_stats.cache_misses,
+                "coalesced_requests": request_stats.coalesced,
+                "pages_parsed": parsed_pages_stats.misses,
+                "pages_reused": parsed_pages_stats.hits,
+                "type_translation_hits": translation_stats.hits,
+                "type_translation_misses": translation_stats.misses,
+                "slowest_requests": [{"url": x.url, "time": x.elapsed} for x in request_stats.get_slowest()],
+            })
+
     # ---------------------------------------------------------------------------------------------
     #                                 Patch Entry Methods
     # ---------------------------------------------------------------------------------------------
@@ -150,83 +165,9 @@ class PluginOnlineDocumentation(PluginBaseClass):
 
         # If we have multiple functions and multiple members, we need to figure out which ones to match
         # This happens when functions are overloaded
-
-        # Make copies of the lists so we can modify them without affecting the original lists
-        FunctionsCopy = stub_functions.copy()
-        MembersCopy = doc_member.copy()
-
-        # Find all of the functions that has a perfect match with a member, by the parameter types
-        perfect_matches: list[tuple[StubFunction, MemberItem]] = []
-        matched_functions: list[StubFunction] = []
-        matched_members: list[MemberItem] = []
-        for stub_function in FunctionsCopy:
-            stub_parameters = stub_function.get_parameters(exclude_self = True)
-
-            for member in MembersCopy:
-                if len(stub_parameters) != len(member.parameters):
-                    continue
-
-                for stub_param, doc_param in zip(stub_parameters, member.parameters):
-                    if stub_param.Type != doc_param.type_str:
-                        break
-                else:
-                    # Make sure neither the function or the member has already been matched with another function or member
-                    if stub_function in matched_functions or member in matched_members:
-                        continue
-
-                    perfect_matches.append((stub_function, member))
-
-                    matched_functions.append(stub_function)
-                    matched_members.append(member)
-
-        for stub_function, member in perfect_matches:
+        for stub_function, member in match_overloads(stub_functions, doc_member, self.ensure_valid_type):
             self.patch_function_from_doc(stub_function, member, parent_stub_class)
 
-            # Remove them from the lists so we don't try to match them again
-            FunctionsCopy.remove(stub_function)
-            MembersCopy.remove(member)
-
-        # TODO: Match based on most similar parameter types
-        Scores: list[tuple[StubFunction, MemberItem, int]] = []
-        for stub_function in FunctionsCopy:
-            stub_parameters = stub_function.get_parameters(exclude_self = True)
-            for member in MembersCopy:
-                Score = 0
-                if len(stub_parameters) == len(member.parameters):
-                    Score += 1
-
-                for stub_param, doc_param in zip(stub_parameters, member.parameters):
-                    MemberParameterType = self.ensure_valid_type(doc_param.type_str)
-                    if not MemberParameterType or not stub_param.Type:
-                        continue
-                    if stub_param.Type == MemberParameterType:
-                        Score += 1
-                    elif MemberParameterType.startswith("list") and stub_param.Type == "list":
-                        Score += 1
-                    elif is_type_defined(stub_param.Type):
-                        # Member description is not compatible with current function
-                        Score = -1
-                        break
-
-                if Score > 0:
-                    Scores.append((stub_function, member, Score))
-
-        # Sort the scores from highest to lowest
-        Scores.sort(key = lambda Score: Score[2], reverse = True)
-        while Scores:
-            stub_function, member, Score = Scores.pop(0)
-            if stub_function in matched_functions or member in matched_members:
-                continue
-
-            self.patch_function_from_doc(stub_function, member, parent_stub_class)
-
-            matched_members.append(member)
-            matched_functions.append(stub_function)
-
-            # Remove them from the lists so we don't try to match them again
-            FunctionsCopy.remove(stub_function)
-            MembersCopy.remove(member)
-
     def patch_function_from_doc(self, stub_function: StubFunction, doc_function: MemberItem, parent_stub_class: StubClass | None = None):
         stub_function.docstring = doc_function.doc_string
         if stub_function.name == "__init__":
@@ -362,54 +303,5 @@ class PluginOnlineDocumentation(PluginBaseClass):
         """
         Make sure type is a valid Python type that can be used in the stubs, and translate it if necessary.
         """
-        if not _type:
-            return None
-
-        if "<" in _type:
-            _type = _type.replace("<", "[").replace(">", "]").replace(" ", "")
-            _type = _type.replace("FBArrayTemplate", "list")
-
-            # Get content between brackets
-            list_types_str = _type[_type.find("[") + 1:_type.find("]")]
-            if list_types_str:
-                validated_types: list[str] = []
-                list_types = list_types_str.split(",")
-                for list_type in list_types:
-                    list_type = self.ensure_valid_type(list_type)
-                    if list_type:
-                        validated_types.append(list_type)
-
-                if len(list_types) != len(validated_types):
-                    return None
-
-                _type = _type.replace(list_types_str, ",".join(validated_types))
-                if _type.endswith("[]"):
-                    _type = _type[:-2]
-
-        if " " in _type:
-            for prefix in TYPE_IGNORE_PREFIXES:
-                if _type.startswith(prefix):
-                    _type = _type.rpartition(" ")[2]
-
-        _type = TRANSLATION_TYPE.get(_type, _type)
-
-        # Replace namespace C++ syntax with Python
-        if "::" in _type:
-            _type = _type.replace("::", ".")
-
-        if _type.startswith("FB"):
-            class_name = _type
-            if "." in _type:
-                class_name = _type.partition(".")[0]
-            if class_name not in self.all_classes_map:
-                # print(f"Type not found: {Type}")
-                return None
-
-        return _type
-
-
-def is_type_defined(_type: str | None) -> TypeGuard[str]:
-    if not _type:
-        return False
+        return self.type_translator.translate(_type)
 
-    return _type != "object" and _type != "Any"
@@ -0,0 +1,250 @@
+"""
+Translate C++ types from the online documentation into Python types that can be used in the stubs.
+
+The type is parsed into a small expression tree, so nested templates like `FBArrayTemplate<FBArrayTemplate<int>>`
+can be translated recursively. The same few hundred type strings are translated over and over again while
+matching overloads, so the results are memoized, keyed on the raw type string & the version of the class set.
+"""
+from __future__ import annotations
+
+import collections
+import threading
+
+from dataclasses import dataclass, field
+from typing import Iterable, NamedTuple, TypeGuard
+
+
+TYPE_IGNORE_PREFIXES = (
+    "unsigned",
+    "K_DEPRECATED"
+)
+
+TRANSLATION_TYPE = {
+    "double": "float",
+    "long": "int",
+    "kInt64": "int",
+    "kULong": "int",
+    "char": "str",
+
+    "kReference": "int",
+    "FBkReference": "int",
+
+    "FBAudioFmt": "int",
+    "FBBool": "bool",
+
+    "FBArrayDouble": "list[float]",
+    "FBArrayUInt": "list[int]",
+
+    "FBVector4[float]": "FBVector4d",
+    "FBTVector": "FBVector4d",
+    "FBQuaternion": "FBVector4d",
+    "FBRVector": "FBVector3d",
+    "FBColorF": "FBColor",
+
+    # These are a bit more spesific, and may need to be changed in the future
+    "AreaLightShapes": "FBLight.EAreaLightShapes",
+    "KeyBehavior": "FBModelPath3D.EKeyPropertyBehavior",
+    "UnitType": "FBModelPath3D.ELengthUnitType",
+    "Element": "object",
+
+    # These are unknown, revert them back to properties
+    "FBEventTreeWhy": "property",
+}
+
+# Templates that are translated into a python type
+TRANSLATION_TEMPLATE = {
+    "FBArrayTemplate": "list",
+}
+
+DEFAULT_MAX_SIZE = 4096
+
+
+# ----------------------------------------------------------
+#                   Type expressions
+# ----------------------------------------------------------
+
+class TypeExpression(NamedTuple):
+    """
+    A parsed C++ type, e.g. `FBArrayTemplate<FBModel*>` is:
+    `TypeExpression("FBArrayTemplate", (TypeExpression("FBModel*", None, ""),), "")`
+    """
+    name: str
+    arguments: tuple[TypeExpression, ...] | None  # None if the type isn't a template
+    suffix: str = ""  # Anything after the template arguments, e.g. '*' or '&'
+
+
+class TypeParseError(ValueError):
+    pass
+
+
+def parse_type(cpp_type: str) -> TypeExpression:
+    """
+    Parse a C++ type string into a TypeExpression.
+    Commas are only treated as separators inside of template brackets, so e.g. `tuple[int, int]` is kept as a single name.
+
+    Raises: TypeParseError if the template brackets are not balanced
+    """
+    expression, index = _parse_type(cpp_type, 0, "<")
+    if index != len(cpp_type):
+        raise TypeParseError(f"Unexpected '{cpp_type[index]}' at index {index} in type: {cpp_type}")
+    return expression
+
+
+def _read_until(text: str, index: int, stop_characters: str) -> int:
+    while index < len(text) and text[index] not in stop_characters:
+        index += 1
+    return index
+
+
+def _parse_type(text: str, index: int, stop_characters: str) -> tuple[TypeExpression, int]:
+    name_end = _read_until(text, index, stop_characters)
+    name = text[index:name_end]
+
+    if name_end == len(text) or text[name_end] != "<":
+        return TypeExpression(name.strip(), None), name_end
+
+    # Template arguments
+    arguments: list[TypeExpression] = []
+    index = name_end + 1
+    if text[index:].lstrip().startswith(">"):
+        index = text.index(">", index)  # Empty argument list, e.g. `Foo<>`
+    else:
+        while True:
+            argument, index = _parse_type(text, index, "<>,")
+            arguments.append(argument)
+            if index == len(text):
+                raise TypeParseError(f"Missing '>' in type: {text}")
+            if text[index] == ">":
+                break
+            index += 1  # Skip ','
+
+    suffix_end = _read_until(text, index + 1, stop_characters)
+    if suffix_end < len(text) and text[suffix_end] == "<":
+        raise TypeParseError(f"Unexpected '<' at index {suffix_end} in type: {text}")
+
+    # Whitespace is removed from templates, e.g. `FBArrayTemplate< FBModel* >` -> `list[FBModel*]`
+    return TypeExpression(name.replace(" ", ""), tuple(arguments), text[index + 1:suffix_end].replace(" ", "")), suffix_end
+
+
+# ----------------------------------------------------------
+#                   Translator
+# ----------------------------------------------------------
+
+@dataclass
+class TranslationStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0.0
+        return f"{total} lookups, {self.hits} hits, {self.misses} misses ({hit_rate:.1%} hit rate), {self.evictions} evictions"
+
+
+@dataclass
+class TypeTranslator:
+    """
+    Translates C++ types into Python types, types referencing classes not in `class_names` are considered invalid.
+
+    Safe to use from multiple threads.
+    """
+    class_names: frozenset[str] = frozenset()
+    max_size: int = DEFAULT_MAX_SIZE
+
+    stats: TranslationStats = field(default_factory=TranslationStats)
+    class_set_version: int = 0
+
+    _memo: collections.OrderedDict[tuple[str, int], str | None] = field(default_factory=collections.OrderedDict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def set_class_names(self, class_names: Iterable[str]):
+        """ Change the known classes, previously memoized translations are no longer used """
+        with self._lock:
+            self.class_names = frozenset(class_names)
+            self.class_set_version += 1
+            self._memo.clear()
+
+    def translate(self, cpp_type: str | None) -> str | None:
+        """
+        Make sure type is a valid Python type that can be used in the stubs, and translate it if necessary.
+
+        Returns: The Python type, or None if the type is not valid
+        """
+        if not cpp_type:
+            return None
+
+        key = (cpp_type, self.class_set_version)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self.stats.hits += 1
+                return self._memo[key]
+            self.stats.misses += 1
+
+        try:
+            python_type = self._translate_expression(parse_type(cpp_type))
+        except TypeParseError:
+            python_type = None
+
+        with self._lock:
+            if key[1] == self.class_set_version:
+                self._memo[key] = python_type
+                if len(self._memo) > self.max_size:
+                    self._memo.popitem(last=False)
+                    self.stats.evictions += 1
+
+        return python_type
+
+    def _translate_expression(self, expression: TypeExpression) -> str | None:
+        if expression.arguments is None:
+            return self._translate_name(expression.name)
+
+        validated_types: list[str] = []
+        for argument in expression.arguments:
+            if not (validated_type := self._translate_argument(argument)):
+                return None
+            validated_types.append(validated_type.replace(" ", ""))
+
+        name = expression.name
+        for template, python_type in TRANSLATION_TEMPLATE.items():
+            name = name.replace(template, python_type)
+
+        python_type = f"{name}[{','.join(validated_types)}]{expression.suffix}"
+        if validated_types and python_type.endswith("[]"):
+            python_type = python_type[:-2]
+
+        return self._translate_name(python_type)
+
+    def _translate_argument(self, argument: TypeExpression) -> str | None:
+        if argument.arguments is None and not argument.name:
+            return None
+        return self._translate_expression(argument)
+
+    def _translate_name(self, python_type: str) -> str | None:
+        if " " in python_type:
+            for prefix in TYPE_IGNORE_PREFIXES:
+                if python_type.startswith(prefix):
+                    python_type = python_type.rpartition(" ")[2]
+
+        python_type = TRANSLATION_TYPE.get(python_type, python_type)
+
+        # Replace namespace C++ syntax with Python
+        if "::" in python_type:
+            python_type = python_type.replace("::", ".")
+
+        if python_type.startswith("FB"):
+            class_name = python_type
+            if "." in python_type:
+                class_name = python_type.partition(".")[0]
+            if class_name not in self.class_names:
+                return None
+
+        return python_type
+
+
+def is_type_defined(_type: str | None) -> TypeGuard[str]:
+    if not _type:
+        return False
+
+    return _type != "object" and _type != "Any"
@@ -1,38 +1,120 @@
 from __future__ import annotations
 
-import threading
+import enum
+import os
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
 import typing
 
 from ..module_types import StubClass, StubFunction, StubProperty
 from ..flags import GeneratorFlag
+from ..profiling import ModuleProfile, PatchKind
+
+
+def get_default_jobs() -> int:
+    """ Get the default number of worker threads used by plugins that have threading enabled """
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ModelPart(enum.Flag):
+    """
+    The parts of the stubs plugins can read & write, used to find plugins that can run at the same time.
+    Names, references & which values an enum has are never changed by plugins, and can always be read.
+    """
+    NONE = 0
+    DOCSTRINGS = enum.auto()  # Docstrings of classes, enums, properties & functions
+    DEPRECATION = enum.auto()  # Deprecation messages
+    ENUM_VALUES = enum.auto()  # Type & value of the enum members
+    PROPERTY_TYPES = enum.auto()  # Type & setter type of class properties
+    PROPERTY_ACCESS = enum.auto()  # If class properties are read only
+    FUNCTION_SIGNATURES = enum.auto()  # Parameter names, types & default values, return types & if functions are static
+    CLASS_MEMBERS = enum.auto()  # The properties, functions & nested enums of a class
+    CLASS_PARENTS = enum.auto()
+
+    ALL = DOCSTRINGS | DEPRECATION | ENUM_VALUES | PROPERTY_TYPES | PROPERTY_ACCESS | FUNCTION_SIGNATURES | CLASS_MEMBERS | CLASS_PARENTS
+
+
+class StubIndex(typing.NamedTuple):
+    """ The stubs of a module mapped by name, built once and shared by all plugins """
+    classes: dict[str, StubClass]
+    enums: dict[str, StubClass]
+    functions: dict[str, list[StubFunction]]
+
+    @classmethod
+    def build(cls, stub_enums: list[StubClass], stub_classes: list[StubClass], stub_functions: list[list[StubFunction]]) -> StubIndex:
+        return cls(classes={x.name: x for x in stub_classes},
+                   enums={x.name: x for x in stub_enums},
+                   functions={x[0].name: x for x in stub_functions if x})
+
+
+def run_patch_items(patch_function: typing.Callable, stub_list: list[StubClass] | list[list[StubFunction]], jobs: int, name: str) -> list:
+    """
+    Run the patch function on each item in the list, using a pool of `jobs` worker threads if more than 1.
+
+    Returns: The results of the patch function, in the same order as the items
+    Raises: ExceptionGroup with the exceptions of all items that failed, when threaded
+    """
+    if jobs <= 1:
+        return [patch_function(x) for x in stub_list]
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix=name) as executor:
+        futures = [executor.submit(patch_function, x) for x in stub_list]
+
+    results = []
+    exceptions: list[Exception] = []
+    for future in futures:
+        exception = future.exception()
+        if exception is None:
+            results.append(future.result())
+        elif isinstance(exception, Exception):
+            exceptions.append(exception)
+        else:
+            raise exception
+
+    if exceptions:
+        raise ExceptionGroup(f"{name}: {len(exceptions)} of {len(stub_list)} items failed to patch", exceptions)
+
+    return results
 
 
 class PluginBaseClass:
     THREADING = False
     PRIORITY = 100
 
+    # The parts of the stubs the plugin reads & writes, plugins that don't conflict may run at the same time
+    READS = ModelPart.ALL
+    WRITES = ModelPart.ALL
+
     def __init__(self, 
                  version: int, 
                  module: ModuleType, 
                  stub_enums: list[StubClass], 
                  stub_classes: list[StubClass], 
                  stub_functions: list[list[StubFunction]], 
-                 flags: GeneratorFlag) -> None:
+                 flags: GeneratorFlag,
+                 jobs: int | None = None,
+                 profile: ModuleProfile | None = None,
+                 index: StubIndex | None = None) -> None:
         self.flags = flags
         self.version = version
         self.module = module
+        self.jobs = jobs or get_default_jobs()
+        self.profile = profile if profile is not None else ModuleProfile(module.__name__)
 
         self.stub_enums = stub_enums
         self.stub_classes = stub_classes
         self.stub_functions = stub_functions
 
-        self.map_classes = {x.name: x for x in stub_classes}
-        self.map_enums = {x.name: x for x in stub_enums}
-        self.map_functions = {x[0].name: x for x in stub_functions if x}
+        if index is None:
+            index = StubIndex.build(stub_enums, stub_classes, stub_functions)
 
-        self.exceptions = []
+        self.map_classes = index.classes
+        self.map_enums = index.enums
+        self.map_functions = index.functions
+
+        self.exceptions: list[Exception] = []
 
     def should_patch(self) -> bool:
         return True
@@ -66,40 +148,46 @@ class PluginBaseClass:
         self._patch_classes(self.stub_classes)
         self._patch_functions(self.stub_functions)
 
+    def get_patch_function(self, kind: PatchKind) -> typing.Callable:
+        if kind == PatchKind.ENUM:
+            return self.patch_enum
+        if kind == PatchKind.CLASS:
+            return self.patch_class
+        return self.patch_function_group
+
     def _patch_enums(self, stub_enums: list[StubClass]):
-        self._run_patcher(self.patch_enum, stub_enums)
+        self._run_patcher(self.patch_enum, stub_enums, PatchKind.ENUM)
 
     def _patch_classes(self, stub_classes: list[StubClass]):
-        self._run_patcher(self.patch_class, stub_classes)
+        self._run_patcher(self.patch_class, stub_classes, PatchKind.CLASS)
 
     def _patch_functions(self, stub_functions: list[list[StubFunction]]):
-        self._run_patcher(self.patch_function_group, stub_functions)
-
-    def _run_patcher(self, patch_function: typing.Callable, stub_list: list[StubClass] | list[list[StubFunction]]):
-        event_stop = threading.Event()
-
-        def _threaded_patcher(self, stub_item: StubClass | list[StubFunction]):
-            try:
-                patch_function(stub_item)
-            except Exception as e:
-                self.exceptions.append(e)
-                event_stop.set()
-
-        if self.THREADING:
-            threads: list[threading.Thread] = []
-            for x in stub_list:
-                thread = threading.Thread(target=_threaded_patcher, args=(self, x,))
-                threads.append(thread)
-                thread.start()
-            for thread in threads:
-                thread.join()
-
-            if self.exceptions:
-                raise self.exceptions[0]
-
-            if event_stop.is_set():
-                for thread in threads:
-                    thread.join()
-        else:
-            for x in stub_list:
-                patch_function(x)
+        self._run_patcher(self.patch_function_group, stub_functions, PatchKind.FUNCTION)
+
+    def _run_patcher(self, patch_function: typing.Callable, stub_list: list[StubClass] | list[list[StubFunction]], kind: PatchKind) -> list:
+        """
+        Run the patch function on each item in the list, using a pool of `self.jobs` worker threads if threading is enabled.
+        The time spent on each item is added to `self.profile`.
+
+        Returns: The results of the patch function, in the same order as the items
+        """
+        plugin_name = self.__class__.__name__
+        jobs = self.jobs if self.THREADING else 1
+
+        start_time = time.perf_counter()
+        try:
+            return run_patch_items(lambda item: self._patch_item(patch_function, kind, item), stub_list, jobs, plugin_name)
+        except ExceptionGroup as e:
+            self.exceptions.extend(e.exceptions)
+            raise
+        finally:
+            self.profile.add_patch_wall_time(plugin_name, kind, time.perf_counter() - start_time)
+
+    def _patch_item(self, patch_function: typing.Callable, kind: PatchKind, item: StubClass | list[StubFunction]):
+        """ Run the patch function on a single item, and add the time it took to `self.profile` """
+        start_time = time.perf_counter()
+        try:
+            return patch_function(item)
+        finally:
+            item_name = item.name if isinstance(item, StubClass) else (item[0].name if item else "")
+            self.profile.add_patch_time(self.__class__.__name__, kind, item_name, time.perf_counter() - start_time)
@@ -0,0 +1,161 @@
+"""
+Run plugins that don't conflict at the same time, based on the parts of the stubs they declare in `READS` & `WRITES`.
+
+A plugin depends on every plugin before it (in priority order) that writes something it reads or writes, or reads
+something it writes. The plugins form a DAG and a plugin starts as soon as all the plugins it depends on are done,
+so the result is the same as running them one after another.
+
+In verify mode the plugins run one at a time, and the stubs are compared before & after each plugin to make sure
+it only changed the parts it declares in `WRITES`.
+"""
+from __future__ import annotations
+
+import typing
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .plugin_base import ModelPart, PluginBaseClass, get_default_jobs
+from ..module_types import StubClass, StubFunction
+
+
+class PluginAccessError(RuntimeError):
+    """ A plugin changed a part of the stubs it doesn't declare in `WRITES` """
+
+
+# -------------------------------------------------------------
+#                       Dependencies
+# -------------------------------------------------------------
+
+def conflicts(first: type[PluginBaseClass], second: type[PluginBaseClass]) -> bool:
+    """ If the two plugins must not run at the same time """
+    return bool(first.WRITES & (second.READS | second.WRITES) or first.READS & second.WRITES)
+
+
+def get_dependencies(plugin_classes: list[type[PluginBaseClass]]) -> list[set[int]]:
+    """
+    Get the indices of the plugins each plugin must wait for, the plugins must already be sorted by priority
+
+    Returns: A set for each plugin, with the indices of the earlier plugins it conflicts with
+    """
+    return [{j for j in range(i) if conflicts(plugin_classes[j], plugin_classes[i])} for i in range(len(plugin_classes))]
+
+
+# -------------------------------------------------------------
+#                       Verification
+# -------------------------------------------------------------
+
+ModelState = dict[ModelPart, dict[int, typing.Hashable]]
+
+
+def _get_all_enums(stub_enums: list[StubClass], stub_classes: list[StubClass]) -> list[StubClass]:
+    return stub_enums + [x for stub_class in stub_classes for x in stub_class.stub_enums]
+
+
+def _get_all_functions(stub_classes: list[StubClass], stub_functions: list[list[StubFunction]]) -> list[StubFunction]:
+    groups = stub_functions + [x for stub_class in stub_classes for x in stub_class.stub_functions]
+    return [x for group in groups for x in group]
+
+
+def get_model_state(stub_enums: list[StubClass], stub_classes: list[StubClass], stub_functions: list[list[StubFunction]]) -> ModelState:
+    """
+    Get the state of each part of the stubs, mapped by the id of the object it belongs to.
+    Objects that are added or removed show up as changed class members, not as changes to the other parts.
+    """
+    all_enums = _get_all_enums(stub_enums, stub_classes)
+    all_functions = _get_all_functions(stub_classes, stub_functions)
+    class_properties = [x for stub_class in stub_classes for x in stub_class.stub_properties]
+    enum_properties = [x for stub_enum in all_enums for x in stub_enum.stub_properties]
+    all_objects = stub_classes + all_enums + class_properties + enum_properties + all_functions
+
+    return {
+        ModelPart.DOCSTRINGS: {id(x): x.docstring for x in all_objects},
+        ModelPart.DEPRECATION: {id(x): x.deprecation_message for x in all_objects},
+        ModelPart.ENUM_VALUES: {id(x): (x._type, x.value) for x in enum_properties},
+        ModelPart.PROPERTY_TYPES: {id(x): (x._type, x.setter_type) for x in class_properties},
+        ModelPart.PROPERTY_ACCESS: {id(x): x.read_only for x in class_properties},
+        ModelPart.FUNCTION_SIGNATURES: {
+            id(x): (x._return_type, x.is_static, tuple((p.name, p._type, p.default_value) for p in x._params))
+            for x in all_functions
+        },
+        ModelPart.CLASS_MEMBERS: {
+            id(x): (tuple(tuple(map(id, group)) for group in x.stub_functions), tuple(map(id, x.stub_properties)), tuple(map(id, x.stub_enums)))
+            for x in stub_classes
+        },
+        ModelPart.CLASS_PARENTS: {id(x): tuple(x.parents) for x in stub_classes},
+    }
+
+
+def get_changed_parts(before: ModelState, after: ModelState) -> ModelPart:
+    changed_parts = ModelPart.NONE
+    for part, before_values in before.items():
+        after_values = after[part]
+        if any(after_values[key] != value for key, value in before_values.items() if key in after_values):
+            changed_parts |= part
+    return changed_parts
+
+
+# -------------------------------------------------------------
+#                       Scheduler
+# -------------------------------------------------------------
+
+class PluginScheduler:
+    def __init__(self,
+                 plugin_classes: list[type[PluginBaseClass]],
+                 stub_enums: list[StubClass],
+                 stub_classes: list[StubClass],
+                 stub_functions: list[list[StubFunction]],
+                 jobs: int | None = None,
+                 verify: bool = False):
+        """
+        ### Parameters:
+            - plugin_classes: The plugins to run, sorted by priority
+            - jobs: Max number of plugins running at the same time
+            - verify: Run one plugin at a time and raise a PluginAccessError if it changes parts it doesn't declare in `WRITES`
+        """
+        self.plugin_classes = plugin_classes
+        self.stub_enums = stub_enums
+        self.stub_classes = stub_classes
+        self.stub_functions = stub_functions
+        self.jobs = 1 if verify else (jobs or get_default_jobs())
+        self.verify = verify
+
+        self.dependencies = get_dependencies(plugin_classes)
+
+    def run(self, run_plugin: typing.Callable[[type[PluginBaseClass]], None]):
+        """
+        Run all plugins, each plugin starts as soon as the plugins it depends on are done
+
+        ### Parameters:
+            - run_plugin: Creates & runs a plugin, called from a worker thread
+        """
+        if self.verify:
+            run_plugin = self._get_verified_runner(run_plugin)
+
+        remaining = {i: set(x) for i, x in enumerate(self.dependencies)}
+        running: dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="PluginScheduler") as executor:
+            while remaining or running:
+                for index in [i for i, x in remaining.items() if not x]:
+                    del remaining[index]
+                    running[executor.submit(run_plugin, self.plugin_classes[index])] = index
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished_index = running.pop(future)
+                    future.result()  # Re-raise any exception from the plugin
+
+                    for dependencies in remaining.values():
+                        dependencies.discard(finished_index)
+
+    def _get_verified_runner(self, run_plugin: typing.Callable[[type[PluginBaseClass]], None]) -> typing.Callable[[type[PluginBaseClass]], None]:
+        def _run_verified(plugin_cls: type[PluginBaseClass]):
+            before = get_model_state(self.stub_enums, self.stub_classes, self.stub_functions)
+            run_plugin(plugin_cls)
+            after = get_model_state(self.stub_enums, self.stub_classes, self.stub_functions)
+
+            undeclared_parts = get_changed_parts(before, after) & ~plugin_cls.WRITES
+            if undeclared_parts:
+                raise PluginAccessError(f"{plugin_cls.__name__} changed {undeclared_parts} which it doesn't declare in WRITES ({plugin_cls.WRITES})")
+
+        return _run_verified
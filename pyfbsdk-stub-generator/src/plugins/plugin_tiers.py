@@ -0,0 +1,79 @@
+"""
+Run the plugins with the same priority together, walking the enums, classes & functions once per priority
+instead of once per plugin.
+
+Each item is passed to every plugin of the tier in priority order, so a plugin sees the changes the plugins before it
+made to the same item, just like when they run one after another. A plugin may however look at other items than the
+one it's given (e.g. the parents of a class), which may already have been patched by a later plugin of the same tier.
+So a tier is split before each plugin that conflicts with a plugin already in it, based on their `READS` & `WRITES`
+(see `plugin_scheduler.conflicts`).
+"""
+from __future__ import annotations
+
+import itertools
+import time
+
+from .plugin_base import PluginBaseClass, run_patch_items
+from .plugin_scheduler import conflicts
+from ..module_types import StubClass, StubFunction
+from ..profiling import PatchKind
+
+
+def split_at_conflicts(plugin_classes: list[type[PluginBaseClass]]) -> list[list[type[PluginBaseClass]]]:
+    """ Split the plugins into consecutive groups, starting a new group at each plugin that conflicts with the current group """
+    groups: list[list[type[PluginBaseClass]]] = []
+    for plugin_cls in plugin_classes:
+        if groups and not any(conflicts(x, plugin_cls) for x in groups[-1]):
+            groups[-1].append(plugin_cls)
+        else:
+            groups.append([plugin_cls])
+    return groups
+
+
+def group_by_priority(plugin_classes: list[type[PluginBaseClass]]) -> list[list[type[PluginBaseClass]]]:
+    """
+    Group the plugins that can run in a single pass, the plugins must already be sorted by priority.
+    Plugins with the same priority are split into several groups where they conflict with each other.
+    """
+    return [tier for _, group in itertools.groupby(plugin_classes, key=lambda x: x.PRIORITY) for tier in split_at_conflicts(list(group))]
+
+
+def can_fuse(plugins: list[PluginBaseClass]) -> bool:
+    """
+    Plugins overriding `run` must run on their own, since they may do more than patching the items.
+    Conflicting plugins must run one after another, since they may look at items another plugin hasn't patched yet.
+    """
+    if len(plugins) < 2 or any(type(x).run is not PluginBaseClass.run for x in plugins):
+        return False
+    return not any(conflicts(type(first), type(second)) for first, second in itertools.combinations(plugins, 2))
+
+
+def run_tier(plugins: list[PluginBaseClass],
+             stub_enums: list[StubClass],
+             stub_classes: list[StubClass],
+             stub_functions: list[list[StubFunction]]):
+    """ Run plugins with the same priority, in a single pass over the items if possible """
+    plugins = [x for x in plugins if x.should_patch()]
+    if not can_fuse(plugins):
+        for plugin in plugins:
+            plugin.run()
+        return
+
+    priority = plugins[0].PRIORITY
+    print(f"  [{priority}] Running plugins: {', '.join(type(x).__name__ for x in plugins)}")
+
+    tier_name = f"Tier{priority}"
+    jobs = min(x.jobs for x in plugins) if all(x.THREADING for x in plugins) else 1
+
+    for kind, stub_list in ((PatchKind.ENUM, stub_enums), (PatchKind.CLASS, stub_classes), (PatchKind.FUNCTION, stub_functions)):
+        patch_functions = [(plugin, plugin.get_patch_function(kind)) for plugin in plugins]
+
+        def _patch_item(item: StubClass | list[StubFunction]):
+            for plugin, patch_function in patch_functions:
+                plugin._patch_item(patch_function, kind, item)
+
+        start_time = time.perf_counter()
+        try:
+            run_patch_items(_patch_item, stub_list, jobs, tier_name)
+        finally:
+            plugins[0].profile.add_patch_wall_time(tier_name, kind, time.perf_counter() - start_time)
@@ -6,12 +6,14 @@ from __future__ import annotations
 
 import pyfbsdk
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 from ...module_types import StubClass
 
 
 class PluginPyfbsdkImports(PluginBaseClass):
     PRIORITY = 200
+    READS = ModelPart.CLASS_MEMBERS | ModelPart.CLASS_PARENTS | ModelPart.PROPERTY_TYPES
+    WRITES = ModelPart.CLASS_PARENTS | ModelPart.PROPERTY_TYPES
 
     def should_patch(self) -> bool:
         return self.module is not pyfbsdk
@@ -19,7 +21,7 @@ class PluginPyfbsdkImports(PluginBaseClass):
     def patch_class(self, stub_class: StubClass):
         for parent_index, parent in enumerate(stub_class.parents):
             if parent.startswith("FB") and hasattr(pyfbsdk, parent):
-                stub_class.parents[parent_index] = f"pyfbsdk.{parent}"
+                stub_class.set_parent(parent_index, f"pyfbsdk.{parent}")
 
             for stub_property in stub_class.stub_properties:
                 if stub_property.Type.startswith("FB") and hasattr(pyfbsdk, stub_property.Type):
@@ -4,11 +4,13 @@ Mark properties as read-only if docstring hints at it.
 
 from __future__ import annotations
 
-from ..plugin_base import PluginBaseClass
+from ..plugin_base import ModelPart, PluginBaseClass
 
 
 class PluginReadOnly(PluginBaseClass):
     PRIORITY = 100
+    READS = ModelPart.DOCSTRINGS | ModelPart.CLASS_MEMBERS
+    WRITES = ModelPart.PROPERTY_ACCESS
 
     def patch_property(self, stub_class, stub_property):
         if stub_property.docstring:
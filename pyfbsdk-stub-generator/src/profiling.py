@@ -0,0 +1,172 @@
+"""
+Timings & counters collected while generating the stub files, to see where the time is spent.
+
+Each module gets a `ModuleProfile` that is filled in by the generator & the plugins, they're collected in a `RunProfile`
+that can be written to a JSON file (see the `--profile` option) and printed as a summary.
+"""
+from __future__ import annotations
+
+import contextlib
+import enum
+import json
+import threading
+import time
+import tracemalloc
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+DEFAULT_SLOWEST_COUNT = 10
+
+
+class PatchKind(enum.StrEnum):
+    ENUM = "enum"
+    CLASS = "class"
+    FUNCTION = "function"
+
+
+@dataclass
+class PatchTiming:
+    count: int = 0
+    item_time: float = 0.0  # Sum of the time spent on each item, can be more than the wall time when threaded
+    wall_time: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "item_time": self.item_time, "wall_time": self.wall_time}
+
+
+@dataclass
+class ModuleProfile:
+    module_name: str
+
+    stages: dict[str, float] = field(default_factory=dict)
+    plugins: dict[str, dict[PatchKind, PatchTiming]] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    sections: dict[str, dict] = field(default_factory=dict)  # Additional data reported by plugins, e.g. documentation requests
+
+    # Time spent patching each enum & class, summed over all plugins
+    class_times: dict[str, float] = field(default_factory=dict)
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """ Time a stage of the generation, stages with the same name are added together """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed_time
+
+    def _get_patch_timing(self, plugin_name: str, kind: PatchKind) -> PatchTiming:
+        return self.plugins.setdefault(plugin_name, {}).setdefault(kind, PatchTiming())
+
+    def add_patch_time(self, plugin_name: str, kind: PatchKind, item_name: str, elapsed_time: float):
+        """ Add the time it took a plugin to patch a single enum, class or function group """
+        with self._lock:
+            timing = self._get_patch_timing(plugin_name, kind)
+            timing.count += 1
+            timing.item_time += elapsed_time
+
+            if kind != PatchKind.FUNCTION:
+                self.class_times[item_name] = self.class_times.get(item_name, 0.0) + elapsed_time
+
+    def add_patch_wall_time(self, plugin_name: str, kind: PatchKind, elapsed_time: float):
+        with self._lock:
+            self._get_patch_timing(plugin_name, kind).wall_time += elapsed_time
+
+    def set_counter(self, name: str, value: int):
+        with self._lock:
+            self.counters[name] = value
+
+    def add_section(self, name: str, data: dict):
+        with self._lock:
+            self.sections[name] = data
+
+    def get_slowest_classes(self, count: int = DEFAULT_SLOWEST_COUNT) -> list[tuple[str, float]]:
+        return sorted(self.class_times.items(), key=lambda x: x[1], reverse=True)[:count]
+
+    def to_dict(self, slowest_count: int = DEFAULT_SLOWEST_COUNT) -> dict:
+        return {
+            "module": self.module_name,
+            "stages": self.stages,
+            "plugins": {
+                plugin_name: {kind.value: timing.to_dict() for kind, timing in timings.items()}
+                for plugin_name, timings in self.plugins.items()
+            },
+            "counters": self.counters,
+            "slowest_classes": [{"name": name, "time": elapsed_time} for name, elapsed_time in self.get_slowest_classes(slowest_count)],
+            **self.sections,
+        }
+
+
+@dataclass
+class RunProfile:
+    slowest_count: int = DEFAULT_SLOWEST_COUNT
+    trace_memory: bool = True  # Track the peak memory usage, this slows down the generation
+
+    modules: list[ModuleProfile] = field(default_factory=list)
+    total_time: float = 0.0
+    peak_memory: int | None = None  # In bytes
+
+    _start_time: float = field(default=0.0, repr=False)
+
+    def start(self):
+        self._start_time = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        self.total_time = time.perf_counter() - self._start_time
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def add_module(self, module_name: str) -> ModuleProfile:
+        module_profile = ModuleProfile(module_name)
+        self.modules.append(module_profile)
+        return module_profile
+
+    def to_dict(self) -> dict:
+        return {
+            "total_time": self.total_time,
+            "peak_memory": self.peak_memory,
+            "modules": [x.to_dict(self.slowest_count) for x in self.modules],
+        }
+
+    def write_json(self, filepath: str | Path):
+        with open(filepath, "w") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    def summary(self) -> str:
+        lines = [f"Total time: {self.total_time:.2f}s"]
+        if self.peak_memory is not None:
+            lines.append(f"Peak memory: {self.peak_memory / 1_000_000:.1f} MB")
+
+        for module_profile in self.modules:
+            lines.append(f"\n{module_profile.module_name}")
+            lines.append("  " + ", ".join(f"{name}: {value}" for name, value in module_profile.counters.items()))
+
+            lines.append("  Stages:")
+            for name, elapsed_time in module_profile.stages.items():
+                lines.append(f"    {name:<40} {elapsed_time:8.3f}s")
+
+            lines.append("  Plugins (wall time / summed item time):")
+            for plugin_name, timings in module_profile.plugins.items():
+                kinds = ", ".join(f"{kind.value} {x.wall_time:.3f}s / {x.item_time:.3f}s" for kind, x in timings.items())
+                lines.append(f"    {plugin_name:<40} {kinds}")
+
+            for section_name, data in module_profile.sections.items():
+                values = ", ".join(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}"
+                                   for key, value in data.items() if isinstance(value, (int, float)))
+                lines.append(f"  {section_name.capitalize()}: {values}")
+
+            if slowest_classes := module_profile.get_slowest_classes(self.slowest_count):
+                lines.append("  Slowest classes:")
+                for name, elapsed_time in slowest_classes:
+                    lines.append(f"    {name:<40} {elapsed_time:8.3f}s")
+
+        return "\n".join(lines)
@@ -0,0 +1,155 @@
+"""
+Parse the function signatures from Boost.Python docstrings, e.g.:
+`ShowToolByName( (str)arg1 [, (object)arg2]) -> object :`
+
+Many methods share the exact same docstring (e.g. inherited & overridden methods of the FBProperty classes),
+so the parsed signatures are memoized on the docstring text. They're immutable, and turned into new
+`StubParameter` instances by the native generator each time. The memo is cleared once a module's stubs are generated.
+
+Most parameter lists are parsed by splitting on commas, only the ones with parentheses inside of a type
+(e.g. `(tuple(float, float))arg1`) go through the tokenizer.
+"""
+from __future__ import annotations
+
+import functools
+import re
+import typing
+
+
+OPTIONAL_DEFAULT_VALUE = "None"
+
+# A token in the parameters of a signature, types may contain parentheses, e.g. `(tuple(float, float))arg1`
+TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+) | (?P<open>\[) | (?P<close>\]) | (?P<separator>,) |
+    \((?P<type>(?:[^()]|\([^()]*\))*)\)(?P<name>[^,\[\]]*) |
+    (?P<other>[^,\[\]]+)
+""", re.VERBOSE)
+
+
+class ParsedParameter(typing.NamedTuple):
+    name: str
+    type: str
+    default_value: str | None  # OPTIONAL_DEFAULT_VALUE if the parameter is inside an optional group
+
+
+class ParsedSignature(typing.NamedTuple):
+    parameters: tuple[ParsedParameter, ...]
+    return_type: str
+
+
+# -------------------------------------------------------------
+#                       Tokenizer
+# -------------------------------------------------------------
+
+def _apply_brackets(optional_depth: int, text: str) -> int:
+    """ Get the optional depth after the brackets in text, other characters are ignored """
+    for char in text:
+        if char == "[":
+            optional_depth += 1
+        elif char == "]":
+            optional_depth = max(0, optional_depth - 1)
+    return optional_depth
+
+
+def _parse_simple_parameters(text: str) -> tuple[ParsedParameter, ...] | None:
+    """
+    Parse the parameters by splitting on commas, which is enough for most signatures.
+
+    Returns: The parameters, or None if a type contains parentheses, commas or brackets (or the text is otherwise
+    unusual) and the text must be tokenized instead.
+    """
+    parameters: list[ParsedParameter] = []
+    optional_depth = 0
+    for piece in text.split(","):
+        body = piece.strip(" []")
+        has_brackets = "[" in piece or "]" in piece
+        if not body:
+            if has_brackets:
+                optional_depth = _apply_brackets(optional_depth, piece)
+            continue
+
+        if body[0].isspace() or body.count("(") > 1:
+            return None
+
+        body_start = len(piece) - len(piece.lstrip(" []"))
+        if has_brackets:
+            if "[" in body or "]" in body:
+                return None
+            optional_depth = _apply_brackets(optional_depth, piece[:body_start])
+
+        if body[0] == "(":
+            type_str, separator, name = body[1:].partition(")")
+            if not separator:
+                return None
+        else:
+            type_str, name = "", body
+
+        parameters.append(ParsedParameter(name.rstrip(), type_str, OPTIONAL_DEFAULT_VALUE if optional_depth else None))
+        if has_brackets:
+            optional_depth = _apply_brackets(optional_depth, piece[body_start + len(body):])
+
+    return tuple(parameters)
+
+
+def parse_parameters(text: str) -> tuple[ParsedParameter, ...]:
+    """
+    Parse the parameters of a signature, e.g. `(str)arg1 [, (object)arg2 [, (int)arg3]]`
+
+    Commas & brackets inside of the parenthesized types are ignored, and all parameters inside of an
+    optional group `[...]` (including nested groups) are optional.
+    """
+    parameters = _parse_simple_parameters(text)
+    if parameters is not None:
+        return parameters
+
+    return _tokenize_parameters(text)
+
+
+def _tokenize_parameters(text: str) -> tuple[ParsedParameter, ...]:
+    parameters: list[ParsedParameter] = []
+    optional_depth = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == "open":
+            optional_depth += 1
+        elif kind == "close":
+            optional_depth = max(0, optional_depth - 1)
+        elif kind in ("space", "separator"):
+            continue
+        else:
+            if kind == "name":
+                type_str, name = match.group("type"), match.group("name").rstrip()
+            else:
+                type_str, name = "", match.group("other").rstrip()
+
+            parameters.append(ParsedParameter(name, type_str, OPTIONAL_DEFAULT_VALUE if optional_depth else None))
+
+    return tuple(parameters)
+
+
+def parse_signature_line(line: str) -> ParsedSignature:
+    """ Parse a line in the format `FunctionName( (str)arg1 [, (object)arg2]) -> object` """
+    line = line.partition("(")[2]  # Remove function name
+    parameters_str, _, return_type = line.rpartition("->")
+    parameters_str = parameters_str.rpartition(")")[0]
+
+    return ParsedSignature(parse_parameters(parameters_str), return_type.strip(" :").strip())
+
+
+# -------------------------------------------------------------
+#                       Functions
+# -------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def parse_docstring(function_name: str, docstring: str) -> tuple[ParsedSignature, ...]:
+    """
+    Get the signatures from a docstring, there can be multiple if the function has overloads.
+    Lines that aren't a signature of the function (e.g. the C++ signatures) are skipped.
+    """
+    signatures: list[ParsedSignature] = []
+    for line in docstring.split("\n"):
+        if "->" not in line or "(" not in line or ")" not in line or not line.strip().startswith(function_name):
+            continue
+        signatures.append(parse_signature_line(line))
+
+    return tuple(signatures)
@@ -0,0 +1,450 @@
+"""
+Save & replay the raw introspection of a module.
+
+A snapshot contains everything the native generator reads from the live modules (classes, bases, members,
+docstrings, static methods & enum values), stored as a compressed JSON file. Replaying a snapshot rebuilds a
+stand-in module with the same shape as the Boost.Python original, which allows the whole generator pipeline
+to run on any Python interpreter without MotionBuilder.
+"""
+from __future__ import annotations
+
+import builtins
+import platform
+import typing
+import types
+import gzip
+import json
+import sys
+
+from types import ModuleType
+from pathlib import Path
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_FILE_SUFFIX = ".snapshot.json.gz"
+
+BOOST_PYTHON_MODULE = "Boost.Python"
+
+# Entries that are automatically created by `type()` when the stand-in classes are rebuilt
+AUTO_CLASS_ATTRIBUTES = {"__dict__", "__weakref__", "__module__", "__qualname__", "__doc__"}
+
+# Entries that are re-created from the enum values when a stand-in enum is rebuilt
+AUTO_ENUM_ATTRIBUTES = {"names", "values"}
+
+
+class MemberKind:
+    CLASS = "c"
+    FUNCTION = "f"
+    PROPERTY = "p"
+    ENUM_VALUE = "e"
+    BUILTIN = "b"
+    OBJECT = "o"
+
+
+class LoadedSnapshot(typing.NamedTuple):
+    module: ModuleType
+    version: int
+
+
+# -------------------------------------------------------------
+#                       Helper Functions
+# -------------------------------------------------------------
+
+def get_snapshot_filepath(directory: str | Path, module_name: str) -> Path:
+    return Path(directory) / f"{module_name}{SNAPSHOT_FILE_SUFFIX}"
+
+
+def is_enum_value(obj: object) -> bool:
+    """ Check if the object is a value of a Boost.Python enum """
+    return isinstance(obj, int) and not isinstance(obj, bool) and isinstance(getattr(type(obj), "names", None), dict)
+
+
+def is_enum_value_type(cls: type) -> bool:
+    """ Check if the class is a Boost.Python enum type """
+    return any(x.__module__ == BOOST_PYTHON_MODULE and x.__name__ == "enum" for x in cls.__mro__)
+
+
+def get_enum_value_name(value: int) -> str:
+    name = getattr(value, "name", None)
+    if isinstance(name, str):
+        return name
+
+    for key, enum_value in type(value).names.items():  # type: ignore
+        if enum_value is value:
+            return key
+
+    return str(value)
+
+
+# -------------------------------------------------------------
+#                         Recording
+# -------------------------------------------------------------
+
+class _SnapshotRecorder:
+    def __init__(self, module: ModuleType):
+        self.module = module
+
+        self.class_ids: dict[int, str] = {}
+        self.class_records: list[dict] = []
+        self.root_records: dict[str, list[str]] = {}
+        self.required_modules: set[str] = set()
+
+    def get_class_id(self, cls: type, nested_id: str | None = None) -> str:
+        """
+        Get the snapshot id of a class, the class will be recorded the first time it's seen.
+
+        Args:
+            - cls: The class
+            - nested_id: The id to use if the class is defined in this module
+        """
+        if id(cls) in self.class_ids:
+            return self.class_ids[id(cls)]
+
+        if cls.__module__ == BOOST_PYTHON_MODULE:
+            class_id = f"{BOOST_PYTHON_MODULE}.{cls.__name__}"
+            self.class_ids[id(cls)] = class_id
+            self.root_records[class_id] = sorted(dir(cls))
+            return class_id
+
+        if cls.__module__ != self.module.__name__:
+            class_id = f"{cls.__module__}.{cls.__qualname__}"
+            self.class_ids[id(cls)] = class_id
+            if cls.__module__ != builtins.__name__:
+                self.required_modules.add(cls.__module__)
+            return class_id
+
+        class_id = nested_id or f"{self.module.__name__}.{cls.__name__}"
+        self.class_ids[id(cls)] = class_id
+        self.record_class(cls, class_id)
+        return class_id
+
+    def record_class(self, cls: type, class_id: str):
+        record = {
+            "id": class_id,
+            "name": cls.__name__,
+            "meta": type(cls).__name__,
+            "bases": [],
+            "doc": cls.__doc__,
+            "dict": [],
+        }
+        self.class_records.append(record)
+
+        record["bases"] = [self.get_class_id(x) for x in cls.__bases__]
+
+        ignore = AUTO_CLASS_ATTRIBUTES
+        if is_enum_value_type(cls):
+            ignore = AUTO_CLASS_ATTRIBUTES | AUTO_ENUM_ATTRIBUTES
+
+        for name, value in vars(cls).items():
+            if name not in ignore:
+                record["dict"].append([name, self.record_value(value, f"{class_id}.{name}")])
+
+    def record_value(self, value: object, nested_id: str) -> dict:
+        if isinstance(value, staticmethod):
+            record = self.record_value(value.__func__, nested_id)
+            record["s"] = 1
+            return record
+
+        if isinstance(value, type):
+            return {"k": MemberKind.CLASS, "id": self.get_class_id(value, nested_id)}
+
+        if type(value).__name__ == "function":
+            return {"k": MemberKind.FUNCTION, "n": getattr(value, "__name__", ""), "doc": value.__doc__}
+
+        if isinstance(value, property):
+            return {"k": MemberKind.PROPERTY, "doc": value.__doc__}
+
+        if is_enum_value(value):
+            return {"k": MemberKind.ENUM_VALUE, "id": self.get_class_id(type(value)), "n": get_enum_value_name(value), "v": int(value)}  # type: ignore
+
+        if isinstance(value, (types.BuiltinFunctionType, types.BuiltinMethodType)):
+            return {"k": MemberKind.BUILTIN}
+
+        return {"k": MemberKind.OBJECT, "t": type(value).__name__}
+
+    def record_module(self) -> dict:
+        members: list[list] = []
+        for name, value in vars(self.module).items():
+            if isinstance(value, type) or type(value).__name__ == "function" or is_enum_value(value):
+                members.append([name, self.record_value(value, f"{self.module.__name__}.{name}")])
+
+        self.required_modules.discard(self.module.__name__)
+
+        return {
+            "members": members,
+            "classes": self.class_records,
+            "roots": self.root_records,
+            "requires": sorted(self.required_modules),
+        }
+
+
+def take_snapshot(module: ModuleType, version: int) -> dict:
+    """
+    Record the introspection data of a module
+
+    Args:
+        - module: The live module, e.g. pyfbsdk
+        - version: The MotionBuilder version the module belongs to
+
+    Returns: A JSON serializable dict
+    """
+    content = _SnapshotRecorder(module).record_module()
+
+    return {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "module": module.__name__,
+        "version": version,
+        "python": platform.python_version(),
+        **content
+    }
+
+
+def save_snapshot(module: ModuleType, directory: str | Path, version: int) -> Path:
+    """
+    Save a snapshot of the module to `directory`
+
+    Returns: The filepath of the snapshot file
+    """
+    filepath = get_snapshot_filepath(directory, module.__name__)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    data = json.dumps(take_snapshot(module, version), separators=(",", ":"))
+    filepath.write_bytes(gzip.compress(data.encode("utf-8")))
+
+    return filepath
+
+
+# -------------------------------------------------------------
+#                       Stand-in Types
+# -------------------------------------------------------------
+
+class _BoostPythonClass(type):
+    """ Stand-in for the Boost.Python.class metaclass """
+
+
+_BoostPythonClass.__name__ = "class"
+_BoostPythonClass.__qualname__ = "class"
+
+
+class _Instance(metaclass=_BoostPythonClass):
+    """ Stand-in for Boost.Python.instance, the base class of all classes """
+
+
+class _Enum(int):
+    """ Stand-in for Boost.Python.enum, the base class of all enums """
+
+    def __new__(cls, value: int = 0, name: str = ""):
+        instance = super().__new__(cls, value)
+        instance.name = name
+        return instance
+
+    def __repr__(self):
+        return f"{type(self).__module__}.{type(self).__qualname__}.{self.name}"
+
+    def __str__(self):
+        return self.name
+
+
+for _root_cls, _root_name in ((_Instance, "instance"), (_Enum, "enum")):
+    _root_cls.__name__ = _root_name
+    _root_cls.__qualname__ = _root_name
+    _root_cls.__module__ = BOOST_PYTHON_MODULE
+
+ROOT_CLASSES: dict[str, type] = {
+    f"{BOOST_PYTHON_MODULE}.instance": _Instance,
+    f"{BOOST_PYTHON_MODULE}.enum": _Enum,
+}
+
+_placeholder_types: dict[str, type] = {}
+
+
+def _get_placeholder(type_name: str) -> object:
+    """ Create an object with the given type name """
+    if type_name not in _placeholder_types:
+        _placeholder_types[type_name] = type(type_name, (), {"__slots__": ()})
+    return _placeholder_types[type_name]()
+
+
+def _make_function(name: str, doc: str | None) -> types.FunctionType:
+    def function(*args, **kwargs):
+        raise NotImplementedError(f"'{name}' is a stand-in replayed from a snapshot and can not be called")
+
+    function.__name__ = name
+    function.__qualname__ = name
+    function.__doc__ = doc
+    return function
+
+
+# -------------------------------------------------------------
+#                          Replay
+# -------------------------------------------------------------
+
+class _SnapshotBuilder:
+    def __init__(self, data: dict):
+        self.module_name: str = data["module"]
+        self.data = data
+
+        self.module = ModuleType(self.module_name)
+        self.classes: dict[str, type] = {}
+        self.class_records = {x["id"]: x for x in data["classes"]}
+
+        for class_id, names in data["roots"].items():
+            self.classes[class_id] = self.get_root_class(class_id, names)
+
+    def get_root_class(self, class_id: str, names: list[str]) -> type:
+        root_cls = ROOT_CLASSES.get(class_id)
+        if root_cls is None:
+            root_cls = _BoostPythonClass(class_id.rpartition(".")[2], (), {"__module__": BOOST_PYTHON_MODULE})
+            ROOT_CLASSES[class_id] = root_cls
+
+        # Make sure the stand-in has every attribute the original had
+        for name in names:
+            if not hasattr(root_cls, name):
+                setattr(root_cls, name, _get_placeholder("object"))
+
+        return root_cls
+
+    def get_class(self, class_id: str) -> type:
+        if class_id in self.classes:
+            return self.classes[class_id]
+
+        if class_id in self.class_records:
+            return self.build_class(self.class_records[class_id])
+
+        # The class belongs to another module that must already be loaded
+        module_name, _, qualname = class_id.partition(".")
+        obj = sys.modules.get(module_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr, None)
+
+        if not isinstance(obj, type):
+            raise LookupError(f"Snapshot '{self.module_name}' references '{class_id}', load the snapshot of the module it belongs to first.")
+
+        self.classes[class_id] = obj
+        return obj
+
+    def build_class(self, record: dict) -> type:
+        bases = tuple(self.get_class(x) for x in record["bases"])
+
+        namespace: dict[str, typing.Any] = {"__module__": self.module_name, "__doc__": record["doc"]}
+        for name, value_record in record["dict"]:
+            if value_record["k"] not in (MemberKind.CLASS, MemberKind.ENUM_VALUE):
+                namespace[name] = self.build_value(value_record, name)
+
+        metaclass = type if record["meta"] == type.__name__ else type(bases[0]) if bases else _BoostPythonClass
+        cls = metaclass(record["name"], bases, namespace)
+        cls.__qualname__ = record["id"].partition(".")[2]
+        self.classes[record["id"]] = cls
+
+        if issubclass(cls, _Enum):
+            cls.names = {}
+            cls.values = {}
+            for name, value_record in record["dict"]:
+                if value_record["k"] == MemberKind.ENUM_VALUE and value_record["id"] == record["id"]:
+                    enum_value = cls(value_record["v"], value_record["n"])
+                    cls.names[value_record["n"]] = enum_value
+                    cls.values.setdefault(value_record["v"], enum_value)
+
+        return cls
+
+    def build_value(self, record: dict, name: str) -> object:
+        kind = record["k"]
+        if kind == MemberKind.CLASS:
+            return self.get_class(record["id"])
+
+        if kind == MemberKind.ENUM_VALUE:
+            enum_cls = self.get_class(record["id"])
+            return enum_cls.names[record["n"]]  # type: ignore
+
+        if kind == MemberKind.FUNCTION:
+            function = _make_function(record["n"] or name, record["doc"])
+            return staticmethod(function) if record.get("s") else function
+
+        if kind == MemberKind.PROPERTY:
+            return property(doc=record["doc"])
+
+        if kind == MemberKind.BUILTIN:
+            return len
+
+        return _get_placeholder(record["t"])
+
+    def build(self) -> ModuleType:
+        for record in self.data["classes"]:
+            self.get_class(record["id"])
+
+        # Attach nested classes & enum values once all classes exists
+        for record in self.data["classes"]:
+            cls = self.classes[record["id"]]
+            for name, value_record in record["dict"]:
+                if value_record["k"] in (MemberKind.CLASS, MemberKind.ENUM_VALUE):
+                    setattr(cls, name, self.build_value(value_record, name))
+
+        for name, value_record in self.data["members"]:
+            setattr(self.module, name, self.build_value(value_record, name))
+
+        return self.module
+
+
+def read_snapshot(filepath: str | Path) -> dict:
+    """ Read the raw data of a snapshot file """
+    data = json.loads(gzip.decompress(Path(filepath).read_bytes()))
+
+    if data.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format '{data.get('format')}' in {filepath}, expected '{SNAPSHOT_FORMAT_VERSION}'")
+
+    return data
+
+
+def build_snapshot(data: dict, install: bool = True) -> LoadedSnapshot:
+    """
+    Rebuild a stand-in module from snapshot data
+
+    Args:
+        - data: The snapshot data, as returned by `take_snapshot` or `read_snapshot`
+        - install: Register the module in `sys.modules`, so it can be imported by the generator & plugins
+
+    Returns: The stand-in module and the MotionBuilder version it was recorded from
+    """
+    module = _SnapshotBuilder(data).build()
+    if install:
+        sys.modules[module.__name__] = module
+
+    return LoadedSnapshot(module, data["version"])
+
+
+def load_snapshot(filepath: str | Path, install: bool = True) -> LoadedSnapshot:
+    """ Rebuild a stand-in module from a snapshot file, see `build_snapshot` """
+    return build_snapshot(read_snapshot(filepath), install)
+
+
+def load_snapshots(directory: str | Path) -> list[LoadedSnapshot]:
+    """
+    Load all snapshots in a directory, modules that others depend on are loaded first.
+    The modules are registered in `sys.modules`.
+    """
+    snapshot_data: dict[str, dict] = {}
+    for filepath in sorted(Path(directory).glob(f"*{SNAPSHOT_FILE_SUFFIX}")):
+        data = read_snapshot(filepath)
+        snapshot_data[data["module"]] = data
+
+    if not snapshot_data:
+        raise FileNotFoundError(f"No snapshot files found in: {directory}")
+
+    snapshots: list[LoadedSnapshot] = []
+    loaded: set[str] = set()
+
+    def _load(module_name: str):
+        if module_name in loaded:
+            return
+        loaded.add(module_name)
+
+        for required_module in snapshot_data[module_name]["requires"]:
+            if required_module in snapshot_data:
+                _load(required_module)
+
+        snapshots.append(build_snapshot(snapshot_data[module_name]))
+
+    for module_name in snapshot_data:
+        _load(module_name)
+
+    return snapshots
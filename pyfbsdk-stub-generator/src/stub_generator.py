@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import typing
 import time
+import io
 
 from types import ModuleType
 from pathlib import Path
@@ -8,8 +10,11 @@ from pathlib import Path
 import pyfbsdk
 
 from . import plugins, base_content, native_generator
-from .module_types import StubClass
+from .plugins import plugin_scheduler, plugin_tiers
+from .plugins.plugin_base import StubIndex
+from .module_types import StubClass, StubFunction
 from .flags import GeneratorFlag
+from .profiling import ModuleProfile
 
 
 DEFAULT_PLUGINS = plugins.get_default_plugins()
@@ -29,31 +34,133 @@ def get_motionbuilder_version() -> int:
 # -------------------------------------------------------------
 
 
+class _ClassQueue:
+    """
+    The classes that haven't been placed yet by `sort_classes`, as a linked list of class indices.
+
+    Each class also has a label that increases along the list, so the positions of two classes can be compared
+    without walking the list. When there's no room for a label between two classes, the labels around them are
+    spread out again (list labeling, see Bender et al. "Two Simplified Algorithms for Maintaining Order in a List").
+    """
+    LABEL_RANGE = 1 << 62
+
+    def __init__(self, count: int):
+        self.head = count  # Sentinels before the first & after the last class
+        self.tail = count + 1
+
+        # Classes start in their original order
+        order = [self.head, *range(count), self.tail]
+        self.next = [-1] * (count + 2)
+        self.previous = [-1] * (count + 2)
+        for previous, following in zip(order, order[1:]):
+            self.next[previous], self.previous[following] = following, previous
+
+        spacing = self.LABEL_RANGE // (count + 1)
+        self.labels = [(i + 1) * spacing for i in range(count)] + [0, self.LABEL_RANGE]
+
+    def is_empty(self) -> bool:
+        return self.next[self.head] == self.tail
+
+    def pop_first(self) -> int:
+        index = self.next[self.head]
+        self._unlink(index)
+        return index
+
+    def insert_after(self, node: int, index: int):
+        if self.labels[self.next[node]] - self.labels[node] < 2:
+            self._relabel(node)
+
+        following = self.next[node]
+        self.labels[index] = (self.labels[node] + self.labels[following]) // 2
+        self.next[node], self.previous[index], self.next[index], self.previous[following] = index, node, following, index
+
+    def _unlink(self, index: int):
+        previous, following = self.previous[index], self.next[index]
+        self.next[previous], self.previous[following] = following, previous
+
+    def _relabel(self, node: int):
+        """ Spread out the labels after node, over the smallest range that has enough room """
+        labels = self.labels
+        start_label = labels[node]
+
+        count, end = 1, self.next[node]
+        while end != self.tail and labels[end] - start_label <= count * count:
+            end = self.next[end]
+            count += 1
+
+        if end == self.tail:
+            node, start_label = self.head, 0
+            count, current = 1, self.next[self.head]
+            while current != self.tail:
+                current = self.next[current]
+                count += 1
+
+        spacing = (labels[end] - start_label) // count
+        current = self.next[node]
+        for i in range(1, count):
+            labels[current] = start_label + i * spacing
+            current = self.next[current]
+
+
 def sort_classes(classes: list[StubClass]) -> list[StubClass]:
     """ 
-    Sort classes based on their parent class
-    If a class has another class as their parent class, it'll be placed later in the list
+    Sort classes based on their requirements (e.g. parent classes)
+    If a class requires another class, it'll be placed later in the list.
+
+    Gives the same order as going through the list and moving each class that comes before one of its requirements
+    to after the class following its last requirement, then looking at the same position again. The remaining classes
+    are kept in a linked list, so moving a class & finding its last requirement don't depend on the number of classes.
+
+    Raises: ValueError if the classes have circular requirements
     """
-    class_names = [x.name for x in classes]
+    class_indices = {x.name: i for i, x in enumerate(classes)}
+
+    # Requirements are only collected once per class
+    requirements = [
+        [required_index for x in stub_class.requirements if (required_index := class_indices.get(x)) is not None and required_index != index]
+        for index, stub_class in enumerate(classes)
+    ]
 
-    i = 0
-    while i < len(classes):
-        # Check if class has any required classes that needs to be defined before it (aka. parent classes)
-        requirements = classes[i].get_requirements()
-        if requirements:
-            # Get the required class that has the highest index in the list
-            required_indices = [class_names.index(x) for x in requirements if x in class_names]
-            required_max_index = max(required_indices) if required_indices else -1
+    _raise_on_circular_requirements(classes, requirements)
 
-            # If current index is lower than the highest required index, move current index to be just below the required one.
-            if required_max_index > i:
-                classes.insert(required_max_index + 1, classes.pop(i))
-                class_names.insert(required_max_index + 1, class_names.pop(i))
-                i -= 1  # Because we moved current index away, re-iterate over the same index once more.
+    queue = _ClassQueue(len(classes))
+    placed = [False] * len(classes)
+    sorted_classes: list[StubClass] = []
+    while not queue.is_empty():
+        index = queue.pop_first()
 
-        i += 1
+        # Move the class after the class following its last requirement that hasn't been placed yet
+        waiting_for = [x for x in requirements[index] if not placed[x]]
+        if waiting_for:
+            last_requirement = max(waiting_for, key=lambda x: queue.labels[x])
+            following = queue.next[last_requirement]
+            queue.insert_after(last_requirement if following == queue.tail else following, index)
+            continue
 
-    return classes
+        placed[index] = True
+        sorted_classes.append(classes[index])
+
+    return sorted_classes
+
+
+def _raise_on_circular_requirements(classes: list[StubClass], requirements: list[list[int]]):
+    """ Raises: ValueError listing the classes involved if the requirements contain a cycle """
+    dependants: list[list[int]] = [[] for _ in classes]
+    requirement_counts = [len(x) for x in requirements]
+    for index, class_requirements in enumerate(requirements):
+        for required_index in class_requirements:
+            dependants[required_index].append(index)
+
+    ready = [i for i, count in enumerate(requirement_counts) if count == 0]
+    while ready:
+        for dependant_index in dependants[ready.pop()]:
+            requirement_counts[dependant_index] -= 1
+            if requirement_counts[dependant_index] == 0:
+                ready.append(dependant_index)
+
+    if any(requirement_counts):
+        cyclic_classes = [classes[i].name for i, count in enumerate(requirement_counts) if count > 0]
+        raise ValueError(f"Classes have circular requirements and can't be sorted: {', '.join(cyclic_classes)}")
 
 
 # ---------------------------------------------------------------------------------
@@ -66,11 +173,16 @@ class StubGenerator:
         self,
         module: ModuleType,
         flags: GeneratorFlag,
-        plugins: list[type[plugins.PluginBaseClass]] | None = DEFAULT_PLUGINS
+        plugins: list[type[plugins.PluginBaseClass]] | None = DEFAULT_PLUGINS,
+        version: int | None = None,
+        jobs: int | None = None,
+        profile: ModuleProfile | None = None
     ):
         self.flags = flags
         self.module = module
-        self.version = get_motionbuilder_version()
+        self.version = version or get_motionbuilder_version()
+        self.jobs = jobs
+        self.profile = profile if profile is not None else ModuleProfile(module.__name__)
 
         self.plugins = plugins or []
         self.plugins.sort(key=lambda x: x.PRIORITY)
@@ -79,53 +191,124 @@ class StubGenerator:
     #                      Internal
     # ---------------------------------------------------
 
-    def generate_string(self) -> str:
+    def generate_stubs(self) -> native_generator.ModuleStubs:
         """
-        Returns: The stub file as a string
+        Returns: The enums, classes & functions of the module after all plugins have patched them
         """
         # Get the content
-        enums, classes, function_groups = native_generator.generate_module_stubs(self.module)
+        with self.profile.stage("native_introspection"):
+            enums, classes, function_groups = native_generator.generate_module_stubs(self.module)
+
+        self.profile.set_counter("enums", len(enums))
+        self.profile.set_counter("classes", len(classes))
+        self.profile.set_counter("function_groups", len(function_groups))
+        self.profile.set_counter("methods", sum(len(x) for stub_class in classes for x in stub_class.stub_functions))
+        self.profile.set_counter("properties", sum(len(x.stub_properties) for x in classes + enums))
 
         # Run all of the plugins
-        for plugin_cls in self.plugins:
-            plugin = plugin_cls(self.version, self.module, enums, classes, function_groups, self.flags)
-            plugin.run()
+        index = StubIndex.build(enums, classes, function_groups)
+        if self.flags & (GeneratorFlag.CONCURRENT_PLUGINS | GeneratorFlag.VERIFY_PLUGINS):
+            def _run_plugin(plugin_cls: type[plugins.PluginBaseClass]):
+                with self.profile.stage(f"plugin: {plugin_cls.__name__}"):
+                    plugin_cls(self.version, self.module, enums, classes, function_groups, self.flags, jobs=self.jobs, profile=self.profile, index=index).run()
+
+            with self.profile.stage("plugins"):
+                verify = bool(self.flags & GeneratorFlag.VERIFY_PLUGINS)
+                scheduler = plugin_scheduler.PluginScheduler(self.plugins, enums, classes, function_groups, jobs=self.jobs, verify=verify)
+                scheduler.run(_run_plugin)
+        elif self.flags & GeneratorFlag.FUSE_PLUGINS:
+            for tier in plugin_tiers.group_by_priority(self.plugins):
+                with self.profile.stage(f"plugins: {', '.join(x.__name__ for x in tier)}"):
+                    tier_plugins = [x(self.version, self.module, enums, classes, function_groups, self.flags, jobs=self.jobs, profile=self.profile, index=index) for x in tier]
+                    plugin_tiers.run_tier(tier_plugins, enums, classes, function_groups)
+        else:
+            for plugin_cls in self.plugins:
+                with self.profile.stage(f"plugin: {plugin_cls.__name__}"):
+                    plugin = plugin_cls(self.version, self.module, enums, classes, function_groups, self.flags, jobs=self.jobs, profile=self.profile, index=index)
+                    plugin.run()
 
         # Sort classes after all patches are done and we know their requirements
-        classes = sort_classes(classes)
+        with self.profile.stage("sort_classes"):
+            classes = sort_classes(classes)
+
+        return native_generator.ModuleStubs(enums=enums, classes=classes, function_groups=function_groups)
+
+    def write(self, stream: typing.TextIO):
+        """
+        Write the stub file to a stream, e.g. an open file
+        """
+        enums, classes, function_groups = self.generate_stubs()
+
+        with self.profile.stage("render"):
+            self._write_stubs(stream, enums, classes, function_groups)
 
-        # Generate a string
-        stub_content = base_content.get_base_content(self.module)  # Read the custom additions file first
-        stub_content += "\n".join([x.as_string() for x in enums])
-        stub_content += "\n"
-        stub_content += "\n".join([x.as_string() for x in classes])
-        stub_content += "\n"
+    def _write_stubs(self, stream: typing.TextIO, enums: list[StubClass], classes: list[StubClass], function_groups: list[list[StubFunction]]):
+        stream.write(base_content.get_base_content(self.module, self.version))  # Write the custom additions file first
+        self.write_stubs(stream, enums, classes, function_groups)
+
+    @staticmethod
+    def write_stubs(stream: typing.TextIO, enums: list[StubClass], classes: list[StubClass], function_groups: list[list[StubFunction]]):
+        """
+        Write the enums, classes & functions as python code to a stream.
+        Each of them is rendered into its own short-lived buffer, so the text of the whole file is never held in memory.
+        """
+        for index, stub_enum in enumerate(enums):
+            if index:
+                stream.write("\n")
+            stub_enum.write_to(stream)
+        stream.write("\n")
+
+        for index, stub_class in enumerate(classes):
+            if index:
+                stream.write("\n")
+            stub_class.write_to(stream)
+        stream.write("\n")
 
         for function_group in function_groups:
             overload = len(function_group) > 1  # If there are multiple functions with the same name, add @overload
-            stub_content += "\n".join([x.as_string(overload) for x in function_group])
-            stub_content += "\n"
-
-        stub_content = stub_content.replace("    ", "\t")  # Make sure tabs are used
+            for index, stub_function in enumerate(function_group):
+                if index:
+                    stream.write("\n")
+                stub_function.write_to(stream, is_overload=overload)
+            stream.write("\n")
 
-        stub_content += "\n"
+        stream.write("\n")
 
-        return stub_content
+    def generate_string(self) -> str:
+        """
+        Returns: The stub file as a string
+        """
+        stream = io.StringIO()
+        self.write(stream)
+        return stream.getvalue()
 
 
-def generate_stub_file(module: ModuleType, directory_str: str, flags: GeneratorFlag) -> str:
+def generate_stub_file(module: ModuleType,
+                       directory_str: str,
+                       flags: GeneratorFlag,
+                       version: int | None = None,
+                       jobs: int | None = None,
+                       profile: ModuleProfile | None = None) -> str:
     print(f"Generating stub file for module: {module.__name__}")
 
     start_time = time.time()
 
-    generator = StubGenerator(module, flags)
-    file_content = generator.generate_string()
+    generator = StubGenerator(module, flags, version=version, jobs=jobs, profile=profile)
 
     directory = Path(directory_str)
 
     directory.mkdir(parents=True, exist_ok=True)
     filepath = directory / f"{module.__name__}.pyi"
-    filepath.write_text(file_content)
+
+    # Write to a temporary file first, so a failed run doesn't leave a half written stub file behind
+    temp_filepath = filepath.with_suffix(".pyi.tmp")
+    try:
+        with temp_filepath.open("w") as file:
+            generator.write(file)
+    except BaseException:
+        temp_filepath.unlink(missing_ok=True)
+        raise
+    temp_filepath.replace(filepath)
 
     elapsed_time = time.time() - start_time
 
@@ -0,0 +1,8 @@
+var namespacepyfbsdk =
+[
+    [ "FBProfileTimeEvent", "classpyfbsdk_1_1_f_b_profile_time_event.html", null ],
+    [ "FBPropertyBool", "classpyfbsdk_1_1_f_b_property_bool.html", null ],
+    [ "FBPropertyBoolAlias", "classpyfbsdk_1_1_f_b_property_bool.html#a4717", null ],
+    [ "CloseTool", "namespacepyfbsdk.html#a9646", null ],
+    [ "CloseToolByName", "namespacepyfbsdk.html#a9647", null ]
+];
@@ -0,0 +1,72 @@
+"""
+A local stand-in for the online documentation, serving recorded pages over HTTP.
+
+Point `Documentation(..., base_url=server.base_url)` to it to fetch & parse pages without network access.
+"""
+from __future__ import annotations
+
+import functools
+import threading
+
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+DATA_DIRECTORY = Path(__file__).parent / "data" / "documentation"
+
+
+class RecordedDocumentationServer:
+    """ Serves the recorded pages in `directory` on localhost, e.g. `{directory}/2027/namespacepyfbsdk.js` """
+
+    def __init__(self, directory: str | Path = DATA_DIRECTORY) -> None:
+        self.directory = Path(directory)
+
+        self.requested_paths: list[str] = []  # The path of each request, in the order they were received
+        self._lock = threading.Lock()
+
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """ The root url of the documentation, with `{version}` to be replaced by the version """
+        assert self._server is not None, "The server is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{{version}}/"
+
+    def get_request_count(self, path: str) -> int:
+        with self._lock:
+            return self.requested_paths.count(path)
+
+    def start(self):
+        server = self
+
+        class _Handler(SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep the connections alive, like the real documentation server
+
+            def do_GET(self):
+                with server._lock:
+                    server.requested_paths.append(self.path)
+                super().do_GET()
+
+            def log_message(self, format, *args):
+                pass
+
+        handler = functools.partial(_Handler, directory=str(self.directory))
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="RecordedDocumentationServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> RecordedDocumentationServer:
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,98 @@
+"""
+Fetch & parse the documentation through a local server serving recorded pages, see `documentation_server.py`.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import threading
+import unittest
+
+from src.plugins.online_documentation.documentation_scraper import Documentation
+
+from .documentation_server import RecordedDocumentationServer
+
+
+VERSION = 2027
+PROFILE_TIME_EVENT_PATH = f"/{VERSION}/classpyfbsdk_1_1_f_b_profile_time_event.html"
+PROPERTY_BOOL_PATH = f"/{VERSION}/classpyfbsdk_1_1_f_b_property_bool.html"
+
+
+class TestDocumentation(unittest.TestCase):
+    def setUp(self):
+        self.server = RecordedDocumentationServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        self.documentation = Documentation("pyfbsdk", VERSION, pool_size=4, base_url=self.server.base_url)
+        self.addCleanup(self.documentation.close)
+
+    def prefetch(self, names: list[str]) -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.documentation.prefetch(names)
+
+    def test_table_of_contents(self):
+        self.assertEqual(set(self.documentation.table_of_contents), {"FBProfileTimeEvent", "FBPropertyBool", "FBPropertyBoolAlias", "CloseTool", "CloseToolByName"})
+
+    def test_prefetch_and_parse_page(self):
+        # The two FBPropertyBool names are on the same page, which is only downloaded once
+        self.assertEqual(self.prefetch(["FBProfileTimeEvent", "FBPropertyBool", "FBPropertyBoolAlias"]), 2)
+
+        parsed_page = self.documentation.parse_page("FBProfileTimeEvent")
+        assert parsed_page is not None
+        self.assertIn("Time event information is collected during sampling", parsed_page.description)
+        self.assertEqual([x.name for x in parsed_page.members],
+                         ["GetColor", "GetComment", "GetThreadID", "GetTime", "GetTypeName", "IsSingleEvent"])
+
+        color_member = parsed_page.find_member_by_name("GetColor")
+        assert color_member is not None
+        self.assertEqual(color_member.doc_string.strip(), "Get the color assigned to the event.")
+
+        # The page was parsed from the prefetched html, without downloading it again
+        self.assertEqual(self.server.get_request_count(PROFILE_TIME_EVENT_PATH), 1)
+
+    def test_prefetched_pages_are_released(self):
+        self.prefetch(["FBProfileTimeEvent", "FBPropertyBool", "FBPropertyBoolAlias"])
+
+        self.documentation.parse_page("FBProfileTimeEvent")
+        self.documentation.parse_page("FBPropertyBool")
+        self.assertEqual(len(self.documentation.pages), 1)  # Still needed by FBPropertyBoolAlias
+
+        self.documentation.parse_page("FBPropertyBoolAlias")
+        self.assertEqual(self.documentation.pages, {})
+        self.assertEqual(self.server.get_request_count(PROPERTY_BOOL_PATH), 1)
+
+        # All functions are documented on the same page, which the plugin only parses for the first function
+        function_names = ["CloseTool", "CloseToolByName"]
+        self.prefetch(function_names)
+
+        function_page = self.documentation.parse_page(function_names[0])
+        assert function_page is not None
+        self.assertEqual([x.name for x in function_page.members], function_names)
+        self.assertEqual(len(self.documentation.pages), 1)
+
+        for name in function_names:
+            self.documentation.release_page(name)
+        self.assertEqual(self.documentation.pages, {})
+
+    def test_parse_page_without_prefetch(self):
+        parsed_page = self.documentation.parse_page("FBPropertyBool")
+        assert parsed_page is not None
+        self.assertEqual([x.name for x in parsed_page.members], ["Data"])
+
+        self.assertIsNone(self.documentation.parse_page("FBNotDocumented"))
+
+    def test_session_per_thread(self):
+        client = self.documentation.http_client
+        sessions = []
+
+        thread = threading.Thread(target=lambda: sessions.append(client.session))
+        thread.start()
+        thread.join()
+
+        self.assertIs(client.session, client.session)
+        self.assertIsNot(sessions[0], client.session)
+
+
+if __name__ == "__main__":
+    unittest.main()
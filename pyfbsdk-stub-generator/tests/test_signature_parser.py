@@ -0,0 +1,56 @@
+"""
+Parse Boost.Python signatures, the comma-splitting fast path must give the same result as the tokenizer.
+"""
+from __future__ import annotations
+
+import unittest
+
+from src import signature_parser
+from src.signature_parser import OPTIONAL_DEFAULT_VALUE, ParsedParameter
+
+
+class TestSignatureParser(unittest.TestCase):
+    def test_parse_signature_line(self):
+        signature = signature_parser.parse_signature_line("ShowToolByName( (str)arg1 [, (object)arg2 [, (int)arg3]]) -> object :")
+        self.assertEqual(signature.return_type, "object")
+        self.assertEqual(signature.parameters, (
+            ParsedParameter("arg1", "str", None),
+            ParsedParameter("arg2", "object", OPTIONAL_DEFAULT_VALUE),
+            ParsedParameter("arg3", "int", OPTIONAL_DEFAULT_VALUE),
+        ))
+
+    def test_nested_types(self):
+        parameters = signature_parser.parse_parameters("(FBVector3d)arg1, (tuple(float, float))arg2 [, (list)arg3]")
+        self.assertEqual(parameters, (
+            ParsedParameter("arg1", "FBVector3d", None),
+            ParsedParameter("arg2", "tuple(float, float)", None),
+            ParsedParameter("arg3", "list", OPTIONAL_DEFAULT_VALUE),
+        ))
+
+    def test_fast_path_matches_tokenizer(self):
+        texts = [
+            "",
+            "(str)arg1",
+            " (str)arg1 [, (object)arg2 [, (int)arg3]]",
+            "(int)x [, (int)y], (int)z",
+            "[(int)x]",
+            "(int) spaced name , other",
+            "(unclosed arg",
+            "(a)b)c",
+            "\t(int)x",
+            "(tuple(float, float))arg1",
+        ]
+        for text in texts:
+            parameters = signature_parser._parse_simple_parameters(text)
+            if parameters is not None:
+                self.assertEqual(parameters, signature_parser._tokenize_parameters(text), text)
+
+    def test_parse_docstring(self):
+        docstring = "Add( (FBComponent)arg1, (str)arg2) -> None :\n\n    C++ signature :\n        void Add(FBComponent_Wrapper {lvalue},char const*)"
+        signatures = signature_parser.parse_docstring("Add", docstring)
+        self.assertEqual(len(signatures), 1)
+        self.assertEqual([x.name for x in signatures[0].parameters], ["arg1", "arg2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
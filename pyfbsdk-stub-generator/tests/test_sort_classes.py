@@ -0,0 +1,101 @@
+"""
+Sort the classes by their requirements, the order must stay the same as the one the previous (quadratic) implementation
+of `sort_classes` gave, which is kept below for reference.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+
+from src.module_types import StubClass
+
+if "pyfbsdk" not in sys.modules:
+    from benchmarks import synthetic_module
+    synthetic_module.install_synthetic_module(0.05)
+
+from src import native_generator, stub_generator
+
+
+def sort_classes_legacy(classes: list[StubClass]) -> list[StubClass]:
+    """ The previous implementation of `stub_generator.sort_classes` """
+    classes = list(classes)
+    class_names = [x.name for x in classes]
+
+    i = 0
+    while i < len(classes):
+        requirements = classes[i].get_requirements()
+        if requirements:
+            required_indices = [class_names.index(x) for x in requirements if x in class_names]
+            required_max_index = max(required_indices) if required_indices else -1
+
+            if required_max_index > i:
+                classes.insert(required_max_index + 1, classes.pop(i))
+                class_names.insert(required_max_index + 1, class_names.pop(i))
+                i -= 1
+
+        i += 1
+
+    return classes
+
+
+def create_classes(parents: dict[str, list[str]]) -> list[StubClass]:
+    """ Create the classes in the order of `parents`, which maps each class name to the names of its parents """
+    classes = []
+    for name, class_parents in parents.items():
+        stub_class = StubClass(None, name)
+        for parent in class_parents:
+            stub_class.add_parent(parent)
+        classes.append(stub_class)
+    return classes
+
+
+def get_names(classes: list[StubClass]) -> list[str]:
+    return [x.name for x in classes]
+
+
+class TestSortClasses(unittest.TestCase):
+    def assertSameOrderAsLegacy(self, classes: list[StubClass]):
+        self.assertEqual(get_names(stub_generator.sort_classes(classes)), get_names(sort_classes_legacy(classes)))
+
+    def test_shared_and_chained_requirements(self):
+        classes = create_classes({
+            "FBActionManager": ["FBComponent"],
+            "FBBox": ["FBComponent"],
+            "FBCamera": ["FBModel"],
+            "FBComponent": ["FBPlug"],
+            "FBModel": ["FBBox"],
+            "FBPlug": ["object"],
+            "FBProperty": ["FBPlug"],
+            "FBPropertyAnimatable": ["FBProperty", "FBBox"],
+            "FBVector3d": [],
+        })
+        # A class that has to wait is placed after the class following its last requirement
+        self.assertEqual(get_names(stub_generator.sort_classes(classes)), [
+            "FBPlug", "FBProperty", "FBComponent", "FBActionManager", "FBBox", "FBVector3d", "FBPropertyAnimatable", "FBModel", "FBCamera",
+        ])
+        self.assertSameOrderAsLegacy(classes)
+
+    def test_random_requirements(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            names = [f"FBClass{i}" for i in range(rng.randint(0, 30))]
+            declaration_order = rng.sample(names, len(names))  # Classes may only require classes declared before them
+            parents = {
+                name: rng.sample(declaration_order[:index], min(index, rng.randint(0, 3)))
+                for index, name in enumerate(declaration_order)
+            }
+            self.assertSameOrderAsLegacy(create_classes({x: parents[x] for x in names}))
+
+    def test_module(self):
+        classes = native_generator.generate_module_stubs(sys.modules["pyfbsdk"]).classes
+        self.assertSameOrderAsLegacy(classes)
+
+    def test_circular_requirements(self):
+        classes = create_classes({"FBA": ["FBB"], "FBB": ["FBA"], "FBC": []})
+        with self.assertRaises(ValueError):
+            stub_generator.sort_classes(classes)
+
+
+if __name__ == "__main__":
+    unittest.main()